@@ -58,6 +58,7 @@ setup(
         'Programming Language :: Python :: 3.6',
     ],
     install_requires=required,
+    extras_require={'analysis': ['numpy']},
     platforms=['any'],
     python_requires=">=3.3",
 )
@@ -13,11 +13,23 @@ From Max17055 Software Implementation Guide p12:
     # VEmpty = 0xa561
     # RCOMP0 = 0x004d
     # TempCo = 0x223e
+
+The gauge updates its registers every 175.8 ms when active, but much less frequently when hibernating. A sample is
+reused until the gauge's update period has elapsed - there is no newer data to be read.
+
+In alert mode, the gauge Status and Current registers are read on each sample. Full telemetry is read only when an
+alert has fired, when input power has been gained or lost, or when the background interval has elapsed - otherwise the
+previous sample is returned.
 """
 
+import time
+
 from abc import ABC, abstractmethod
 
+from scs_core.sys.logging import Logging
+
 from scs_psu.batt_pack.fuel_gauge.max17055.max17055 import Max17055
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_config import Max17055Config
 from scs_psu.batt_pack.fuel_gauge.max17055.max17055_params import Max17055Params
 
 
@@ -28,6 +40,12 @@ class BattPack(ABC):
     classdocs
     """
 
+    __CHRG_V_4_2 =              4.2             # V
+    __CHRG_V_4_4 =              4.4             # V
+    __OVER_VOLTAGE_MARGIN =     0.1             # V
+
+    # ----------------------------------------------------------------------------------------------------------------
+
     @staticmethod
     @abstractmethod
     def name():
@@ -60,9 +78,9 @@ class BattPack(ABC):
 
 
     @classmethod
-    def construct(cls):
+    def construct(cls, bus=None):
         conf = cls.gauge_conf()
-        gauge = Max17055(conf)
+        gauge = Max17055(conf, bus=bus)
 
         return cls(gauge)
 
@@ -75,14 +93,27 @@ class BattPack(ABC):
         """
         self.__gauge = gauge
 
+        self.__background_interval = None                       # float         seconds, or None if not alert mode
+        self.__next_background_sample = None                    # float         monotonic seconds
+
+        self.__next_update = None                               # float         monotonic seconds
+        self.__last_sample = None                               # BattStatus
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def initialise(self, host, force_config=False):
+        snapshot = None
+
         try:
-            if not self.__gauge.read_power_on_reset() and not force_config:
+            por = self.__gauge.read_power_on_reset()
+
+            if not por and not force_config:
                 return None
 
+            if por:
+                snapshot = self.__por_snapshot()                           # the state of the gauge on PoR
+
             params = Max17055Params.load(host)
 
             if params is None:
@@ -92,8 +123,30 @@ class BattPack(ABC):
             self.__gauge.write_params(params)
             self.__gauge.clear_power_on_reset()
 
-            return params
+        except OSError:
+            return None
+
+        # best-effort: a failed save must not undo the restore...
+        if snapshot is not None:
+            try:
+                snapshot.save(host)
+            except Exception as ex:
+                Logging.getLogger().error("initialise: snapshot not saved: %s" % repr(ex))
+
+        return params
+
+
+    def __por_snapshot(self):
+        try:
+            return self.__gauge.read_snapshot()
+        except Exception as ex:
+            Logging.getLogger().error("initialise: snapshot not read: %s" % repr(ex))
+            return None
+
 
+    def snapshot(self):
+        try:
+            return self.__gauge.read_snapshot()
         except OSError:
             return None
 
@@ -115,23 +168,137 @@ class BattPack(ABC):
 
 
     def sample(self):
+        if self.__background_interval is not None:
+            return self.__alert_mode_sample()
+
+        now = time.monotonic()
+
+        if self.__last_sample is not None and now < self.__next_update:
+            return self.__last_sample                           # the gauge has not updated since
+
+        try:
+            sample = self.__gauge.sample()
+            self.__next_update = now + self.update_period(sample)
+
+        except OSError:
+            return None
+
+        self.__last_sample = sample
+
+        return sample
+
+
+    def telemetry(self, reset_extremes=False):
+        try:
+            return self.__gauge.read_telemetry(reset_extremes=reset_extremes)
+        except OSError:
+            return None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def hibernate_policy(self):
+        try:
+            return self.__gauge.read_hibernate_policy()
+        except OSError:
+            return None
+
+
+    def set_hibernate_policy(self, policy):
+        try:
+            self.__gauge.write_hibernate_policy(policy)
+
+        except (OSError, RuntimeError):
+            return False
+
+        self.__next_update = None
+        self.__last_sample = None
+
+        return True
+
+
+    def update_period(self, sample=None):
+        current = None if sample is None else sample.current
+        policy = self.__gauge.read_hibernate_policy()                   # cached by the gauge
+
+        return policy.update_period(current, self.gauge_conf().des_cap)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def program_alerts(self):
+        conf = self.gauge_conf()
+
+        chrg_v = self.__CHRG_V_4_4 if conf.chrg_v == Max17055Config.CHRG_V_4_4_OR_4_35 else self.__CHRG_V_4_2
+
+        try:
+            self.__gauge.program_alerts(v_min=conf.empty_v_target, v_max=chrg_v + self.__OVER_VOLTAGE_MARGIN,
+                                        soc_min=self.charge_min())
+            return True
+
+        except (OSError, RuntimeError):
+            return False
+
+
+    def read_alerts(self):
         try:
-            return self.__gauge.sample()
+            return self.__gauge.read_alerts()
         except OSError:
             return None
 
 
+    def set_alert_mode(self, background_interval):
+        self.__background_interval = background_interval
+        self.__next_background_sample = None
+        self.__last_sample = None
+
+
+    @property
+    def alert_mode(self):
+        return self.__background_interval is not None
+
+
+    def __alert_mode_sample(self):
+        try:
+            alerts = self.__gauge.read_alerts()
+            input_power_present = self.__gauge.input_power_present()    # not covered by the alerts
+            now = time.monotonic()
+
+            if self.__last_sample is not None and not alerts.fired and now < self.__next_background_sample and \
+                    input_power_present == self.__last_sample.input_power_present:
+                return self.__last_sample
+
+            sample = self.__gauge.sample()
+
+            if alerts.fired:
+                self.__gauge.clear_alerts(alerts)
+
+        except OSError:
+            return None
+
+        self.__last_sample = sample
+        self.__next_background_sample = now + self.__background_interval
+
+        return sample
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
     def cycles(self):
         try:
-            return self.__gauge.read_learned_params().cycles
+            return self.__gauge.read_raw_cycles()
         except OSError:
             return None
 
 
+    @property
+    def last_sample(self):
+        return self.__last_sample                               # no I2C traffic
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return self.__class__.__name__ + ":{gauge:%s}" %  self.__gauge
+        return self.__class__.__name__ + ":{gauge:%s, background_interval:%s}" %  \
+               (self.__gauge, self.__background_interval)
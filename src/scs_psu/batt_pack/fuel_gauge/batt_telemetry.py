@@ -0,0 +1,171 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+An extended fuel gauge snapshot: power, die temperature, and the extremes of temperature, voltage and current that
+the gauge has latched since the extremes were last reset.
+
+Document example:
+{"pwr": -1804.0, "pwr-avg": -1796.8, "die-tmp": 31.5, "tmp": {"min": 24, "max": 27},
+"v": {"min": 3.62, "max": 3.78}, "curr": {"min": -520, "max": 40}}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.datum import Datum
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BattTelemetry(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        power = jdict.get('pwr')
+        power_avg = jdict.get('pwr-avg')
+        die_temperature = jdict.get('die-tmp')
+
+        temperature = Extremes.construct_from_jdict(jdict.get('tmp'))
+        v = Extremes.construct_from_jdict(jdict.get('v'))
+        current = Extremes.construct_from_jdict(jdict.get('curr'))
+
+        return cls(power, power_avg, die_temperature, temperature, v, current)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, power, power_avg, die_temperature, temperature, v, current):
+        """
+        Constructor
+        """
+        self.__power = Datum.float(power, 1)                    # float         mW
+        self.__power_avg = Datum.float(power_avg, 1)            # float         mW
+        self.__die_temperature = Datum.float(die_temperature, 1)   # float    °C
+
+        self.__temperature = temperature                        # Extremes      °C
+        self.__v = v                                            # Extremes      V
+        self.__current = current                                # Extremes      mA
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['pwr'] = self.power
+        jdict['pwr-avg'] = self.power_avg
+        jdict['die-tmp'] = self.die_temperature
+
+        jdict['tmp'] = self.temperature
+        jdict['v'] = self.v
+        jdict['curr'] = self.current
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def power(self):
+        return self.__power
+
+
+    @property
+    def power_avg(self):
+        return self.__power_avg
+
+
+    @property
+    def die_temperature(self):
+        return self.__die_temperature
+
+
+    @property
+    def temperature(self):
+        return self.__temperature
+
+
+    @property
+    def v(self):
+        return self.__v
+
+
+    @property
+    def current(self):
+        return self.__current
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BattTelemetry:{power:%s, power_avg:%s, die_temperature:%s, temperature:%s, v:%s, current:%s}" % \
+               (self.power, self.power_avg, self.die_temperature, self.temperature, self.v, self.current)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Extremes(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        minimum = jdict.get('min')
+        maximum = jdict.get('max')
+
+        return cls(minimum, maximum)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, minimum, maximum):
+        """
+        Constructor
+        """
+        self.__minimum = minimum                                    # number
+        self.__maximum = maximum                                    # number
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['min'] = self.minimum
+        jdict['max'] = self.maximum
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def minimum(self):
+        return self.__minimum
+
+
+    @property
+    def maximum(self):
+        return self.__maximum
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "Extremes:{minimum:%s, maximum:%s}" %  (self.minimum, self.maximum)
@@ -20,13 +20,19 @@ from scs_core.data.datetime import LocalizedDatetime
 from scs_core.data.datum import Decode
 from scs_core.data.timedelta import Timedelta
 
-from scs_host.bus.i2c import I2C
-from scs_host.lock.lock import Lock
-
 from scs_psu.batt_pack.fuel_gauge.batt_status import BattStatus, ChargeLevel
+from scs_psu.batt_pack.fuel_gauge.batt_telemetry import BattTelemetry, Extremes
+from scs_psu.bus.i2c_bus import HostI2CBus
+from scs_psu.bus.i2c_timing import I2CTiming
 
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_alerts import Max17055Alerts
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_completion import Max17055Completion
 from scs_psu.batt_pack.fuel_gauge.max17055.max17055_config import Max17055Config
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_hibernate_policy import Max17055HibernatePolicy
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_lock import Max17055Lock
 from scs_psu.batt_pack.fuel_gauge.max17055.max17055_params import Max17055Params
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_register_cache import Max17055RegisterCache
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_snapshot import Max17055Snapshot
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -40,9 +46,13 @@ class Max17055(object):
 
     __ADDR =                    0x36
 
-    __LOCK_TIMEOUT =            1.0             # seconds
+    __LOCK_TIMEOUT =            1.0             # seconds - shared for snapshots, exclusive for configuration
+
+    __BUS_FREE_TIME =           5               # microseconds - tBUF is 4.7 us in standard mode
+    __WRITE_SETTLE_TIME =       1000            # microseconds - between a write and its verify read (UG6365)
 
-    __REG_CHECK_NUM_RETRIES =   20              # tenths of a second
+    __SETTLE_MODEL_UPDATES =    2               # model updates of 175.8 ms
+    __SETTLE_TIME =             0.350           # seconds - the settle is never longer than this
 
     __REG_STATUS =              0x00
     __REG_ALERT_VOLT =          0x01
@@ -66,6 +76,7 @@ class Max17055(object):
     __REG_MAX_MIN_TEMP =        0x1a
     __REG_MAX_MIN_VOLT =        0x1b            # Voltage
     __REG_MAX_MIN_CURRENT =     0x1c
+    __REG_CONFIG =              0x1d
     __REG_I_CHRG_TERM =         0x1e
     __REG_CAP_AVG =             0x1f
 
@@ -77,6 +88,7 @@ class Max17055(object):
     __REG_R_COMP_0 =            0x38
     __REG_TEMP_CO =             0x39
     __REG_FSTAT =               0x3d
+    __REG_TIMER =               0x3e            # LSB 175.8 ms - advanced with each model update
     __REG_V_EMPTY =             0x3a
 
     __REG_D_Q_ACC =             0x45
@@ -91,6 +103,24 @@ class Max17055(object):
 
     __REG_MODEL_CFG =           0xdb
 
+    __CONFIG_AEN =              0x0004          # alert output enable
+    __CONFIG_STICKY =           0x7800          # SS, TS, VS, IS - alerts are held until cleared
+
+    __STATUS_POR =              0x0002          # power-on reset - all cached registers are stale
+
+    __ALERT_VOLT_LSB =          0.02            # V - also MaxMinVolt
+
+    __SNAPSHOT_BLOCK =          16              # registers per block read (32 bytes)
+
+    __MAX_MIN_VOLT_RESET =      0x00ff
+    __MAX_MIN_SIGNED_RESET =    0x807f          # MaxMinTemp, MaxMinCurr
+
+    __CACHE_TTLS = {                            # seconds, or None for "until invalidated"
+        __REG_CYCLES:           60.0,
+        __REG_DEV_NAME:         None,
+        __REG_HIB_CFG:          60.0            # may be written by another process
+    }
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
@@ -99,13 +129,31 @@ class Max17055(object):
         return cls.__PARAM_SAVE_INTERVAL
 
 
+    @classmethod
+    def default_cache_ttls(cls):
+        return dict(cls.__CACHE_TTLS)
+
+
+    @classmethod
+    def default_timing(cls):
+        return I2CTiming(cls.__BUS_FREE_TIME, write_settle=cls.__WRITE_SETTLE_TIME)
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, conf: Max17055Config):
+    def __init__(self, conf: Max17055Config, cache_ttls=None, bus=None, timing=None, lock=None):
         """
         Constructor
         """
         self.__conf = conf
+        self.__bus = HostI2CBus() if bus is None else bus               # I2CBus
+        self.__timing = self.default_timing() if timing is None else timing     # I2CTiming
+
+        self.__completion = Max17055Completion()
+        self.__lock = Max17055Lock() if lock is None else lock          # Max17055Lock
+
+        ttls = self.default_cache_ttls() if cache_ttls is None else cache_ttls
+        self.__cache = Max17055RegisterCache(ttls)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -116,28 +164,27 @@ class Max17055(object):
             self.clear_power_on_reset()
             return False                                        # configuration is not updated
 
+        self.obtain_lock()
+
         try:
-            self.obtain_lock()
+            self.__cache.invalidate()
+            self.__completion.clear()
 
             # wait for DNR to clear...
-            self.__wait_for_reg_value(self.__REG_FSTAT, 0x0001, 0)
+            self.__wait_for_reg_value('dnr', self.__REG_FSTAT, 0x0001, 0)
 
             # store hibernate configuration...
-            hib_cfg = self.__read_reg(self.__REG_HIB_CFG)
-
-            self.__write_reg(self.__REG_HIB_MODE, 0x90)
-            self.__write_reg(self.__REG_HIB_CFG, 0x00)
-            self.__write_reg(self.__REG_HIB_MODE, 0x00)
+            hib_cfg = self.__exit_hibernate()
 
             # set battery config...
-            des_cap = int(round(self.__conf.des_cap / self.__capacity_lsb()))
+            des_cap = int(round(self.__conf.des_cap / self.__conf.capacity_lsb))
             self.__write_reg(self.__REG_DESIGN_CAP, des_cap)
 
             dq_acc = int(round(des_cap / 32))
             self.__write_reg(self.__REG_D_Q_ACC, dq_acc)
 
             # termination charge...
-            chrg_therm = int(round(self.__conf.chrg_term / self.__current_lsb()))
+            chrg_therm = int(round(self.__conf.chrg_term / self.__conf.current_lsb))
             self.__write_reg(self.__REG_I_CHRG_TERM, chrg_therm)
 
             # Empty Voltage Target set in 10mV increments to bits 7-15,
@@ -157,7 +204,7 @@ class Max17055(object):
             self.__write_reg(self.__REG_MODEL_CFG, model_cfg)
 
             # wait for reload...
-            self.__wait_for_reg_value(self.__REG_MODEL_CFG, 0x8000, 0)
+            self.__wait_for_reg_value('model-refresh', self.__REG_MODEL_CFG, 0x8000, 0)
 
             # restore hibernate configuration...
             self.__write_reg(self.__REG_HIB_CFG, hib_cfg)
@@ -181,18 +228,17 @@ class Max17055(object):
             self.clear_power_on_reset()
             return False                                        # configuration is not updated
 
+        self.obtain_lock()
+
         try:
-            self.obtain_lock()
+            self.__cache.invalidate()
+            self.__completion.clear()
 
             # wait for DNR to clear...
-            self.__wait_for_reg_value(self.__REG_FSTAT, 0x0001, 0)
+            self.__wait_for_reg_value('dnr', self.__REG_FSTAT, 0x0001, 0)
 
             # store hibernate configuration...
-            hib_cfg = self.__read_reg(self.__REG_HIB_CFG)
-
-            self.__write_reg(self.__REG_HIB_MODE, 0x90)
-            self.__write_reg(self.__REG_HIB_CFG, 0x00)
-            self.__write_reg(self.__REG_HIB_MODE, 0x00)
+            hib_cfg = self.__exit_hibernate()
 
             conf = self.__conf
 
@@ -226,7 +272,7 @@ class Max17055(object):
             self.__write_reg(self.__REG_MODEL_CFG, model_cfg)
 
             # wait for reload...
-            self.__wait_for_reg_value(self.__REG_MODEL_CFG, model_cfg, 0)
+            self.__wait_for_reg_value('model-refresh', self.__REG_MODEL_CFG, model_cfg, 0)
 
             # restore hibernate configuration...
             self.__write_reg(self.__REG_HIB_CFG, hib_cfg)
@@ -245,66 +291,104 @@ class Max17055(object):
 
 
     def sample(self):
+        # two block reads cover every register used by BattStatus...
+        self.obtain_lock(exclusive=False)
+
         try:
-            self.obtain_lock()
+            regs = self.__read_block(self.__REG_REP_CAP, self.__REG_CURRENT_AVG)
+            regs.update(self.__read_block(self.__REG_FULL_CAP_REP, self.__REG_TTF))
+
+        finally:
+            self.release_lock()
+
+        # input power...
+        input_power_present = self.__current(regs[self.__REG_CURRENT]) >= 0.0
+
+        # charge...
+        percent = self.__charge_percent(regs[self.__REG_REP_SOC])
+        mah = self.__capacity(regs[self.__REG_REP_CAP])
 
-            # input power...
-            input_power_present = self.input_power_present()
+        charge = ChargeLevel(percent, mah)
 
-            # charge...
-            percent = self.read_charge_percent()
-            mah = self.read_charge_mah()
+        # datum...
+        tte = self.__time_delta(regs[self.__REG_TTE])
+        ttf = self.__time_delta(regs[self.__REG_TTF])
 
-            charge = ChargeLevel(percent, mah)
+        v = self.__voltage(regs[self.__REG_V_CELL])
+        current = self.__current(regs[self.__REG_CURRENT_AVG])
+        temperature = self.__temperature(regs[self.__REG_TEMP])
 
-            # datum...
-            tte = self.read_time_until_empty()
-            ttf = self.read_time_until_full()
+        capacity = self.__capacity(self.__int16(regs[self.__REG_CAP_AVG]))
+        cycles = self.__cycles(regs[self.__REG_CYCLES])
 
-            v = self.read_voltage()
-            current = self.read_current_avg()
-            temperature = self.read_temperature()
+        return BattStatus(input_power_present, charge, tte, ttf, v, current, temperature, capacity, cycles)
 
-            capacity = self.read_capacity_avg()
-            cycles = self.read_cycles()
 
-            return BattStatus(input_power_present, charge, tte, ttf, v, current, temperature, capacity, cycles)
+    def read_telemetry(self, reset_extremes=False):
+        self.obtain_lock(exclusive=reset_extremes)
+
+        try:
+            regs = self.__read_block(self.__REG_MAX_MIN_TEMP, self.__REG_MAX_MIN_CURRENT)
+            regs.update(self.__read_block(self.__REG_POWER, self.__REG_POWER_AVG))
+            regs[self.__REG_DIE_TEMP] = self.__read_reg(self.__REG_DIE_TEMP)
+
+            if reset_extremes:
+                self.__write_reg(self.__REG_MAX_MIN_TEMP, self.__MAX_MIN_SIGNED_RESET)
+                self.__write_reg(self.__REG_MAX_MIN_VOLT, self.__MAX_MIN_VOLT_RESET)
+                self.__write_reg(self.__REG_MAX_MIN_CURRENT, self.__MAX_MIN_SIGNED_RESET)
 
         finally:
             self.release_lock()
 
+        power = self.__power(regs[self.__REG_POWER])
+        power_avg = self.__power(regs[self.__REG_POWER_AVG])
+        die_temperature = self.__temperature(regs[self.__REG_DIE_TEMP])
 
-    # ----------------------------------------------------------------------------------------------------------------
+        # extremes: upper byte max, lower byte min...
+        temperature = self.__extremes(regs[self.__REG_MAX_MIN_TEMP], 1, True)
+        v = self.__extremes(regs[self.__REG_MAX_MIN_VOLT], self.__ALERT_VOLT_LSB, False)
+        current = self.__extremes(regs[self.__REG_MAX_MIN_CURRENT], self.__conf.alert_current_lsb, True)
 
-    def read_learned_params(self):
-        try:
-            self.obtain_lock()
+        return BattTelemetry(power, power_avg, die_temperature, temperature, v, current)
 
-            calibrated_on = LocalizedDatetime.now()
 
-            r_comp_0 = self.__read_reg(self.__REG_R_COMP_0)
-            temp_co = self.__read_reg(self.__REG_TEMP_CO)
-            full_cap_rep = self.__read_reg(self.__REG_FULL_CAP_REP)
-            full_cap_nom = self.__read_reg(self.__REG_FULL_CAP_NOM)
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def read_learned_params(self):
+        calibrated_on = LocalizedDatetime.now()
 
-            cycles = self.__read_reg(self.__REG_CYCLES)
+        self.obtain_lock(exclusive=False)
 
-            return Max17055Params(calibrated_on, r_comp_0, temp_co, full_cap_rep, full_cap_nom, cycles)
+        # the params are read together, so that they are consistent...
+        try:
+            regs = self.__read_regs(self.__REG_R_COMP_0, self.__REG_TEMP_CO, self.__REG_FULL_CAP_REP,
+                                    self.__REG_FULL_CAP_NOM, self.__REG_CYCLES, use_cache=False)
 
         finally:
             self.release_lock()
 
+        r_comp_0 = regs[self.__REG_R_COMP_0]
+        temp_co = regs[self.__REG_TEMP_CO]
+        full_cap_rep = regs[self.__REG_FULL_CAP_REP]
+        full_cap_nom = regs[self.__REG_FULL_CAP_NOM]
+
+        cycles = regs[self.__REG_CYCLES]
+
+        return Max17055Params(calibrated_on, r_comp_0, temp_co, full_cap_rep, full_cap_nom, cycles)
+
 
     def write_params(self, params: Max17055Params):
+        self.obtain_lock()
+
         try:
-            self.obtain_lock()
+            self.__completion.clear()
 
             # restore capacity...
             self.__write_and_verify_reg(self.__REG_R_COMP_0, params.r_comp_0)
             self.__write_and_verify_reg(self.__REG_TEMP_CO, params.temp_co)
             self.__write_and_verify_reg(self.__REG_FULL_CAP_NOM, params.full_cap_nom)
 
-            time.sleep(0.350)
+            self.__wait_for_model_updates('capacity-settle', self.__SETTLE_MODEL_UPDATES)
 
             # restore full cap...
             full_cap_nom = self.__read_reg(self.__REG_FULL_CAP_NOM)
@@ -322,7 +406,7 @@ class Max17055(object):
             # set dPacc to 200%
             self.__write_and_verify_reg(self.__REG_D_Q_ACC, 0x0c80)         # 3200
 
-            time.sleep(0.350)
+            self.__wait_for_model_updates('accumulator-settle', self.__SETTLE_MODEL_UPDATES)
 
             # restore cycles...
             self.__write_and_verify_reg(self.__REG_CYCLES, params.cycles)
@@ -335,15 +419,15 @@ class Max17055(object):
 
     def read_power_on_reset(self):
         status = self.__read_reg(self.__REG_STATUS)
-        por = status & 0x0002
+        por = status & self.__STATUS_POR
 
         return bool(por)
 
 
     def clear_power_on_reset(self):
-        try:
-            self.obtain_lock()
+        self.obtain_lock()
 
+        try:
             status = self.__read_reg(self.__REG_STATUS)
             self.__write_and_verify_reg(self.__REG_STATUS, status & 0xfffd)
 
@@ -351,6 +435,130 @@ class Max17055(object):
             self.release_lock()
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def program_alerts(self, v_min=None, v_max=None, soc_min=None, soc_max=None, t_min=None, t_max=None,
+                       i_min=None, i_max=None):
+        # thresholds: upper byte max, lower byte min - None disables the threshold...
+        volt = self.__alert_threshold(v_min, v_max, self.__ALERT_VOLT_LSB, False)
+        temp = self.__alert_threshold(t_min, t_max, 1.0, True)
+        charge = self.__alert_threshold(soc_min, soc_max, 1.0, False)
+        current = self.__alert_threshold(i_min, i_max, self.__conf.alert_current_lsb, True)
+
+        self.obtain_lock()
+
+        try:
+            self.__write_and_verify_reg(self.__REG_ALERT_VOLT, volt)
+            self.__write_and_verify_reg(self.__REG_ALERT_TEMP, temp)
+            self.__write_and_verify_reg(self.__REG_ALERT_CHARGE, charge)
+            self.__write_and_verify_reg(self.__REG_ALERT_CURRENT, current)
+
+            config = self.__read_reg(self.__REG_CONFIG)
+            self.__write_and_verify_reg(self.__REG_CONFIG, config | self.__CONFIG_AEN | self.__CONFIG_STICKY)
+
+        finally:
+            self.release_lock()
+
+
+    def read_alerts(self):
+        return Max17055Alerts.construct_from_status(self.__read_reg(self.__REG_STATUS))
+
+
+    def clear_alerts(self, alerts=None):
+        bits = Max17055Alerts.MASK if alerts is None else alerts.bits
+
+        self.obtain_lock()
+
+        try:
+            status = self.__read_reg(self.__REG_STATUS)
+            self.__write_reg(self.__REG_STATUS, status & ~bits & 0xffff)    # may be set again immediately
+
+        finally:
+            self.release_lock()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def read_snapshot(self):
+        taken_on = LocalizedDatetime.now()
+
+        firsts = [reg for first, last in Max17055Snapshot.RANGES
+                  for reg in range(first, last + 1, self.__SNAPSHOT_BLOCK)]
+
+        self.obtain_lock(exclusive=False)
+
+        try:
+            self.__timing.wait()
+            self.__bus.start_tx(self.__ADDR)
+
+            reads = self.__bus.read_cmds(firsts, self.__SNAPSHOT_BLOCK * 2)    # one combined transfer, if supported
+
+        finally:
+            self.__bus.end_tx()
+            self.__timing.mark()
+            self.release_lock()
+
+        regs = {}
+
+        for first, read_bytes in zip(firsts, reads):
+            for i in range(self.__SNAPSHOT_BLOCK):
+                regs[first + i] = Decode.unsigned_int(read_bytes[i * 2:i * 2 + 2], '<')
+
+        return Max17055Snapshot.construct_from_regs(taken_on, regs)
+
+
+    def write_snapshot(self, snapshot: Max17055Snapshot, regs=None):
+        # follows the initialise sequence: the model is refreshed, and HibCfg is restored last...
+        regs = Max17055Snapshot.RESTORABLE_REGS if regs is None else regs
+
+        self.obtain_lock()
+
+        try:
+            self.__cache.invalidate()
+            self.__completion.clear()
+
+            # wait for DNR to clear...
+            self.__wait_for_reg_value('dnr', self.__REG_FSTAT, 0x0001, 0)
+
+            # exit hibernate...
+            hib_cfg = self.__exit_hibernate()
+
+            if self.__REG_HIB_CFG in regs:
+                hib_cfg = snapshot.reg(self.__REG_HIB_CFG)
+
+            # restore registers...
+            for reg in regs:
+                if reg not in (self.__REG_HIB_CFG, self.__REG_MODEL_CFG):
+                    self.__write_and_verify_reg(reg, snapshot.reg(reg))
+
+            # model refresh...
+            if self.__REG_MODEL_CFG in regs:
+                self.__write_reg(self.__REG_MODEL_CFG, snapshot.reg(self.__REG_MODEL_CFG) | 0x8000)
+                self.__wait_for_reg_value('model-refresh', self.__REG_MODEL_CFG, 0x8000, 0)
+
+            # restore hibernate configuration...
+            self.__write_and_verify_reg(self.__REG_HIB_CFG, hib_cfg)
+
+        finally:
+            self.release_lock()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def read_hibernate_policy(self):
+        return Max17055HibernatePolicy.construct_from_hib_cfg(self.__read_reg(self.__REG_HIB_CFG))
+
+
+    def write_hibernate_policy(self, policy: Max17055HibernatePolicy):
+        self.obtain_lock()
+
+        try:
+            self.__write_and_verify_reg(self.__REG_HIB_CFG, policy.hib_cfg)
+
+        finally:
+            self.release_lock()
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def input_power_present(self):
@@ -360,158 +568,287 @@ class Max17055(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def read_charge_percent(self):
-        raw_percent = self.__read_reg(self.__REG_REP_SOC)
-        percent = raw_percent / 256.0
-
-        return round(percent, 1)
+        return self.__charge_percent(self.__read_reg(self.__REG_REP_SOC))
 
 
     def read_charge_mah(self):
-        raw_capacity = self.__read_reg(self.__REG_REP_CAP)
-        milli_amp_hours = raw_capacity * self.__capacity_lsb()
-
-        return int(round(milli_amp_hours))
+        return self.__capacity(self.__read_reg(self.__REG_REP_CAP))
 
 
     def read_time_until_empty(self):
-        raw_tte = self.__read_reg(self.__REG_TTE, signed=True)
+        return self.__time_delta(self.__read_reg(self.__REG_TTE))
 
-        if raw_tte < 1:
-            return None
 
-        tte = raw_tte * 5.625
+    def read_time_until_full(self):
+        return self.__time_delta(self.__read_reg(self.__REG_TTF))
 
-        return Timedelta(seconds=round(tte))
 
+    def read_capacity_avg(self):
+        return self.__capacity(self.__read_reg(self.__REG_CAP_AVG, signed=True))
 
-    def read_time_until_full(self):
-        raw_ttf = self.__read_reg(self.__REG_TTF, signed=True)
 
-        if raw_ttf < 1:
-            return None
+    def read_current(self):
+        return self.__current(self.__read_reg(self.__REG_CURRENT))
 
-        ttf = raw_ttf * 5.625
 
-        return Timedelta(seconds=round(ttf))
+    def read_current_avg(self):
+        return self.__current(self.__read_reg(self.__REG_CURRENT_AVG))
 
 
-    def read_capacity_avg(self):
-        raw_capacity = self.__read_reg(self.__REG_CAP_AVG, signed=True)
-        milli_amp_hours = raw_capacity * self.__capacity_lsb()
+    def read_voltage(self):
+        return self.__voltage(self.__read_reg(self.__REG_V_CELL))
+
+
+    def read_temperature(self):
+        return self.__temperature(self.__read_reg(self.__REG_TEMP))
+
+
+    def read_cycles(self):
+        return self.__cycles(self.__read_reg(self.__REG_CYCLES))
+
+
+    def read_raw_cycles(self):
+        return self.__read_reg(self.__REG_CYCLES)
+
+
+    def read_device_rev(self):
+        rev = self.__read_reg(self.__REG_DEV_NAME)
+
+        return rev
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # raw register value decoding...
+
+    @staticmethod
+    def __int16(raw):
+        return raw - 0x10000 if raw & 0x8000 else raw
+
+
+    @staticmethod
+    def __charge_percent(raw_percent):
+        percent = raw_percent / 256.0
+
+        return round(percent, 1)
+
+
+    def __capacity(self, raw_capacity):
+        milli_amp_hours = raw_capacity * self.__conf.capacity_lsb
 
         return int(round(milli_amp_hours))
 
 
-    def read_current(self):
-        raw_current = self.__read_reg(self.__REG_CURRENT, signed=True)
-        milli_amps = raw_current * self.__current_lsb()
+    def __current(self, raw_current):
+        milli_amps = self.__int16(raw_current) * self.__conf.current_lsb
 
         return int(round(milli_amps))
 
 
-    def read_current_avg(self):
-        raw_current = self.__read_reg(self.__REG_CURRENT_AVG, signed=True)
-        milli_amps = raw_current * self.__current_lsb()
+    @classmethod
+    def __time_delta(cls, raw_time):
+        raw_time = cls.__int16(raw_time)
 
-        return int(round(milli_amps))
+        if raw_time < 1:
+            return None
 
+        seconds = raw_time * 5.625
+
+        return Timedelta(seconds=round(seconds))
 
-    def read_voltage(self):
-        raw_voltage = self.__read_reg(self.__REG_V_CELL)
 
+    @staticmethod
+    def __voltage(raw_voltage):
         volts = (raw_voltage * 0.078125) / 1000.0
 
         return round(volts, 1)
 
 
-    def read_temperature(self):
-        raw_temp = self.__read_reg(self.__REG_TEMP, signed=True)
-        centigrade = raw_temp / 256.0
+    @classmethod
+    def __temperature(cls, raw_temp):
+        centigrade = cls.__int16(raw_temp) / 256.0
 
         return round(centigrade, 1)
 
 
-    def read_cycles(self):
-        raw_cycles = self.__read_reg(self.__REG_CYCLES)
+    @staticmethod
+    def __cycles(raw_cycles):
         cycles = raw_cycles / 100.0
 
         return round(cycles, 1)
 
 
-    def read_device_rev(self):
-        rev = self.__read_reg(self.__REG_DEV_NAME)
+    def __power(self, raw_power):
+        milli_watts = self.__int16(raw_power) * self.__conf.power_lsb
 
-        return rev
+        return round(milli_watts, 1)
 
 
-    # ----------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __extremes(raw_max_min, lsb, signed):
+        minimum, maximum = raw_max_min & 0xff, raw_max_min >> 8
 
-    def __capacity_lsb(self):
-        res_milli_ohms = self.__conf.sense_res * 1000
+        if signed:
+            minimum = minimum - 0x100 if minimum & 0x80 else minimum
+            maximum = maximum - 0x100 if maximum & 0x80 else maximum
 
-        return 5.0 / res_milli_ohms          # mAh
+        return Extremes(round(minimum * lsb, 2), round(maximum * lsb, 2))
 
 
-    def __current_lsb(self):
-        res_milli_ohms = self.__conf.sense_res * 1000
+    @staticmethod
+    def __alert_threshold(minimum, maximum, lsb, signed):
+        low, high = (-128, 127) if signed else (0, 255)
 
-        return 1.5625 / res_milli_ohms       # mA
+        min_byte = low if minimum is None else min(max(int(round(minimum / lsb)), low), high)
+        max_byte = high if maximum is None else min(max(int(round(maximum / lsb)), low), high)
+
+        return ((max_byte & 0xff) << 8) | (min_byte & 0xff)
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __wait_for_reg_value(self, reg, mask, expected):
-        read_value = None
+    def __wait_for_reg_value(self, step, reg, mask, expected):
+        try:
+            self.__completion.poll(step, lambda: self.__read_reg(reg), lambda value: value & mask == expected)
 
-        for _ in range(self.__REG_CHECK_NUM_RETRIES):
+        except TimeoutError:
             read_value = self.__read_reg(reg)
+            raise RuntimeError("reg:0x%02x mask:0x%04x expected:0x%04x got:0x%04x" %
+                               (reg, mask, expected, read_value))
 
-            if read_value & mask == expected:
-                return
 
-            time.sleep(0.1)
+    def __wait_for_model_updates(self, step, count):
+        # the gauge has no completion flag for a restore - wait until the model has run count times...
+        initial = self.__read_reg(self.__REG_TIMER)
+        deadline = time.monotonic() + self.__SETTLE_TIME
 
-        raise RuntimeError("reg:0x%02x mask:0x%04x expected:0x%04x got:0x%04x" % (reg, mask, expected, read_value))
+        self.__completion.poll(step, lambda: self.__read_reg(self.__REG_TIMER),
+                               lambda timer: (timer - initial) & 0xffff >= count or time.monotonic() >= deadline)
 
 
     def __read_reg(self, reg, signed=False):
+        value = self.__cache.get(reg)
+
+        if value is None:
+            try:
+                self.__timing.wait()
+                self.__bus.start_tx(self.__ADDR)
+
+                read_bytes = self.__bus.read_cmd(reg, 2)
+
+                value = Decode.unsigned_int(read_bytes, '<')
+
+            finally:
+                self.__bus.end_tx()
+                self.__timing.mark()
+
+            if reg == self.__REG_STATUS and value & self.__STATUS_POR:
+                self.__cache.invalidate()
+
+            self.__cache.put(reg, value)
+
+        return self.__int16(value) if signed else value
+
+
+    def __read_regs(self, *regs, use_cache=True):
+        values = {reg: self.__cache.get(reg) if use_cache else None for reg in regs}
+        misses = [reg for reg in regs if values[reg] is None]
+
+        if not misses:
+            return values
+
+        try:
+            self.__timing.wait()
+            self.__bus.start_tx(self.__ADDR)
+
+            reads = self.__bus.read_cmds(misses, 2)                         # one combined transfer, if supported
+
+        finally:
+            self.__bus.end_tx()
+            self.__timing.mark()
+
+        for reg, read_bytes in zip(misses, reads):
+            values[reg] = Decode.unsigned_int(read_bytes, '<')
+
+        if values.get(self.__REG_STATUS, 0) & self.__STATUS_POR:
+            self.__cache.invalidate()
+
+        for reg in misses:
+            self.__cache.put(reg, values[reg])
+
+        return values
+
+
+    def __read_block(self, first_reg, last_reg):
+        count = last_reg - first_reg + 1
+        block = range(first_reg, last_reg + 1)
+
+        if all(self.__cache.is_cacheable(reg) for reg in block):
+            regs = {reg: self.__cache.get(reg) for reg in block}
+
+            if None not in regs.values():
+                return regs                                                 # every register within its TTL
+
         try:
-            I2C.Utilities.start_tx(self.__ADDR)
+            self.__timing.wait()
+            self.__bus.start_tx(self.__ADDR)
 
-            read_bytes = I2C.Utilities.read_cmd(reg, 2)
-            time.sleep(0.001)
+            read_bytes = self.__bus.read_cmd(first_reg, count * 2)             # register address auto-increments
 
-            return Decode.int(read_bytes, '<') if signed else Decode.unsigned_int(read_bytes, '<')
+            regs = {first_reg + i: Decode.unsigned_int(read_bytes[i * 2:i * 2 + 2], '<') for i in range(count)}
 
         finally:
-            I2C.Utilities.end_tx()
+            self.__bus.end_tx()
+            self.__timing.mark()
+
+        for reg, value in regs.items():                                     # block reads refresh the cache
+            self.__cache.put(reg, value)
+
+        return regs
 
 
     def __write_reg(self, reg, value):
+        self.__cache.invalidate(reg)
+
         try:
-            I2C.Utilities.start_tx(self.__ADDR)
+            self.__timing.wait()
+            self.__bus.start_tx(self.__ADDR)
 
-            I2C.Utilities.write_addr(reg, value & 0x00ff, value >> 8)
-            time.sleep(0.001)
+            self.__bus.write_addr(reg, value & 0x00ff, value >> 8)
 
         finally:
-            I2C.Utilities.end_tx()
+            self.__bus.end_tx()
+            self.__timing.mark()
+
+
+    def __exit_hibernate(self):
+        # returns the hibernate configuration, which must be restored...
+        hib_cfg = self.__read_reg(self.__REG_HIB_CFG)
+
+        self.__write_reg(self.__REG_HIB_MODE, 0x90)                 # soft wake-up
+        self.__write_reg(self.__REG_HIB_CFG, 0x00)
+        self.__write_reg(self.__REG_HIB_MODE, 0x00)
+
+        return hib_cfg
 
 
     def __write_and_verify_reg(self, reg, value):
+        self.__cache.invalidate(reg)
+
         read_value = None
 
         try:
-            I2C.Utilities.start_tx(self.__ADDR)
+            self.__bus.start_tx(self.__ADDR)
 
             for _ in range(3):
                 # write...
-                I2C.Utilities.write_addr(reg, value & 0x00ff, value >> 8)
-                time.sleep(0.001)
+                self.__timing.wait()
+                self.__bus.write_addr(reg, value & 0x00ff, value >> 8)
+                self.__timing.mark()
 
                 # read...
-                read_bytes = I2C.Utilities.read_cmd(reg, 2)
-                time.sleep(0.001)
+                self.__timing.wait(settle=True)
+                read_bytes = self.__bus.read_cmd(reg, 2)
+                self.__timing.mark()
 
                 read_value = Decode.unsigned_int(read_bytes, '<')
 
@@ -521,25 +858,48 @@ class Max17055(object):
             raise RuntimeError("reg:0x%02x value:0x%04x got:0x%04x" % (reg, value, read_value))
 
         finally:
-            I2C.Utilities.end_tx()
+            self.__bus.end_tx()
+            self.__timing.mark()
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def obtain_lock(self):
-        Lock.acquire(self.__lock_name, self.__LOCK_TIMEOUT)
+    def obtain_lock(self, exclusive=True):
+        self.__lock.acquire(exclusive, self.__LOCK_TIMEOUT)
 
 
     def release_lock(self):
-        Lock.release(self.__lock_name)
+        self.__lock.release()
+
+
+    @property
+    def lock(self):
+        return self.__lock
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def cache(self):
+        return self.__cache
+
+
+    def invalidate_cache(self):
+        self.__cache.invalidate()
+
+
+    @property
+    def timing(self):
+        return self.__timing
 
 
     @property
-    def __lock_name(self):
-        return self.__class__.__name__
+    def step_timings(self):
+        return self.__completion.steps
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return self.__class__.__name__ + ":{conf:%s}" %  self.__conf
+        return self.__class__.__name__ + ":{conf:%s, cache:%s, timing:%s, lock:%s}" %  \
+               (self.__conf, self.__cache, self.__timing, self.__lock)
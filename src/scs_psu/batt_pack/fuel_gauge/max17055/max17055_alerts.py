@@ -0,0 +1,125 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+The alert bits of the MAX17055 Status register. A bit is set when the corresponding threshold in the VAlrtTh,
+TAlrtTh, SAlrtTh or IAlrtTh register is exceeded.
+
+example document:
+{"i-min": false, "i-max": false, "v-min": false, "v-max": false, "t-min": false, "t-max": false, "s-min": true,
+"s-max": false}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Max17055Alerts(JSONable):
+    """
+    classdocs
+    """
+
+    __IMN =                     0x0004          # current min
+    __IMX =                     0x0040          # current max
+    __VMN =                     0x0100          # voltage min
+    __TMN =                     0x0200          # temperature min
+    __SMN =                     0x0400          # state of charge min
+    __VMX =                     0x1000          # voltage max
+    __TMX =                     0x2000          # temperature max
+    __SMX =                     0x4000          # state of charge max
+
+    MASK = __IMN | __IMX | __VMN | __TMN | __SMN | __VMX | __TMX | __SMX
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_status(cls, status):
+        return cls(status & cls.MASK)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, bits):
+        """
+        Constructor
+        """
+        self.__bits = int(bits)                                 # int       Status register alert bits
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['i-min'] = self.current_min
+        jdict['i-max'] = self.current_max
+        jdict['v-min'] = self.voltage_min
+        jdict['v-max'] = self.voltage_max
+        jdict['t-min'] = self.temperature_min
+        jdict['t-max'] = self.temperature_max
+        jdict['s-min'] = self.charge_min
+        jdict['s-max'] = self.charge_max
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def fired(self):
+        return self.__bits != 0
+
+
+    @property
+    def bits(self):
+        return self.__bits
+
+
+    @property
+    def current_min(self):
+        return bool(self.__bits & self.__IMN)
+
+
+    @property
+    def current_max(self):
+        return bool(self.__bits & self.__IMX)
+
+
+    @property
+    def voltage_min(self):
+        return bool(self.__bits & self.__VMN)
+
+
+    @property
+    def voltage_max(self):
+        return bool(self.__bits & self.__VMX)
+
+
+    @property
+    def temperature_min(self):
+        return bool(self.__bits & self.__TMN)
+
+
+    @property
+    def temperature_max(self):
+        return bool(self.__bits & self.__TMX)
+
+
+    @property
+    def charge_min(self):
+        return bool(self.__bits & self.__SMN)
+
+
+    @property
+    def charge_max(self):
+        return bool(self.__bits & self.__SMX)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "Max17055Alerts:{bits:0x%04x}" % self.bits
@@ -0,0 +1,87 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+Completion polling for MAX17055 configuration steps. A condition is polled with an exponential backoff, from the
+initial interval up to the ceiling, and at the ceiling interval thereafter, until the condition is met or the
+deadline passes.
+
+The time taken by each named step is recorded, so that the cost of gauge initialisation and restore may be
+measured on the device.
+"""
+
+import time
+
+from collections import OrderedDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Max17055Completion(object):
+    """
+    classdocs
+    """
+
+    __INITIAL_INTERVAL =        0.005           # seconds
+    __CEILING_INTERVAL =        0.100           # seconds
+    __TIMEOUT =                 2.0             # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, initial_interval=None, ceiling_interval=None, timeout=None):
+        """
+        Constructor
+        """
+        self.__initial_interval = self.__INITIAL_INTERVAL if initial_interval is None else initial_interval
+        self.__ceiling_interval = self.__CEILING_INTERVAL if ceiling_interval is None else ceiling_interval
+        self.__timeout = self.__TIMEOUT if timeout is None else timeout
+
+        self.__steps = OrderedDict()                    # dict of step: seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def poll(self, step, read, is_complete):
+        start_time = time.monotonic()
+        deadline = start_time + self.__timeout
+        interval = self.__initial_interval
+
+        while True:
+            value = read()
+
+            if is_complete(value):
+                self.__steps[step] = time.monotonic() - start_time
+                return value
+
+            now = time.monotonic()
+
+            if now >= deadline:
+                self.__steps[step] = now - start_time
+                raise TimeoutError("%s: incomplete after %0.3f seconds" % (step, now - start_time))
+
+            time.sleep(min(interval, deadline - now))
+            interval = min(interval * 2, self.__ceiling_interval)
+
+
+    def clear(self):
+        self.__steps.clear()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def steps(self):
+        return OrderedDict(self.__steps)
+
+
+    @property
+    def timeout(self):
+        return self.__timeout
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "Max17055Completion:{initial_interval:%s, ceiling_interval:%s, timeout:%s, steps:%s}" % \
+               (self.__initial_interval, self.__ceiling_interval, self.timeout, dict(self.__steps))
@@ -25,6 +25,11 @@ class Max17055Config(JSONable):
     BATT_TYPE_NCA_NCR =     2
     BATT_TYPE_LiFePO4 =     6
 
+    __CAPACITY_LSB =        5.0             # mAh x mΩ
+    __CURRENT_LSB =         1.5625          # mA x mΩ
+    __POWER_LSB =           8.0             # mW x mΩ
+    __ALERT_CURRENT_LSB =   400.0           # mA x mΩ - IAlrtTh and MaxMinCurr
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
@@ -58,6 +63,19 @@ class Max17055Config(JSONable):
         self.__chrg_v = Datum.int(chrg_v)                           # charge voltage (see constants)
         self.__batt_type = Datum.int(batt_type)                     # type of battery (see constants)
 
+        # register scaling, precomputed for the sense resistor...
+        res_milli_ohms = None if self.__sense_res is None else self.__sense_res * 1000
+
+        self.__capacity_lsb = self.__lsb(self.__CAPACITY_LSB, res_milli_ohms)              # mAh
+        self.__current_lsb = self.__lsb(self.__CURRENT_LSB, res_milli_ohms)                # mA
+        self.__power_lsb = self.__lsb(self.__POWER_LSB, res_milli_ohms)                    # mW
+        self.__alert_current_lsb = self.__lsb(self.__ALERT_CURRENT_LSB, res_milli_ohms)    # mA
+
+
+    @staticmethod
+    def __lsb(scale, res_milli_ohms):
+        return None if not res_milli_ohms else scale / res_milli_ohms
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
@@ -112,6 +130,28 @@ class Max17055Config(JSONable):
         return self.__batt_type
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def capacity_lsb(self):
+        return self.__capacity_lsb
+
+
+    @property
+    def current_lsb(self):
+        return self.__current_lsb
+
+
+    @property
+    def power_lsb(self):
+        return self.__power_lsb
+
+
+    @property
+    def alert_current_lsb(self):
+        return self.__alert_current_lsb
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
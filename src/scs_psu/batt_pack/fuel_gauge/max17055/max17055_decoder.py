@@ -0,0 +1,122 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+A vectorised decoder for captures of raw MAX17055 register values, such as a history of snapshots, for offline
+analysis. Each register is decoded for every sample in a single NumPy operation, using the scaling precomputed by
+the Max17055Config.
+
+Values are rounded as they are by the Max17055 driver. Times to empty or full that the gauge reports as unknown
+are NaN.
+
+NumPy is required by this module only - it is not required on the device, and is installed with the "analysis" extra:
+pip install scs_psu[analysis]
+
+example:
+decoder = Max17055Decoder(BattPackV2.gauge_conf())
+decoded = decoder.decode_snapshots(numpy.array([snapshot.words for snapshot in snapshots]))
+"""
+
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:
+    np = None                                               # reported when a decoder is constructed
+
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_config import Max17055Config
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_snapshot import Max17055Snapshot
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Max17055Decoder(object):
+    """
+    classdocs
+    """
+
+    REG_REP_CAP =               0x05
+    REG_REP_SOC =               0x06
+    REG_TEMP =                  0x08
+    REG_V_CELL =                0x09
+    REG_CURRENT =               0x0a
+    REG_CURRENT_AVG =           0x0b
+    REG_TTE =                   0x11
+    REG_CYCLES =                0x17
+    REG_CAP_AVG =               0x1f
+    REG_TTF =                   0x20
+
+    __VOLTAGE_LSB =             0.078125 / 1000.0           # V
+    __PERCENT_LSB =             1.0 / 256.0                 # %
+    __TEMPERATURE_LSB =         1.0 / 256.0                 # °C
+    __TIME_LSB =                5.625                       # seconds
+    __CYCLES_LSB =              0.01                        # cycles
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def int16(raw):
+        return np.asarray(raw, dtype=np.uint16).view(np.int16)
+
+
+    @staticmethod
+    def uint16(raw):
+        return np.asarray(raw, dtype=np.uint16)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, conf: Max17055Config):
+        """
+        Constructor
+        """
+        if np is None:
+            raise ImportError("Max17055Decoder requires NumPy - install scs_psu[analysis]")
+
+        self.__conf = conf
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def decode(self, regs):
+        # regs: dict of reg: array of raw values, one element per sample...
+        decoded = OrderedDict()
+
+        decoded['chrg'] = np.round(self.uint16(regs[self.REG_REP_SOC]) * self.__PERCENT_LSB, 1)
+        decoded['mah'] = np.round(self.uint16(regs[self.REG_REP_CAP]) * self.__conf.capacity_lsb)
+
+        decoded['tte'] = self.__time(regs[self.REG_TTE])
+        decoded['ttf'] = self.__time(regs[self.REG_TTF])
+
+        decoded['v'] = np.round(self.uint16(regs[self.REG_V_CELL]) * self.__VOLTAGE_LSB, 1)
+        decoded['curr'] = np.round(self.int16(regs[self.REG_CURRENT_AVG]) * self.__conf.current_lsb)
+        decoded['g-tmp'] = np.round(self.int16(regs[self.REG_TEMP]) * self.__TEMPERATURE_LSB, 1)
+
+        decoded['cap'] = np.round(self.int16(regs[self.REG_CAP_AVG]) * self.__conf.capacity_lsb)
+        decoded['cyc'] = np.round(self.uint16(regs[self.REG_CYCLES]) * self.__CYCLES_LSB, 1)
+
+        return decoded
+
+
+    def decode_snapshots(self, words):
+        # words: array of shape (samples, len(Max17055Snapshot.REGS))...
+        words = self.uint16(words)
+        index = {reg: i for i, reg in enumerate(Max17055Snapshot.REGS)}
+
+        return self.decode({reg: words[:, i] for reg, i in index.items()})
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __time(self, raw):
+        raw = self.int16(raw)
+        seconds = np.round(raw * self.__TIME_LSB)
+
+        return np.where(raw < 1, np.nan, seconds)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "Max17055Decoder:{conf:%s}" % self.__conf
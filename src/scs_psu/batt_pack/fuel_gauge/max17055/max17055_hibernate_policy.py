@@ -0,0 +1,177 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+The MAX17055 hibernate policy, as held in the HibCfg register. In active mode, the gauge updates its registers every
+175.8 ms. When the current has remained below the hibernate threshold for the enter time, the gauge hibernates,
+updating every 351 ms x 2^scalar. The power-on default (0x870c) hibernates with a task period of 5.6 seconds.
+
+HibCfg fields:
+    15      EnHib           hibernate enabled
+    14:12   HibEnterTime    code
+    11:8    HibThreshold    threshold current = FullCap / 0.8 h / 2^threshold
+    4:3     HibExitTime     exit time = (exit_time + 1) x 702 ms x 2^scalar
+    2:0     HibScalar       task period = 351 ms x 2^scalar
+
+Document example:
+{"enabled": true, "enter-time": 0, "threshold": 7, "exit-time": 1, "scalar": 4}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Max17055HibernatePolicy(JSONable):
+    """
+    classdocs
+    """
+
+    ACTIVE_PERIOD =             0.1758          # seconds
+
+    __HIBERNATE_PERIOD =        0.3516          # seconds x 2^scalar
+    __EXIT_PERIOD =             0.7032          # seconds x 2^scalar
+    __THRESHOLD_HOURS =         0.8
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        enabled = jdict.get('enabled')
+        enter_time = jdict.get('enter-time')
+        threshold = jdict.get('threshold')
+        exit_time = jdict.get('exit-time')
+        scalar = jdict.get('scalar')
+
+        return cls(enabled, enter_time, threshold, exit_time, scalar)
+
+
+    @classmethod
+    def construct_from_hib_cfg(cls, hib_cfg):
+        enabled = bool(hib_cfg & 0x8000)
+        enter_time = (hib_cfg >> 12) & 0x07
+        threshold = (hib_cfg >> 8) & 0x0f
+        exit_time = (hib_cfg >> 3) & 0x03
+        scalar = hib_cfg & 0x07
+
+        return cls(enabled, enter_time, threshold, exit_time, scalar)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, enabled, enter_time, threshold, exit_time, scalar):
+        """
+        Constructor
+        """
+        self.__enabled = bool(enabled)                          # bool
+        self.__enter_time = self.__field(enter_time, 0x07)      # int       code
+        self.__threshold = self.__field(threshold, 0x0f)        # int       code
+        self.__exit_time = self.__field(exit_time, 0x03)        # int       code
+        self.__scalar = self.__field(scalar, 0x07)              # int       code
+
+
+    def __eq__(self, other):
+        try:
+            return self.hib_cfg == other.hib_cfg
+
+        except AttributeError:
+            return False
+
+
+    @staticmethod
+    def __field(value, maximum):
+        value = int(value)
+
+        if not 0 <= value <= maximum:
+            raise ValueError(value)
+
+        return value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def threshold_current(self, full_cap):                      # mA, for full_cap in mAh
+        return full_cap / self.__THRESHOLD_HOURS / (2 ** self.threshold)
+
+
+    def is_hibernating(self, current, full_cap):                # an estimate, from the most recent current (mA)
+        if not self.enabled or current is None:
+            return False
+
+        return abs(current) < self.threshold_current(full_cap)
+
+
+    def update_period(self, current, full_cap):
+        return self.hibernate_period if self.is_hibernating(current, full_cap) else self.ACTIVE_PERIOD
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def hibernate_period(self):
+        return self.__HIBERNATE_PERIOD * (2 ** self.scalar)
+
+
+    @property
+    def exit_period(self):
+        return (self.exit_time + 1) * self.__EXIT_PERIOD * (2 ** self.scalar)
+
+
+    @property
+    def hib_cfg(self):
+        return (int(self.enabled) << 15) | (self.enter_time << 12) | (self.threshold << 8) | \
+               (self.exit_time << 3) | self.scalar
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['enabled'] = self.enabled
+        jdict['enter-time'] = self.enter_time
+        jdict['threshold'] = self.threshold
+        jdict['exit-time'] = self.exit_time
+        jdict['scalar'] = self.scalar
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def enabled(self):
+        return self.__enabled
+
+
+    @property
+    def enter_time(self):
+        return self.__enter_time
+
+
+    @property
+    def threshold(self):
+        return self.__threshold
+
+
+    @property
+    def exit_time(self):
+        return self.__exit_time
+
+
+    @property
+    def scalar(self):
+        return self.__scalar
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "Max17055HibernatePolicy:{enabled:%s, enter_time:%s, threshold:%s, exit_time:%s, scalar:%s}" % \
+               (self.enabled, self.enter_time, self.threshold, self.exit_time, self.scalar)
@@ -0,0 +1,215 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+A cross-process reader / writer lock for the MAX17055, using flock(2) on a lock file. Read-only snapshots take the
+lock shared, so that concurrent readers do not block one another - configuration writes take the lock exclusive.
+
+flock(2) has no timeout, so a non-blocking attempt is retried until the timeout passes. An flock is held by the
+open file description, which a child process inherits - the lock file is therefore opened once per process. Within
+the process, acquisitions are serialised by a thread lock.
+
+The lock file is held in the scs_host lock directory. flock(2) does not require write access, so the file is opened
+read-only, and is made readable by all users when it is created - processes running as other users can then take
+the lock.
+
+Exclusive acquisitions also take the scs_host Lock of the same name, which external code may hold while it
+configures the gauge.
+
+The time spent waiting for the lock is recorded, so that contention may be measured.
+
+https://man7.org/linux/man-pages/man2/flock.2.html
+"""
+
+import fcntl
+import os
+import time
+
+from threading import Lock, get_ident
+
+from scs_host.lock.lock import Lock as HostLock
+from scs_host.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Max17055Lock(object):
+    """
+    classdocs
+    """
+
+    __NAME =                    "Max17055"                  # as used with scs_host Lock
+    __SUFFIX =                  ".flock"
+    __MODE =                    0o644
+
+    __RETRY_INTERVAL =          0.002           # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, path=None, name=None):
+        """
+        Constructor
+        """
+        self.__name = self.__NAME if name is None else name
+        self.__path = os.path.join(Host.lock_dir(), self.__name + self.__SUFFIX) if path is None else path
+
+        self.__fd = None                                        # int
+        self.__pid = None                                       # pid of the process that opened the lock file
+        self.__thread_lock = Lock()
+        self.__owner = None                                     # ident of the thread holding the lock
+        self.__host_lock_held = False
+
+        self.__acquisitions = 0                                 # int
+        self.__contentions = 0                                  # int
+        self.__total_wait = 0.0                                 # float         seconds
+        self.__max_wait = 0.0                                   # float         seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def acquire(self, exclusive, timeout):
+        start_time = time.monotonic()
+
+        if not self.__thread_lock.acquire(timeout=timeout):
+            self.__record_wait(time.monotonic() - start_time, True)
+            raise TimeoutError("Max17055Lock: thread lock not acquired within %s seconds" % timeout)
+
+        operation = (fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) | fcntl.LOCK_NB
+        contended = time.monotonic() - start_time > self.__RETRY_INTERVAL
+
+        try:
+            fd = self.__lock_file()
+
+            while True:
+                try:
+                    fcntl.flock(fd, operation)
+                    break
+
+                except BlockingIOError:
+                    contended = True
+
+                    if time.monotonic() - start_time >= timeout:
+                        raise TimeoutError("Max17055Lock: %s not acquired within %s seconds" % (self.__path, timeout))
+
+                    time.sleep(self.__RETRY_INTERVAL)
+
+            if exclusive:
+                self.__acquire_host_lock(fd, max(timeout - (time.monotonic() - start_time), 0.0))
+
+        except BaseException:
+            self.__record_wait(time.monotonic() - start_time, contended)
+            self.__thread_lock.release()
+            raise
+
+        self.__record_wait(time.monotonic() - start_time, contended)
+        self.__owner = get_ident()
+
+
+    def release(self):
+        if self.__owner != get_ident():
+            return                                              # not held by this thread
+
+        try:
+            if self.__host_lock_held:
+                HostLock.release(self.__name)
+
+        finally:
+            self.__host_lock_held = False
+
+            try:
+                fcntl.flock(self.__fd, fcntl.LOCK_UN)
+
+            finally:
+                self.__owner = None
+                self.__thread_lock.release()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __acquire_host_lock(self, fd, timeout):
+        try:
+            HostLock.acquire(self.__name, timeout)
+
+        except BaseException:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            raise
+
+        self.__host_lock_held = True
+
+
+    def __lock_file(self):
+        if self.__pid != os.getpid():
+            self.__fd = self.__open()
+            self.__pid = os.getpid()
+
+        return self.__fd
+
+
+    def __open(self):
+        # an existing file is opened without O_CREAT, which fs.protected_regular may refuse for another owner...
+        while True:
+            try:
+                return os.open(self.__path, os.O_RDONLY)
+
+            except FileNotFoundError:
+                pass
+
+            os.makedirs(os.path.dirname(self.__path), exist_ok=True)
+
+            try:
+                fd = os.open(self.__path, os.O_RDONLY | os.O_CREAT | os.O_EXCL, self.__MODE)
+
+            except FileExistsError:
+                continue                                        # created by another process
+
+            os.fchmod(fd, self.__MODE)                          # regardless of umask
+            return fd
+
+
+    def __record_wait(self, wait, contended):
+        self.__acquisitions += 1
+        self.__total_wait += wait
+        self.__max_wait = max(self.__max_wait, wait)
+
+        if contended:
+            self.__contentions += 1
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def name(self):
+        return self.__name
+
+
+    @property
+    def path(self):
+        return self.__path
+
+
+    @property
+    def acquisitions(self):
+        return self.__acquisitions
+
+
+    @property
+    def contentions(self):
+        return self.__contentions
+
+
+    @property
+    def total_wait(self):
+        return self.__total_wait
+
+
+    @property
+    def max_wait(self):
+        return self.__max_wait
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "Max17055Lock:{name:%s, path:%s, acquisitions:%s, contentions:%s, total_wait:%0.6f, max_wait:%0.6f}" % \
+               (self.name, self.path, self.acquisitions, self.contentions, self.total_wait, self.max_wait)
@@ -0,0 +1,72 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+Decides when the MAX17055 learned parameters should be saved, so that the full Max17055Params set is only read
+when it may have changed:
+
+* the first time that the trigger is consulted
+* when bit 6 of the Cycles register toggles (every 64% change in the battery)
+* when the charge has moved by the save interval since the last save
+
+https://www.maximintegrated.com/en/design/technical-documents/userguides-and-manuals/6/6365.html
+"""
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Max17055ParamsTrigger(object):
+    """
+    classdocs
+    """
+
+    __CYCLES_SAVE_MASK =        0x0040          # bit 6 of the raw Cycles register
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, save_interval):
+        """
+        Constructor
+        """
+        self.__save_interval = save_interval            # float or int  % change in charge
+
+        self.__cycles = None                            # int           raw cycles at last save
+        self.__charge = None                            # float or int  percentage at last save
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_due(self, cycles, charge):
+        if cycles is None:
+            return False
+
+        if self.__cycles is None:
+            return True
+
+        if (cycles ^ self.__cycles) & self.__CYCLES_SAVE_MASK:
+            return True
+
+        if self.__save_interval is None or charge is None or self.__charge is None:
+            return False
+
+        return abs(charge - self.__charge) >= self.__save_interval
+
+
+    def saved(self, cycles, charge):
+        self.__cycles = cycles
+        self.__charge = charge
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def save_interval(self):
+        return self.__save_interval
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "Max17055ParamsTrigger:{save_interval:%s, cycles:%s, charge:%s}" % \
+               (self.save_interval, self.__cycles, self.__charge)
@@ -0,0 +1,101 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+A time-to-live cache for slowly-changing MAX17055 registers. Values are held in their raw (16-bit unsigned int) form.
+
+A TTL of None indicates that the value is held until it is invalidated. The cache is local to the process - writes
+made by other processes are only seen when the TTL expires. A TTL of None should therefore be used only for registers
+that are never written, such as DevName.
+
+Block reads refresh the cache, and are served from it only where every register in the block is held - a block that
+includes any uncached register, such as Current, is always read from the device.
+"""
+
+import time
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Max17055RegisterCache(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, ttls):
+        """
+        Constructor
+        """
+        self.__ttls = dict(ttls)                        # dict of reg: seconds or None
+
+        self.__entries = {}                             # dict of reg: (value, expiry or None)
+
+        self.__hits = 0                                 # int
+        self.__misses = 0                               # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_cacheable(self, reg):
+        return reg in self.__ttls
+
+
+    def get(self, reg):
+        if not self.is_cacheable(reg):
+            return None
+
+        entry = self.__entries.get(reg)
+
+        if entry is not None:
+            value, expiry = entry
+
+            if expiry is None or time.monotonic() < expiry:
+                self.__hits += 1
+                return value
+
+            del self.__entries[reg]
+
+        self.__misses += 1
+        return None
+
+
+    def put(self, reg, value):
+        if not self.is_cacheable(reg):
+            return
+
+        ttl = self.__ttls[reg]
+        expiry = None if ttl is None else time.monotonic() + ttl
+
+        self.__entries[reg] = (value, expiry)
+
+
+    def invalidate(self, reg=None):
+        if reg is None:
+            self.__entries.clear()
+            return
+
+        self.__entries.pop(reg, None)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def hits(self):
+        return self.__hits
+
+
+    @property
+    def misses(self):
+        return self.__misses
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        ttls = '{' + ', '.join('0x%02x:%s' % (reg, ttl) for reg, ttl in sorted(self.__ttls.items())) + '}'
+
+        return "Max17055RegisterCache:{ttls:%s, cached:%s, hits:%s, misses:%s}" % \
+               (ttls, len(self.__entries), self.hits, self.misses)
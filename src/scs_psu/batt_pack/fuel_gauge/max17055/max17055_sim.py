@@ -0,0 +1,428 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+An in-process simulation of a MAX17055 fuel gauge, for hardware-free testing and benchmarking.
+
+The simulation is an I2CBus, and may be passed to Max17055 (or BattPack.construct) as its bus. It models the
+registers used by the Max17055 driver, including:
+
+* the PoR bit in the Status register, set on start and on power_on_reset()
+* the FSTAT DNR bit, which clears a set time after PoR
+* the ModelCfg Refresh bit, which clears a set time after it is written
+* the Timer register, which advances once per 175.8 ms model update
+* the Power and PowerAvg registers, and the MaxMinTemp, MaxMinVolt and MaxMinCurr latches
+* the Status register alert bits, set against the VAlrtTh, TAlrtTh, SAlrtTh and IAlrtTh thresholds and held until
+  cleared
+* the learned-parameter registers (RComp0, TempCo, FullCapRep, FullCapNom, Cycles) - a write to FullCapRep keeps
+  the state of charge, as the gauge does when its learned parameters are restored
+* a discharge curve of open-circuit voltage against state of charge, with charge integrated from the current
+
+Time may be accelerated by a time_scale. The design capacity is held in register units, as the Max17055 driver writes Max17055Config des_cap to DesignCap.
+Capacities in mAh are converted through the capacity LSB of the sense resistor, as by the driver.
+
+A fixed latency per transaction and a transfer time per byte may be set,
+so that bus occupancy is representative of hardware: at 100 kHz, a byte takes around 90 us.
+
+Only the simulated device address responds - other addresses raise OSError (EREMOTEIO), as for a NACK.
+"""
+
+import errno
+import time
+
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_config import Max17055Config
+from scs_psu.bus.i2c_bus import I2CBus
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Max17055Sim(I2CBus):
+    """
+    classdocs
+    """
+
+    ADDR =                      0x36
+
+    DEFAULT_CURVE = ((0.0, 3.00), (5.0, 3.30), (10.0, 3.50), (20.0, 3.60),          # (% SoC, V)
+                     (50.0, 3.75), (80.0, 3.95), (100.0, 4.20))
+
+    __DNR_TIME =                0.050           # seconds after PoR
+    __REFRESH_TIME =            0.100           # seconds after ModelCfg write
+    __TIMER_LSB =               0.1758          # seconds
+
+    __REG_STATUS =              0x00
+    __REG_ALERT_VOLT =          0x01
+    __REG_ALERT_TEMP =          0x02
+    __REG_ALERT_CHARGE =        0x03
+    __REG_REP_CAP =             0x05
+    __REG_REP_SOC =             0x06
+    __REG_TEMP =                0x08
+    __REG_V_CELL =              0x09
+    __REG_CURRENT =             0x0a
+    __REG_CURRENT_AVG =         0x0b
+    __REG_MIX_SOC =             0x0d
+    __REG_FULL_CAP_REP =        0x10
+    __REG_TTE =                 0x11
+    __REG_TEMP_AVG =            0x16
+    __REG_CYCLES =              0x17
+    __REG_DESIGN_CAP =          0x18
+    __REG_V_CELL_AVG =          0x19
+    __REG_MAX_MIN_TEMP =        0x1a
+    __REG_MAX_MIN_VOLT =        0x1b
+    __REG_MAX_MIN_CURRENT =     0x1c
+    __REG_CAP_AVG =             0x1f
+    __REG_TTF =                 0x20
+    __REG_DEV_NAME =            0x21
+    __REG_FULL_CAP_NOM =        0x23
+    __REG_DIE_TEMP =            0x34
+    __REG_FSTAT =               0x3d
+    __REG_TIMER =               0x3e
+    __REG_HIB_CFG =             0xba
+    __REG_POWER =               0xb1
+    __REG_POWER_AVG =           0xb3
+    __REG_ALERT_CURRENT =       0xb4
+    __REG_MODEL_CFG =           0xdb
+
+    __DEV_NAME =                0x4010
+    __HIB_CFG =                 0x870c
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, conf: Max17055Config, soc=80.0, current=-200, temperature=25.0, curve=None,
+                 tx_latency=0.0, byte_time=0.0, time_scale=1.0):
+        """
+        Constructor
+        """
+        self.__conf = conf                                      # Max17055Config
+
+        self.__capacity_lsb = conf.capacity_lsb                 # mAh
+        self.__current_lsb = conf.current_lsb                   # mA
+
+        self.__curve = self.DEFAULT_CURVE if curve is None else tuple(sorted(curve))
+
+        self.__tx_latency = tx_latency                          # seconds per transaction
+        self.__byte_time = byte_time                            # seconds per byte transferred
+        self.__time_scale = time_scale                          # simulated seconds per real second
+
+        self.__regs = {}                                        # dict of reg: raw value
+        self.__charge = 0.0                                     # mAh
+        self.__cycle_fraction = 0.0                             # % of a cycle, not yet counted
+        self.__current = float(current)                         # mA, negative when discharging
+        self.__temperature = float(temperature)                 # °C
+
+        self.__addr = None
+        self.__pointer = 0
+        self.__transactions = 0
+
+        self.__updated = None
+        self.__dnr_until = None
+        self.__refresh_until = None
+
+        self.power_on_reset(soc)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # simulation control...
+
+    def power_on_reset(self, soc=None):
+        full_cap = self.__conf.des_cap                          # register units, as written by the driver
+
+        self.__regs = {
+            self.__REG_STATUS: 0x0002,
+            self.__REG_FSTAT: 0x0001,
+            self.__REG_DEV_NAME: self.__DEV_NAME,
+            self.__REG_HIB_CFG: self.__HIB_CFG,
+            self.__REG_DESIGN_CAP: int(full_cap),
+            self.__REG_FULL_CAP_REP: int(full_cap),
+            self.__REG_FULL_CAP_NOM: int(full_cap),
+            self.__REG_CYCLES: 0,
+            self.__REG_ALERT_VOLT: 0xff00,
+            self.__REG_ALERT_TEMP: 0x7f80,
+            self.__REG_ALERT_CHARGE: 0xff00,
+            self.__REG_ALERT_CURRENT: 0x7f80,
+            self.__REG_MAX_MIN_TEMP: 0x807f,
+            self.__REG_MAX_MIN_VOLT: 0x00ff,
+            self.__REG_MAX_MIN_CURRENT: 0x807f
+        }
+
+        if soc is not None:
+            self.__charge = self.__full_cap_mah() * soc / 100.0
+
+        now = self.__now()
+
+        self.__updated = now
+        self.__dnr_until = now + self.__DNR_TIME
+        self.__refresh_until = None
+
+
+    def set_current(self, current):
+        self.__update()
+        self.__current = float(current)
+
+
+    def set_temperature(self, temperature):
+        self.__temperature = float(temperature)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # I2CBus implementation...
+
+    def open(self):
+        pass
+
+
+    def close(self):
+        pass
+
+
+    def start_tx(self, addr):
+        if addr != self.ADDR:
+            raise OSError(errno.EREMOTEIO, "no device at 0x%02x" % addr)
+
+        self.__addr = addr
+        self.__transactions += 1
+
+
+    def end_tx(self):
+        self.__addr = None
+
+
+    def read_cmd(self, cmd, count):
+        self.__pointer = cmd
+        self.__transfer(count + 3)                              # address + command, address + data
+
+        return self.__read_bytes(count)
+
+
+    def read(self, count):
+        self.__transfer(count + 1)
+
+        return self.__read_bytes(count)
+
+
+    def write_addr(self, addr, *values):
+        self.__transfer(len(values) + 2)
+
+        for i in range(0, len(values) - 1, 2):
+            self.__write_reg(addr + i // 2, values[i] | (values[i + 1] << 8))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __transfer(self, byte_count):
+        if self.__addr is None:
+            raise OSError(errno.EIO, "no transaction in progress")
+
+        delay = self.__tx_latency + self.__byte_time * byte_count
+
+        if delay > 0:
+            time.sleep(delay)
+
+
+    def __read_bytes(self, count):
+        self.__update()
+
+        read_bytes = []
+
+        for i in range(0, count, 2):
+            value = self.__read_reg((self.__pointer + i // 2) & 0xff)
+            read_bytes.extend((value & 0x00ff, value >> 8))
+
+        return read_bytes[:count]
+
+
+    def __read_reg(self, reg):
+        now = self.__now()
+
+        if reg == self.__REG_FSTAT:
+            return 0x0000 if now >= self.__dnr_until else 0x0001
+
+        if reg == self.__REG_STATUS:
+            self.__regs[reg] = self.__regs.get(reg, 0) | self.__alert_bits()
+            return self.__regs[reg]
+
+        if reg in (self.__REG_POWER, self.__REG_POWER_AVG):
+            return self.__word(self.__voltage() * self.__current / self.__conf.power_lsb)
+
+        if reg == self.__REG_TIMER:
+            return int(now / self.__TIMER_LSB) & 0xffff
+
+        if reg == self.__REG_MODEL_CFG:
+            value = self.__regs.get(reg, 0)
+            refreshed = self.__refresh_until is None or now >= self.__refresh_until
+
+            return value & 0x7fff if refreshed else value | 0x8000
+
+        if reg in (self.__REG_REP_CAP, self.__REG_CAP_AVG):
+            return self.__word(self.__charge / self.__capacity_lsb)
+
+        if reg in (self.__REG_REP_SOC, self.__REG_MIX_SOC):
+            return self.__word(self.__soc() * 256.0)
+
+        if reg in (self.__REG_TEMP, self.__REG_TEMP_AVG, self.__REG_DIE_TEMP):
+            return self.__word(self.__temperature * 256.0)
+
+        if reg in (self.__REG_V_CELL, self.__REG_V_CELL_AVG):
+            return self.__word(self.__voltage() * 1000.0 / 0.078125)
+
+        if reg in (self.__REG_CURRENT, self.__REG_CURRENT_AVG):
+            return self.__word(self.__current / self.__current_lsb)
+
+        if reg == self.__REG_TTE:
+            if self.__current >= 0:
+                return 0xffff
+
+            return self.__word(min(self.__charge / -self.__current * 3600.0 / 5.625, 0x7fff))
+
+        if reg == self.__REG_TTF:
+            if self.__current <= 0:
+                return 0xffff
+
+            remaining = self.__full_cap_mah() - self.__charge
+
+            return self.__word(min(remaining / self.__current * 3600.0 / 5.625, 0x7fff))
+
+        return self.__regs.get(reg, 0)
+
+
+    def __alert_bits(self):
+        values = (
+            (self.__REG_ALERT_VOLT, self.__voltage() / 0.02, False, 0x0100, 0x1000),
+            (self.__REG_ALERT_TEMP, self.__temperature, True, 0x0200, 0x2000),
+            (self.__REG_ALERT_CHARGE, self.__soc(), False, 0x0400, 0x4000),
+            (self.__REG_ALERT_CURRENT, self.__current / self.__conf.alert_current_lsb, True, 0x0004, 0x0040)
+        )
+
+        bits = 0
+
+        for reg, value, signed, min_bit, max_bit in values:
+            threshold = self.__regs.get(reg, 0)
+            minimum, maximum = threshold & 0xff, threshold >> 8
+
+            if signed:
+                minimum, maximum = self.__int8(minimum), self.__int8(maximum)
+
+            if value < minimum:
+                bits |= min_bit
+
+            if value > maximum:
+                bits |= max_bit
+
+        return bits
+
+
+    def __write_reg(self, reg, value):
+        if reg == self.__REG_MODEL_CFG and value & 0x8000:
+            self.__refresh_until = self.__now() + self.__REFRESH_TIME
+
+        if reg == self.__REG_FULL_CAP_REP:
+            self.__update()
+            soc = self.__soc()
+
+            self.__regs[reg] = value & 0xffff
+            self.__charge = self.__full_cap_mah() * soc / 100.0
+
+            return
+
+        self.__regs[reg] = value & 0xffff
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __update(self):
+        now = self.__now()
+        hours = (now - self.__updated) / 3600.0
+        self.__updated = now
+
+        full_cap = self.__full_cap_mah()
+        charge = min(max(self.__charge + self.__current * hours, 0.0), full_cap)
+
+        # cycles register LSB is 1% of a full cycle...
+        self.__cycle_fraction += abs(charge - self.__charge) / full_cap * 100.0
+
+        whole = int(self.__cycle_fraction)
+        self.__cycle_fraction -= whole
+        self.__regs[self.__REG_CYCLES] = (self.__regs.get(self.__REG_CYCLES, 0) + whole) & 0xffff
+
+        self.__charge = charge
+
+        # extremes: upper byte max, lower byte min...
+        self.__latch(self.__REG_MAX_MIN_TEMP, self.__temperature, True)
+        self.__latch(self.__REG_MAX_MIN_VOLT, self.__voltage() / 0.02, False)
+        self.__latch(self.__REG_MAX_MIN_CURRENT, self.__current / self.__conf.alert_current_lsb, True)
+
+
+    def __latch(self, reg, value, signed):
+        latched = self.__regs.get(reg, 0)
+        minimum, maximum = latched & 0xff, latched >> 8
+
+        if signed:
+            minimum, maximum = self.__int8(minimum), self.__int8(maximum)
+
+        low, high = (-128, 127) if signed else (0, 255)
+        value = min(max(int(round(value)), low), high)
+
+        minimum, maximum = min(minimum, value), max(maximum, value)
+
+        self.__regs[reg] = ((maximum & 0xff) << 8) | (minimum & 0xff)
+
+
+    def __now(self):
+        return time.monotonic() * self.__time_scale
+
+
+    def __full_cap_mah(self):
+        full_cap = self.__regs.get(self.__REG_FULL_CAP_REP) or self.__conf.des_cap      # register units
+
+        return full_cap * self.__capacity_lsb
+
+
+    def __soc(self):
+        return 100.0 * self.__charge / self.__full_cap_mah()
+
+
+    def __voltage(self):
+        soc = self.__soc()
+        curve = self.__curve
+
+        if soc <= curve[0][0]:
+            return curve[0][1]
+
+        for (soc0, v0), (soc1, v1) in zip(curve, curve[1:]):
+            if soc <= soc1:
+                return v0 + (v1 - v0) * (soc - soc0) / (soc1 - soc0)
+
+        return curve[-1][1]
+
+
+    @staticmethod
+    def __word(value):
+        return int(round(value)) & 0xffff
+
+
+    @staticmethod
+    def __int8(value):
+        return value - 0x100 if value & 0x80 else value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def transactions(self):
+        return self.__transactions
+
+
+    @property
+    def soc(self):
+        self.__update()
+        return round(self.__soc(), 1)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "Max17055Sim:{conf:%s, soc:%0.1f, current:%s, temperature:%s, tx_latency:%s, byte_time:%s, " \
+               "time_scale:%s, transactions:%s}" % \
+               (self.__conf, self.__soc(), self.__current, self.__temperature, self.__tx_latency, self.__byte_time,
+                self.__time_scale, self.transactions)
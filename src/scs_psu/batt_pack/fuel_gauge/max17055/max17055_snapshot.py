@@ -0,0 +1,181 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+A snapshot of the documented MAX17055 register map - 0x00 to 0x4f, 0xb0 to 0xbf and 0xd0 to 0xff. Values are held in
+their raw (16-bit unsigned int) form, in an array, in register order.
+
+Restoring writes the configuration and learned registers only - measurement and status registers are read-only
+or are maintained by the gauge.
+
+The binary form is a little-endian float64 POSIX timestamp followed by the register words. In the JSON form, the
+words are hex-encoded in the same way.
+
+Document example:
+{"taken-on": "2026-10-18T09:34:48Z", "regs": "0200..."}
+"""
+
+import struct
+
+from array import array
+from collections import OrderedDict
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import PersistentJSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Max17055Snapshot(PersistentJSONable):
+    """
+    classdocs
+    """
+
+    RANGES = ((0x00, 0x4f), (0xb0, 0xbf), (0xd0, 0xff))       # (first, last) documented registers
+
+    REGS = tuple(reg for first, last in RANGES for reg in range(first, last + 1))
+
+    RESTORABLE_REGS = (
+        0x01, 0x02, 0x03,                                       # VAlrtTh, TAlrtTh, SAlrtTh
+        0x18, 0x1d, 0x1e,                                       # DesignCap, Config, IChgTerm
+        0x28, 0x29, 0x2a, 0x2b,                                 # LearnCfg, FilterCfg, RelaxCfg, MiscCfg
+        0x2c, 0x2d, 0x2e, 0x2f,                                 # TGain, TOff, CGain, COff
+        0x12, 0x22, 0x32, 0x42,                                 # QRTable00 - QRTable30
+        0x3a, 0x49,                                             # VEmpty, ConvgCfg
+        0x38, 0x39, 0x23, 0x10,                                 # RComp0, TempCo, FullCapNom, FullCapRep
+        0x45, 0x46, 0x17,                                       # dQAcc, dPAcc, Cycles
+        0xb4, 0xba, 0xbb,                                       # IAlrtTh, HibCfg, Config2
+        0xdb                                                    # ModelCfg (the Refresh bit is not restored)
+    )
+
+    __HEADER =                  '<d'                            # POSIX timestamp
+
+    __FILENAME =                "max17055_snapshot.json"
+
+    @classmethod
+    def persistence_location(cls):
+        return cls.conf_dir(), cls.__FILENAME
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict, skeleton=False):
+        if not jdict:
+            return None
+
+        taken_on = LocalizedDatetime.construct_from_iso8601(jdict.get('taken-on'))
+        words = cls.__words_from_bytes(bytes.fromhex(jdict.get('regs')))
+
+        return cls(taken_on, words)
+
+
+    @classmethod
+    def construct_from_bytes(cls, encoded):
+        header_size = struct.calcsize(cls.__HEADER)
+
+        timestamp, = struct.unpack(cls.__HEADER, encoded[:header_size])
+        words = cls.__words_from_bytes(encoded[header_size:])
+
+        return cls(LocalizedDatetime.construct_from_timestamp(timestamp), words)
+
+
+    @classmethod
+    def construct_from_regs(cls, taken_on, regs):
+        return cls(taken_on, array('H', (regs[reg] for reg in cls.REGS)))
+
+
+    @classmethod
+    def __words_from_bytes(cls, encoded):
+        words = array('H')
+        words.frombytes(encoded)
+
+        if words.itemsize != 2 or len(words) != len(cls.REGS):
+            raise ValueError("expected %d words, got %d" % (len(cls.REGS), len(words)))
+
+        return cls.__little_endian(words)
+
+
+    @staticmethod
+    def __little_endian(words):
+        if struct.pack('=H', 1) != struct.pack('<H', 1):
+            words = array('H', words)
+            words.byteswap()
+
+        return words
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, taken_on, words):
+        """
+        Constructor
+        """
+        super().__init__()
+
+        self.__taken_on = taken_on                                  # LocalizedDatetime
+        self.__words = words                                        # array of unsigned int, in REGS order
+
+        self.__index = {reg: i for i, reg in enumerate(self.REGS)}
+
+
+    def __eq__(self, other):                                        # ignore taken_on
+        try:
+            return self.__words == other.words
+
+        except AttributeError:
+            return False
+
+
+    def __len__(self):
+        return len(self.__words)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def reg(self, reg):
+        return self.__words[self.__index[reg]]
+
+
+    def items(self):
+        return zip(self.REGS, self.__words)
+
+
+    def diff(self, other):
+        return OrderedDict((reg, (value, other.reg(reg))) for reg, value in self.items() if value != other.reg(reg))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_bytes(self):
+        timestamp = 0.0 if self.taken_on is None else self.taken_on.timestamp()
+
+        return struct.pack(self.__HEADER, timestamp) + self.__little_endian(self.__words).tobytes()
+
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['taken-on'] = None if self.taken_on is None else self.taken_on.as_iso8601()
+        jdict['regs'] = self.__little_endian(self.__words).tobytes().hex()
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def taken_on(self):
+        return self.__taken_on
+
+
+    @property
+    def words(self):
+        return self.__words
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "Max17055Snapshot:{taken_on:%s, regs:%d}" % (self.taken_on, len(self))
@@ -0,0 +1,114 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+The I2C bus interface used by the scs_psu drivers - the API of scs_host I2C.Utilities. Each driver accepts a bus
+object, so that a faster implementation, a recording proxy or a simulation may be used in place of the host bus.
+
+read_cmd(..) is a write-then-read operation: an implementation may perform it as a single combined transaction.
+read_cmds(..) performs several write-then-read operations on the current device - by default, one at a time.
+"""
+
+from abc import ABC, abstractmethod
+
+from scs_host.bus.i2c import I2C
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class I2CBus(ABC):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @abstractmethod
+    def open(self):
+        pass
+
+
+    @abstractmethod
+    def close(self):
+        pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @abstractmethod
+    def start_tx(self, addr):
+        pass
+
+
+    @abstractmethod
+    def end_tx(self):
+        pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @abstractmethod
+    def read(self, count):
+        pass
+
+
+    @abstractmethod
+    def read_cmd(self, cmd, count):
+        pass
+
+
+    def read_cmds(self, cmds, count):
+        return [self.read_cmd(cmd, count) for cmd in cmds]
+
+
+    @abstractmethod
+    def write_addr(self, addr, *values):
+        pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return self.__class__.__name__
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class HostI2CBus(I2CBus):
+    """
+    the scs_host I2C.Utilities bus
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def open(self):
+        I2C.Utilities.open()
+
+
+    def close(self):
+        I2C.Utilities.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def start_tx(self, addr):
+        I2C.Utilities.start_tx(addr)
+
+
+    def end_tx(self):
+        I2C.Utilities.end_tx()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def read(self, count):
+        return I2C.Utilities.read(count)
+
+
+    def read_cmd(self, cmd, count):
+        return I2C.Utilities.read_cmd(cmd, count)
+
+
+    def write_addr(self, addr, *values):
+        I2C.Utilities.write_addr(addr, *values)
@@ -0,0 +1,88 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+A minimum-gap timing policy for I2C transactions. The time of the end of the last transaction is recorded, and a
+new transaction waits only if it would otherwise start before the gap has elapsed - transactions that are naturally
+spaced apart are not delayed.
+
+A write that is to be verified by reading it back needs longer to take effect: where a settle time is given, the
+verify read waits for the settle time, rather than the gap, to elapse since the write.
+
+The gap and settle time are specified in microseconds, as in device datasheets.
+"""
+
+import time
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class I2CTiming(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, min_gap, write_settle=None):
+        """
+        Constructor
+        """
+        self.__min_gap = float(min_gap)                         # float         microseconds
+        self.__write_settle = self.__min_gap if write_settle is None else max(float(write_settle), self.__min_gap)
+
+        self.__last_tx = None                                   # float         monotonic seconds
+        self.__waits = 0                                        # int
+        self.__waited = 0.0                                     # float         seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def wait(self, settle=False):
+        if self.__last_tx is None:
+            return
+
+        gap = self.__write_settle if settle else self.__min_gap
+        remaining = self.__last_tx + gap / 1e6 - time.monotonic()
+
+        if remaining <= 0:
+            return
+
+        time.sleep(remaining)
+
+        self.__waits += 1
+        self.__waited += remaining
+
+
+    def mark(self):
+        self.__last_tx = time.monotonic()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def min_gap(self):
+        return self.__min_gap
+
+
+    @property
+    def write_settle(self):
+        return self.__write_settle
+
+
+    @property
+    def waits(self):
+        return self.__waits
+
+
+    @property
+    def waited(self):
+        return self.__waited
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "I2CTiming:{min_gap:%s, write_settle:%s, waits:%s, waited:%0.6f}" % \
+               (self.min_gap, self.write_settle, self.waits, self.waited)
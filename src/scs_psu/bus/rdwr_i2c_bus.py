@@ -0,0 +1,197 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+An I2C bus using the Linux i2c-dev I2C_RDWR ioctl. Every message carries its device address, so no I2C_SLAVE
+ioctl is required. A write-then-read is performed as a single combined transaction, with a repeated start between
+the command write and the data read, in one system call. read_cmds(..) packs several write-then-read pairs into
+one ioctl, up to the kernel limit of I2C_RDWR_IOCTL_MAX_MSGS messages per call.
+
+The kernel holds the adapter lock for the whole of an I2C_RDWR call, so each call is atomic on the bus. Within the
+process, start_tx(..) / end_tx() serialise access to the current device address.
+
+example:
+bus = RdwrI2CBus(1)
+psu = PSUOPCubeV1p1(controller, BattPackV2.construct(bus=bus), bus=bus)
+
+https://www.kernel.org/doc/html/latest/i2c/dev-interface.html
+https://github.com/torvalds/linux/blob/master/include/uapi/linux/i2c-dev.h
+"""
+
+import ctypes
+import errno
+import fcntl
+import os
+
+from threading import RLock
+
+from scs_psu.bus.i2c_bus import I2CBus
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class _I2CMsg(ctypes.Structure):
+    """
+    struct i2c_msg
+    """
+
+    _fields_ = [
+        ('addr', ctypes.c_uint16),
+        ('flags', ctypes.c_uint16),
+        ('len', ctypes.c_uint16),
+        ('buf', ctypes.POINTER(ctypes.c_uint8))
+    ]
+
+
+class _I2CRdwrIoctlData(ctypes.Structure):
+    """
+    struct i2c_rdwr_ioctl_data
+    """
+
+    _fields_ = [
+        ('msgs', ctypes.POINTER(_I2CMsg)),
+        ('nmsgs', ctypes.c_uint32)
+    ]
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RdwrI2CBus(I2CBus):
+    """
+    classdocs
+    """
+
+    __DEVICE =                  "/dev/i2c-%d"
+
+    __I2C_RDWR =                0x0707
+    __I2C_M_RD =                0x0001
+    __I2C_RDWR_MAX_MSGS =       42
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, bus_number):
+        """
+        Constructor
+        """
+        self.__device = self.__DEVICE % bus_number              # string
+
+        self.__fd = None                                        # int
+        self.__addr = None                                      # int
+
+        self.__lock = RLock()
+        self.__ioctls = 0                                       # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def open(self):
+        if self.__fd is not None:
+            return
+
+        self.__fd = os.open(self.__device, os.O_RDWR)
+
+
+    def close(self):
+        if self.__fd is None:
+            return
+
+        try:
+            os.close(self.__fd)
+        finally:
+            self.__fd = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def start_tx(self, addr):
+        self.__lock.acquire()
+        self.__addr = int(addr)
+
+
+    def end_tx(self):
+        self.__addr = None
+        self.__lock.release()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def read(self, count):
+        buffer = (ctypes.c_uint8 * count)()
+
+        self.__transfer([self.__read_msg(buffer)])
+
+        return list(buffer)
+
+
+    def read_cmd(self, cmd, count):
+        return self.read_cmds((cmd, ), count)[0]
+
+
+    def read_cmds(self, cmds, count):
+        cmd_buffers = [(ctypes.c_uint8 * 1)(cmd) for cmd in cmds]
+        read_buffers = [(ctypes.c_uint8 * count)() for _ in cmds]
+
+        msgs = []
+
+        for cmd_buffer, read_buffer in zip(cmd_buffers, read_buffers):
+            msgs.append(self.__write_msg(cmd_buffer))           # combined: repeated start between the pair
+            msgs.append(self.__read_msg(read_buffer))
+
+        for start in range(0, len(msgs), self.__I2C_RDWR_MAX_MSGS):
+            self.__transfer(msgs[start:start + self.__I2C_RDWR_MAX_MSGS])
+
+        return [list(read_buffer) for read_buffer in read_buffers]
+
+
+    def write_addr(self, addr, *values):
+        buffer = (ctypes.c_uint8 * (len(values) + 1))(addr, *values)
+
+        self.__transfer([self.__write_msg(buffer)])
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __write_msg(self, buffer):
+        return _I2CMsg(self.__current_addr(), 0, len(buffer), ctypes.cast(buffer, ctypes.POINTER(ctypes.c_uint8)))
+
+
+    def __read_msg(self, buffer):
+        return _I2CMsg(self.__current_addr(), self.__I2C_M_RD, len(buffer),
+                       ctypes.cast(buffer, ctypes.POINTER(ctypes.c_uint8)))
+
+
+    def __current_addr(self):
+        if self.__addr is None:
+            raise OSError(errno.EIO, "no transaction in progress")
+
+        return self.__addr
+
+
+    def __transfer(self, msgs):
+        if self.__fd is None:
+            raise OSError(errno.EBADF, "%s is not open" % self.__device)
+
+        msg_array = (_I2CMsg * len(msgs))(*msgs)
+        data = _I2CRdwrIoctlData(msg_array, len(msgs))
+
+        fcntl.ioctl(self.__fd, self.__I2C_RDWR, data)
+        self.__ioctls += 1
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def device(self):
+        return self.__device
+
+
+    @property
+    def ioctls(self):
+        return self.__ioctls
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "RdwrI2CBus:{device:%s, open:%s, ioctls:%s}" % (self.device, self.__fd is not None, self.ioctls)
@@ -0,0 +1,131 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+An asyncio adapter for a PSU driver, so that PSU calls can run on an event loop alongside other I/O.
+
+The drivers block - every call is therefore queued to a single-worker executor, which serialises access to the
+bus or UART without blocking the event loop. Any number of coroutines may await PSU calls concurrently: the calls
+are made in the order that they were queued.
+
+A streaming SerialPSU is already read by its own reader thread - status() then returns the latest decoded report
+directly, without queueing.
+
+https://docs.python.org/3/library/asyncio-eventloop.html#asyncio.loop.run_in_executor
+"""
+
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor
+
+from scs_psu.psu.serial_psu import SerialPSU
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AsyncPSU(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, psu, executor=None):
+        """
+        Constructor
+        """
+        self.__psu = psu                                        # PSU
+        self.__owns_executor = executor is None                 # a caller's executor is not shut down
+        self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.__class__.__name__) \
+            if executor is None else executor
+
+        self.__queued = 0                                       # int           calls awaiting the executor
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    async def open(self):
+        await self.__call(self.__psu.open)
+
+
+    async def close(self):
+        try:
+            await self.__call(self.__psu.close)
+        finally:
+            if self.__owns_executor:
+                self.__executor.shutdown(wait=False)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    async def status(self):
+        if self.is_streaming:
+            return self.__psu.status()                          # the latest report - does not block
+
+        return await self.__call(self.__psu.status)
+
+
+    async def version(self):
+        return await self.__call(self.__psu.version)
+
+
+    async def communicate(self, command):
+        return await self.__call(self.__psu.communicate, command)
+
+
+    async def communicate_all(self, commands):
+        if not isinstance(self.__psu, SerialPSU):
+            return [await self.communicate(command) for command in commands]
+
+        return await self.__call(self.__psu.communicate_all, tuple(commands))
+
+
+    async def read_learned_params(self):
+        batt_pack = self.__psu.batt_pack
+
+        if batt_pack is None:
+            return None
+
+        return await self.__call(batt_pack.read_learned_params)
+
+
+    async def start_streaming(self, status_interval=None):
+        if not isinstance(self.__psu, SerialPSU):
+            return
+
+        await self.__call(self.__psu.start_streaming, status_interval)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    async def __call(self, func, *args):
+        self.__queued += 1
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.__executor, func, *args)
+        finally:
+            self.__queued -= 1
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def psu(self):
+        return self.__psu
+
+
+    @property
+    def is_streaming(self):
+        return isinstance(self.__psu, SerialPSU) and self.__psu.is_streaming
+
+
+    @property
+    def queued(self):
+        return self.__queued
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "AsyncPSU:{psu:%s, queued:%s}" % (self.psu, self.queued)
@@ -0,0 +1,163 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+An asyncio PSU monitor, for applications that run on an event loop. A monitor task samples the PSU at the interval
+given by a PSUMonitorSchedule - serial PSUs are streamed, so that status reports are read by the reader thread.
+
+The latest report is available from status(), and each new report may be consumed as an async iterator:
+
+async for report in monitor.statuses():
+    ...
+
+Unlike PSUMonitor, the monitor does not initiate host shutdown - the application may act on the reports.
+"""
+
+import asyncio
+
+from scs_core.sys.logging import Logging
+
+from scs_psu.psu.async_psu import AsyncPSU
+from scs_psu.psu.psu_monitor_schedule import PSUMonitorSchedule
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AsyncPSUMonitor(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, psu, schedule=None, executor=None):
+        """
+        Constructor
+        """
+        self.__logger = Logging.getLogger()
+
+        self.__psu = AsyncPSU(psu, executor=executor)           # AsyncPSU
+        self.__schedule = PSUMonitorSchedule() if schedule is None else schedule
+
+        self.__task = None                                      # asyncio.Task
+        self.__updated = None                                   # asyncio.Condition, bound to the running loop
+
+        self.__status = None                                    # PSUReport
+        self.__generation = 0                                   # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    async def start(self):
+        if self.__task is not None:
+            return
+
+        self.__updated = asyncio.Condition()
+
+        await self.__psu.open()
+        await self.__psu.start_streaming()
+
+        self.__task = asyncio.create_task(self.__run())
+
+
+    async def stop(self):
+        if self.__task is None:
+            return
+
+        self.__task.cancel()
+
+        try:
+            await self.__task
+        except asyncio.CancelledError:
+            pass
+
+        self.__task = None
+
+        async with self.__updated:
+            self.__updated.notify_all()                         # release any waiting iterators
+
+        await self.__psu.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    async def __run(self):
+        charge_min = self.__psu.psu.charge_min()
+
+        while True:
+            try:
+                status = await self.__psu.status()
+
+            except Exception as ex:                             # the task must not end while iterators are waiting
+                self.__logger.error("AsyncPSUMonitor: %s" % repr(ex))
+                status = None
+
+            interval = self.__schedule.update(status, charge_min)
+
+            if status is not None and not status.is_null_datum():
+                async with self.__updated:
+                    self.__status = status
+                    self.__generation += 1
+                    self.__updated.notify_all()
+
+            await asyncio.sleep(interval)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    async def status(self, timeout=None):                      # None if no report is received before the timeout
+        if self.__status is not None or self.__task is None:
+            return self.__status
+
+        try:
+            async with self.__updated:
+                await asyncio.wait_for(self.__updated.wait_for(lambda: self.__status is not None or
+                                                               self.__task is None), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+        return self.__status
+
+
+    async def statuses(self):
+        generation = self.__generation
+
+        while self.__task is not None:
+            async with self.__updated:
+                await self.__updated.wait_for(lambda: self.__generation != generation or self.__task is None)
+
+                if self.__task is None:
+                    return
+
+                generation = self.__generation
+                status = self.__status
+
+            yield status
+
+
+    async def version(self):
+        return await self.__psu.version()
+
+
+    async def communicate(self, command):
+        return await self.__psu.communicate(command)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def psu(self):
+        return self.__psu
+
+
+    @property
+    def schedule(self):
+        return self.__schedule
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "AsyncPSUMonitor:{psu:%s, schedule:%s, generation:%s, running:%s}" % \
+               (self.psu, self.schedule, self.__generation, self.__task is not None)
@@ -0,0 +1,136 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+An in-process simulation of the UART of a serial PSU, for hardware-free testing. It may be used in place of the
+HostSerial of a SerialPSU.
+
+Each command line that is written is answered with one response line, after a fixed response time. Responses are
+given as a dict of command: response - a response may be a string, or a callable that takes the command's arguments
+and returns a string. Commands without a response are not answered, as with firmware that does not implement them.
+
+As with HostSerial, the port must be open to be used. Opens and lines written are counted, so that session and
+pipelining behaviour can be measured.
+"""
+
+import time
+
+from collections import deque
+from threading import Condition
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class HostSerialSim(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, responses, response_time=0.0):
+        """
+        Constructor
+        """
+        self.__responses = dict(responses)              # dict of command: string or callable(args)
+        self.__response_time = response_time            # seconds
+
+        self.__pending = deque()                        # deque of (due, line)
+        self.__condition = Condition()
+
+        self.__is_open = False
+        self.__opens = 0                                # int
+        self.__lines_written = 0                        # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def open(self, lock_timeout, comms_timeout):
+        with self.__condition:
+            self.__is_open = True
+            self.__opens += 1
+
+
+    def close(self):
+        with self.__condition:
+            self.__is_open = False
+            self.__pending.clear()                      # responses in flight are lost
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write_line(self, text, eol):
+        words = text.split()
+
+        with self.__condition:
+            if not self.__is_open:
+                raise ConnectionError("HostSerialSim: not open")
+
+            self.__lines_written += 1
+
+            response = self.__responses.get(words[0]) if words else None
+
+            if response is None:
+                return                                  # not answered
+
+            line = response(words[1:]) if callable(response) else response
+
+            self.__pending.append((time.monotonic() + self.__response_time, line))
+            self.__condition.notify_all()
+
+
+    def read_line(self, eol=None, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self.__condition:
+            while True:
+                if not self.__is_open:
+                    raise ConnectionError("HostSerialSim: not open")
+
+                now = time.monotonic()
+
+                if self.__pending and self.__pending[0][0] <= now:
+                    return self.__pending.popleft()[1]
+
+                if deadline is not None and now >= deadline:
+                    raise TimeoutError("HostSerialSim: no line within %s seconds" % timeout)
+
+                due = self.__pending[0][0] if self.__pending else None
+                waits = [t for t in (due, deadline) if t is not None]
+
+                self.__condition.wait(None if not waits else max(min(waits) - now, 0.0))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def set_response(self, command, response):
+        with self.__condition:
+            if response is None:
+                self.__responses.pop(command, None)
+            else:
+                self.__responses[command] = response
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def is_open(self):
+        return self.__is_open
+
+
+    @property
+    def opens(self):
+        return self.__opens
+
+
+    @property
+    def lines_written(self):
+        return self.__lines_written
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "HostSerialSim:{response_time:%s, is_open:%s, opens:%s, lines_written:%s, pending:%s}" % \
+               (self.__response_time, self.is_open, self.opens, self.lines_written, len(self.__pending))
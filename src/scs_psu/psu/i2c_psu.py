@@ -11,7 +11,7 @@ from abc import ABC
 from scs_core.data.json import JSONify
 from scs_core.psu.psu import PSU
 
-from scs_host.bus.i2c import I2C
+from scs_psu.bus.i2c_bus import HostI2CBus
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -30,17 +30,22 @@ class I2CPSU(PSU, ABC):
 
     # ----------------------------------------------------------------------------------------------------------------
 
+    def open(self):
+        self.bus.open()
+
+
     def close(self):
-        I2C.Utilities.close()
+        self.bus.close()
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, controller):
+    def __init__(self, controller, bus=None):
         """
         Constructor
         """
         self.__controller = controller                          # MCU
+        self.__bus = HostI2CBus() if bus is None else bus       # I2CBus
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -73,3 +78,8 @@ class I2CPSU(PSU, ABC):
     @property
     def controller(self):
         return self.__controller
+
+
+    @property
+    def bus(self):
+        return self.__bus
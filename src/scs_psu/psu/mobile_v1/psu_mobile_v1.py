@@ -8,8 +8,6 @@ Lightweight system Raspberry Pi Zero header + mobile power pack
 
 from scs_core.psu.psu_version import PSUVersion
 
-from scs_host.bus.i2c import I2C
-
 from scs_psu.psu.i2c_psu import I2CPSU
 from scs_psu.psu.mobile_v1.psu_status import PSUStatus
 
@@ -45,24 +43,24 @@ class PSUMobileV1(I2CPSU):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, controller):
+    def __init__(self, controller, bus=None):
         """
         Constructor
         """
-        super().__init__(controller)
+        super().__init__(controller, bus=bus)
 
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def open(self):
-        I2C.Utilities.open()
+        self.bus.open()
 
         self.controller.button_enable()
 
 
     def close(self):
-        I2C.Utilities.close()
+        self.bus.close()
 
 
     # ----------------------------------------------------------------------------------------------------------------
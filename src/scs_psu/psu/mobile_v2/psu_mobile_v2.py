@@ -8,8 +8,6 @@ Lightweight system Raspberry Pi Zero header + mobile power pack + fuel gauge
 
 from scs_core.psu.psu_version import PSUVersion
 
-from scs_host.bus.i2c import I2C
-
 from scs_psu.psu.i2c_psu import I2CPSU
 from scs_psu.psu.mobile_v2.psu_status import PSUStatus, ChargeStatus
 
@@ -45,11 +43,11 @@ class PSUMobileV2(I2CPSU):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, controller, batt_pack):
+    def __init__(self, controller, batt_pack, bus=None):
         """
         Constructor
         """
-        super().__init__(controller)
+        super().__init__(controller, bus=bus)
 
         self.__batt_pack = batt_pack                                # BattPackV1
 
@@ -57,7 +55,7 @@ class PSUMobileV2(I2CPSU):
     # ----------------------------------------------------------------------------------------------------------------
 
     def open(self):
-        I2C.Utilities.open()
+        self.bus.open()
         self.controller.button_enable()
 
 
@@ -4,7 +4,7 @@ Created on 29 Dec 2020
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 """
 
-from scs_host.bus.i2c import I2C
+from scs_psu.bus.i2c_bus import HostI2CBus
 
 from scs_psu.psu.opcube_v1.psu_status import ChargerStatus
 
@@ -34,11 +34,12 @@ class IOExpander(object):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, addr):
+    def __init__(self, addr, bus=None):
         """
         Constructor
         """
         self.__addr = int(addr)
+        self.__bus = HostI2CBus() if bus is None else bus               # I2CBus
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -70,29 +71,29 @@ class IOExpander(object):
 
     def __configure(self, configuration):
         try:
-            I2C.Utilities.start_tx(self.__addr)
-            I2C.Utilities.write_addr(self.__ADDR_CONFIG, configuration)
+            self.__bus.start_tx(self.__addr)
+            self.__bus.write_addr(self.__ADDR_CONFIG, configuration)
 
         finally:
-            I2C.Utilities.end_tx()
+            self.__bus.end_tx()
 
 
     def __input(self):
         try:
-            I2C.Utilities.start_tx(self.__addr)
-            return I2C.Utilities.read_cmd(self.__ADDR_INPUT, 1)
+            self.__bus.start_tx(self.__addr)
+            return self.__bus.read_cmd(self.__ADDR_INPUT, 1)
 
         finally:
-            I2C.Utilities.end_tx()
+            self.__bus.end_tx()
 
 
     def __output(self, byte):
         try:
-            I2C.Utilities.start_tx(self.__addr)
-            I2C.Utilities.write_addr(self.__ADDR_OUTPUT, byte)
+            self.__bus.start_tx(self.__addr)
+            self.__bus.write_addr(self.__ADDR_OUTPUT, byte)
 
         finally:
-            I2C.Utilities.end_tx()
+            self.__bus.end_tx()
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -112,11 +113,11 @@ class PCA9534A(IOExpander):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self):
+    def __init__(self, bus=None):
         """
         Constructor
         """
-        super().__init__(self.DEFAULT_ADDR)
+        super().__init__(self.DEFAULT_ADDR, bus=bus)
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -130,11 +131,11 @@ class PCA9849(IOExpander):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self):
+    def __init__(self, bus=None):
         """
         Constructor
         """
-        super().__init__(self.DEFAULT_ADDR)
+        super().__init__(self.DEFAULT_ADDR, bus=bus)
 
 
 
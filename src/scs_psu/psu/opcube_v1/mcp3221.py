@@ -6,7 +6,7 @@ Created on 29 Dec 2020
 
 from scs_core.data.datum import Decode
 
-from scs_host.bus.i2c import I2C
+from scs_psu.bus.i2c_bus import HostI2CBus
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -27,11 +27,12 @@ class MCP3221(object):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, addr):
+    def __init__(self, addr, bus=None):
         """
         Constructor
         """
         self.__addr = int(addr)
+        self.__bus = HostI2CBus() if bus is None else bus               # I2CBus
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -48,11 +49,11 @@ class MCP3221(object):
 
     def __convert(self):
         try:
-            I2C.Utilities.start_tx(self.__addr)
-            return I2C.Utilities.read(2)
+            self.__bus.start_tx(self.__addr)
+            return self.__bus.read(2)
 
         finally:
-            I2C.Utilities.end_tx()
+            self.__bus.end_tx()
 
 
     # ----------------------------------------------------------------------------------------------------------------
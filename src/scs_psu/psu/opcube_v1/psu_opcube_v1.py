@@ -10,8 +10,6 @@ from abc import ABC
 
 from scs_core.psu.psu_version import PSUVersion
 
-from scs_host.bus.i2c import I2C
-
 from scs_psu.psu.i2c_psu import I2CPSU
 
 from scs_psu.psu.opcube_v1.mcp3221 import MCP3221
@@ -40,11 +38,11 @@ class PSUOPCubeV1(I2CPSU, ABC):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, controller, batt_pack, charger, v_in_monitor):
+    def __init__(self, controller, batt_pack, charger, v_in_monitor, bus=None):
         """
         Constructor
         """
-        super().__init__(controller)
+        super().__init__(controller, bus=bus)
 
         self.__batt_pack = batt_pack                            # BattPackV2
         self.__charger = charger
@@ -54,7 +52,7 @@ class PSUOPCubeV1(I2CPSU, ABC):
     # ----------------------------------------------------------------------------------------------------------------
 
     def open(self):
-        I2C.Utilities.open()
+        self.bus.open()
         self.charger.init()
 
 
@@ -161,14 +159,14 @@ class PSUOPCubeV1p0(PSUOPCubeV1):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, controller, batt_pack):
+    def __init__(self, controller, batt_pack, bus=None):
         """
         uses TI PCA9534A GPIO chip
         """
-        charger = PCA9534A()
-        v_in_monitor = MCP3221(MCP3221.DEFAULT_ADDR)
+        charger = PCA9534A(bus=bus)
+        v_in_monitor = MCP3221(MCP3221.DEFAULT_ADDR, bus=bus)
 
-        super().__init__(controller, batt_pack, charger, v_in_monitor)
+        super().__init__(controller, batt_pack, charger, v_in_monitor, bus=bus)
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -187,11 +185,11 @@ class PSUOPCubeV1p1(PSUOPCubeV1):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, controller, batt_pack):
+    def __init__(self, controller, batt_pack, bus=None):
         """
         NXP PCA9849 remote 8-bit I/O expander
         """
-        charger = PCA9849()
-        v_in_monitor = MCP3221(MCP3221.DEFAULT_ADDR)
+        charger = PCA9849(bus=bus)
+        v_in_monitor = MCP3221(MCP3221.DEFAULT_ADDR, bus=bus)
 
-        super().__init__(controller, batt_pack, charger, v_in_monitor)
+        super().__init__(controller, batt_pack, charger, v_in_monitor, bus=bus)
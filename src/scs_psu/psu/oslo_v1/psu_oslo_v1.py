@@ -6,10 +6,9 @@ Created on 13 Nov 2017
 The Oslo PSU
 """
 
-import json
-
 from scs_psu.psu.serial_psu import SerialPSU
 from scs_psu.psu.oslo_v1.psu_status import PSUStatus
+from scs_psu.psu.status_codec import BinaryStatusCodec, CSVStatusCodec, JSONStatusCodec
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -38,6 +37,11 @@ class PSUOsloV1(SerialPSU):
         return PSUOsloV1.__BAUD_RATE
 
 
+    @classmethod
+    def status_codecs(cls):
+        return BinaryStatusCodec(PSUStatus.FRAME_LAYOUT), CSVStatusCodec(PSUStatus.FRAME_LAYOUT), JSONStatusCodec()
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __init__(self, uart):
@@ -49,19 +53,18 @@ class PSUOsloV1(SerialPSU):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def status(self):
-        response = self.communicate("state")
-
+    def _status_from_response(self, response):
         if response is None:
             return PSUStatus.null_datum()
 
         try:
-            return PSUStatus.construct_from_jdict(json.loads(response))
+            return PSUStatus.construct_from_jdict(self._decode_status_frame(response))
         except ValueError as ex:
             self._logger.error("status: %s" % repr(ex))
             return PSUStatus.null_datum()
 
 
+    # ----------------------------------------------------------------------------------------------------------------
 
     def charge_min(self):
         return None
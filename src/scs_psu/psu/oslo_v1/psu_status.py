@@ -6,6 +6,8 @@ Created on 13 Nov 2017
 document example:
 {"src": "Ov1", "standby": false, "in": true, "pwr-in": 12.5, "rst": "FF", "chgr": "TFFF", "batt-flt": false,
 "host-3v3": 3.3, "prot-batt": 8.9}
+
+compact frame layout - see scs_psu.psu.status_codec
 """
 
 from collections import OrderedDict
@@ -26,6 +28,9 @@ class PSUStatus(PSUReport):
     POWER_IN_MINIMUM =        7.0           # Volts
     BATTERY_MINIMUM =         6.4           # Volts
 
+    FRAME_LAYOUT = (('rst', 'f2'), ('standby', 'b'), ('chgr', 'f4'), ('batt-flt', 'b'),
+                    ('host-3v3', 'v'), ('pwr-in', 'v'), ('prot-batt', 'v'))
+
     __SOURCE = 'Ov1'
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -6,8 +6,6 @@ Created on 13 Nov 2017
 The prototype PSU
 """
 
-import json
-
 from scs_psu.psu.serial_psu import SerialPSU
 from scs_psu.psu.prototype_v1.psu_status import PSUStatus
 
@@ -49,20 +47,20 @@ class PSUPrototypeV1(SerialPSU):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def status(self):
-        response = self.communicate("state")
-
+    def _status_from_response(self, response):
         if response is None:
             return PSUStatus.null_datum()
 
         try:
-            jdict = json.loads(response)
+            jdict = self._decode_status_frame(response)
             return PSUStatus.construct_from_jdict(jdict)
 
         except (TypeError, ValueError):
             return None
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
     def charge_min(self):
         return None
 
@@ -0,0 +1,100 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+A PSU state transition, as published by PSUMonitor:
+
+* standby       bool        the standby (operator) request was raised or cleared
+* input         bool        input power was restored or lost
+* charge-band   int         the battery charge entered a new band - the lower bound of the band, as a percentage
+* shutdown      string      host shutdown was initiated - the reason
+
+Document example:
+{"rec": "2026-10-18T11:07:34Z", "evt": "input", "val": false}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PSUEvent(JSONable):
+    """
+    classdocs
+    """
+
+    STANDBY =           'standby'
+    INPUT =             'input'
+    CHARGE_BAND =       'charge-band'
+    SHUTDOWN =          'shutdown'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        rec = LocalizedDatetime.construct_from_iso8601(jdict.get('rec'))
+        name = jdict.get('evt')
+        value = jdict.get('val')
+
+        return cls(name, value, rec=rec)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, name, value, rec=None):
+        """
+        Constructor
+        """
+        self.__rec = LocalizedDatetime.now() if rec is None else rec        # LocalizedDatetime
+        self.__name = name                                                  # string
+        self.__value = value                                                # bool, int or string
+
+
+    def __eq__(self, other):
+        try:
+            return self.name == other.name and self.value == other.value
+
+        except (TypeError, AttributeError):
+            return False
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['rec'] = self.rec.as_iso8601()
+        jdict['evt'] = self.name
+        jdict['val'] = self.value
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def rec(self):
+        return self.__rec
+
+
+    @property
+    def name(self):
+        return self.__name
+
+
+    @property
+    def value(self):
+        return self.__value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "PSUEvent:{rec:%s, name:%s, value:%s}" % (self.rec, self.name, self.value)
@@ -0,0 +1,298 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+A publish / subscribe channel for PSU events, using Unix datagram sockets.
+
+Each subscriber binds its own socket in the channel directory. The publisher sends every event to every socket in
+the directory without blocking - an event is dropped for a subscriber whose queue is full, and the sockets of
+subscribers that have gone away are removed. A failure to reach one subscriber does not affect the others. A
+subscriber may block on its socket, or select() on fileno().
+
+The channel directory is held in the scs_host lock directory. It is accessible to its owner and group only, and is
+set-group-ID, so that subscriber sockets - writable by the group - take the group of the directory. The publisher and
+subscribers may then run as different users of that group, but events cannot be published or received by others.
+Where the directory already exists, it is used only if it is a real directory, inaccessible to other users, and owned
+by this user, by root, or by one of this user's groups.
+
+https://man7.org/linux/man-pages/man7/unix.7.html
+"""
+
+import json
+import os
+import socket
+import stat
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+
+from scs_core.sys.logging import Logging
+
+from scs_host.sys.host import Host
+
+from scs_psu.psu.psu_event import PSUEvent
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PSUEventChannel(object):
+    """
+    classdocs
+    """
+
+    __DIRNAME =                 "scs-psu-events"
+    __SUFFIX =                  ".sock"
+
+    __DIRECTORY_MODE =          0o2770
+    __SOCKET_MODE =             0o660
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def default_directory(cls):
+        return os.path.join(Host.lock_dir(), cls.__DIRNAME)
+
+
+    @classmethod
+    def suffix(cls):
+        return cls.__SUFFIX
+
+
+    @classmethod
+    def socket_mode(cls):
+        return cls.__SOCKET_MODE
+
+
+    @classmethod
+    def make_directory(cls, directory):
+        os.makedirs(os.path.dirname(os.path.abspath(directory)), exist_ok=True)
+
+        try:
+            os.mkdir(directory, cls.__DIRECTORY_MODE)
+
+        except FileExistsError:
+            cls.check_directory(directory)                      # possibly created by another user
+            return
+
+        os.chmod(directory, cls.__DIRECTORY_MODE)               # regardless of umask
+
+
+    @classmethod
+    def check_directory(cls, directory):
+        st = os.lstat(directory)
+
+        if not stat.S_ISDIR(st.st_mode):
+            raise PermissionError("PSUEventChannel: %s is not a directory" % directory)
+
+        if st.st_mode & stat.S_IRWXO:
+            raise PermissionError("PSUEventChannel: %s is accessible to other users: %o" %
+                                  (directory, stat.S_IMODE(st.st_mode)))
+
+        if st.st_uid not in (os.geteuid(), 0) and st.st_gid not in os.getgroups() + [os.getegid()]:
+            raise PermissionError("PSUEventChannel: %s is owned by uid %d gid %d" % (directory, st.st_uid, st.st_gid))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, directory=None):
+        """
+        Constructor
+        """
+        self.__directory = self.default_directory() if directory is None else directory
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def publisher(self):
+        return PSUEventPublisher(self.directory)
+
+
+    def subscribe(self):
+        return PSUEventSubscriber(self.directory)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def directory(self):
+        return self.__directory
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "PSUEventChannel:{directory:%s}" % self.directory
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PSUEventPublisher(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, directory):
+        """
+        Constructor
+        """
+        self.__directory = directory                            # string
+        self.__logger = Logging.getLogger()
+
+        self.__socket = None                                    # socket
+        self.__published = 0                                    # int
+        self.__dropped = 0                                      # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def open(self):
+        if self.__socket is not None:
+            return
+
+        PSUEventChannel.make_directory(self.__directory)
+
+        self.__socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.__socket.setblocking(False)
+
+
+    def close(self):
+        if self.__socket is None:
+            return
+
+        try:
+            self.__socket.close()
+        finally:
+            self.__socket = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def publish(self, event):
+        self.open()
+
+        datagram = JSONify.dumps(event).encode()
+
+        for name in os.listdir(self.__directory):
+            if not name.endswith(PSUEventChannel.suffix()):
+                continue
+
+            path = os.path.join(self.__directory, name)
+
+            try:
+                self.__socket.sendto(datagram, path)
+
+            except BlockingIOError:
+                self.__dropped += 1                             # the subscriber is not keeping up
+                continue
+
+            except (ConnectionRefusedError, FileNotFoundError):
+                self.__remove(path)                             # the subscriber has gone away
+                continue
+
+            except OSError as ex:
+                self.__dropped += 1
+                self.__logger.error("PSUEventPublisher: %s: %s" % (name, repr(ex)))
+                continue
+
+        self.__published += 1
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __remove(self, path):
+        try:
+            os.unlink(path)
+
+        except FileNotFoundError:
+            pass
+
+        except OSError as ex:
+            self.__logger.error("PSUEventPublisher: unable to remove %s: %s" % (path, repr(ex)))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def published(self):
+        return self.__published
+
+
+    @property
+    def dropped(self):
+        return self.__dropped
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "PSUEventPublisher:{directory:%s, open:%s, published:%s, dropped:%s}" % \
+               (self.__directory, self.__socket is not None, self.published, self.dropped)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PSUEventSubscriber(object):
+    """
+    classdocs
+    """
+
+    __MAX_DATAGRAM =            1024            # bytes
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, directory):
+        """
+        Constructor
+        """
+        PSUEventChannel.make_directory(directory)
+
+        self.__path = os.path.join(directory, "%d-%x%s" % (os.getpid(), id(self), PSUEventChannel.suffix()))
+
+        self.__socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.__socket.bind(self.__path)
+
+        os.chmod(self.__path, PSUEventChannel.socket_mode())    # the publisher may run as another user of the group
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def receive(self, timeout=None):                            # returns None on timeout
+        self.__socket.settimeout(timeout)
+
+        try:
+            datagram = self.__socket.recv(self.__MAX_DATAGRAM)
+        except socket.timeout:
+            return None
+
+        return PSUEvent.construct_from_jdict(json.loads(datagram.decode(), object_pairs_hook=OrderedDict))
+
+
+    def fileno(self):
+        return self.__socket.fileno()
+
+
+    def close(self):
+        try:
+            self.__socket.close()
+        finally:
+            try:
+                os.unlink(self.__path)
+            except FileNotFoundError:
+                pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def path(self):
+        return self.__path
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "PSUEventSubscriber:{path:%s}" % self.path
@@ -11,17 +11,27 @@ Alternatively, ignore inhibitors and users with 'systemctl poweroff -i'.
 import time
 
 from collections import OrderedDict
-from multiprocessing import Manager
 
+from scs_core.data.datetime import LocalizedDatetime
 
 from scs_core.psu.psu import PSU
 from scs_core.psu.psu_event_log import PSUEventLog
 
-from scs_core.sync.interval_timer import IntervalTimer
 from scs_core.sync.synchronised_process import SynchronisedProcess
 
 from scs_core.sys.logging import Logging
 
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_params_trigger import Max17055ParamsTrigger
+
+from scs_psu.psu.psu_event import PSUEvent
+from scs_psu.psu.psu_event_channel import PSUEventChannel
+from scs_psu.psu.psu_monitor_schedule import PSUMonitorSchedule
+from scs_psu.psu.psu_status_history import PSUStatusHistory
+from scs_psu.psu.psu_status_server import PSUStatusServer
+from scs_psu.psu.psu_status_slot import PSUStatusSlot
+from scs_psu.psu.serial_psu import SerialPSU
+from scs_psu.psu.status_codec_record import StatusCodecRecord
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -29,30 +39,44 @@ class PSUMonitor(SynchronisedProcess):
     """
     classdocs
     """
-    __MONITOR_INTERVAL =        3.0             # seconds   (was 1.0)
+    __ALERT_INTERVAL =          60.0            # seconds   full gauge telemetry in alert mode
+    __CHARGE_BAND =             10              # percent   width of the bands reported by charge-band events
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, host, psu: PSU, ignore_standby, ignore_threshold):
+    def __init__(self, host, psu: PSU, ignore_standby, ignore_threshold, touch_watchdog=False, stream=False,
+                 alert_mode=False, schedule=None, events=None, serve=False):
         """
         Constructor
         """
         self.__logger = Logging.getLogger()
         self.__logging_specification = Logging.specification()
 
-        manager = Manager()
+        SynchronisedProcess.__init__(self, value=PSUStatusSlot())
 
-        SynchronisedProcess.__init__(self, value=manager.list())
+        self.__history = PSUStatusHistory()                                 # shared with the monitor process
+        self.__schedule = PSUMonitorSchedule() if schedule is None else schedule
+        self.__events = PSUEventChannel() if events is None else events
 
         self.__host = host                                                  # Host
         self.__psu = psu                                                    # PSU
 
         self.__ignore_standby = ignore_standby                              # bool
         self.__ignore_threshold = ignore_threshold                          # bool
+        self.__touch_watchdog = touch_watchdog                              # bool
+        self.__stream = stream                                              # bool     serial PSUs only
+        self.__alert_mode = alert_mode                                      # bool     batt pack PSUs only
+        self.__serve = serve                                                # bool     serve cached state locally
 
         self.__shutdown_initiated = False
-        self.__prev_charge = None
+        self.__params_trigger = None
         self.__prev_params = None
+        self.__publisher = None                                             # PSUEventPublisher, monitor process only
+        self.__prev_status = None
+        self.__server = None                                                # PSUStatusServer, monitor process only
+
+        self.__decoded_sample = (None, None)                                # (generation, PSUReport) client-side
+        self.__version = None                                               # PSUVersion
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -67,12 +91,37 @@ class PSUMonitor(SynchronisedProcess):
             if version:
                 version.save(self.__host)
 
+            self.__version = version
+
+            # compact status frames, where the firmware supports them...
+            if isinstance(self.__psu, SerialPSU):
+                codec = self.__status_codec(version)
+                self.__logger.info("status codec: %s" % codec.name())
+
             super().start()
 
         except KeyboardInterrupt:
             pass
 
 
+    def __status_codec(self, version):
+        # negotiated only when the firmware version changes...
+        record = StatusCodecRecord.load(self.__host)
+
+        if record is not None and record.is_for(version):
+            codec = self.__psu.select_codec(record.codec)
+
+            if codec is not None:
+                return codec
+
+        codec = self.__psu.negotiate_codec()
+
+        if version is not None:
+            StatusCodecRecord(version.id, version.tag, codec.name()).save(self.__host)
+
+        return codec
+
+
     def stop(self):
         try:
             super().stop()
@@ -96,23 +145,47 @@ class PSUMonitor(SynchronisedProcess):
             if params:
                 self.__logger.info("battery pack initialised: %s" % params)
 
+            self.__params_trigger = Max17055ParamsTrigger(batt_pack.param_save_interval())
+
+            # alert mode: the gauge Status register is polled, and telemetry read on alert...
+            if self.__alert_mode:
+                if batt_pack.program_alerts():
+                    batt_pack.set_alert_mode(self.__ALERT_INTERVAL)
+                else:
+                    self.__logger.error("unable to program fuel gauge alerts")
+
+        # events...
+        self.__publisher = self.__events.publisher()
+
+        # server: answers local clients from cached state...
+        if self.__serve:
+            self.__server = PSUStatusServer(self.__handle_request)
+            self.__server.start()
+
+        # streaming: the UART is held by this process...
+        if self.__stream and isinstance(self.__psu, SerialPSU):
+            self.__psu.start_streaming()
+
         # monitor PSU...
         try:
-            timer = IntervalTimer(self.__MONITOR_INTERVAL)
+            charge_min = self.__psu.charge_min()
 
-            while timer.true():
-                status = self.__psu.status()
+            while self.__schedule.wait():
+                status = self.__status(self.__due_commands())
+                self.__schedule.update(status, charge_min, update_period=self.__gauge_update_period(batt_pack))
 
                 # report...
-                with self._lock:
-                    status.as_list(self._value)
+                self.__report(status)
 
                 if status.is_null_datum():
                     self.__logger.error('unable to obtain status report')
                     continue
 
+                # transitions...
+                self.__publish_transitions(status)
+
                 # fuel gauge...
-                self.__save_fuel_gauge_params(batt_pack)
+                self.__save_fuel_gauge_params(batt_pack, status.batt_percent)
 
                 # input_power_lost...
                 if not status.input_power_present:
@@ -122,18 +195,137 @@ class PSUMonitor(SynchronisedProcess):
                 if not self.__ignore_standby and status.standby:
                     self.__enter_host_shutdown("operator request")
 
-                if not self.__ignore_threshold and status.below_power_threshold(self.__psu.charge_min()):
+                if not self.__ignore_threshold and status.below_power_threshold(charge_min):
                     self.__enter_host_shutdown("below power threshold")
 
         except (ConnectionError, KeyboardInterrupt, SystemExit):
             pass
 
+        finally:
+            self.__publisher.close()
+
+            if self.__server is not None:
+                self.__server.stop()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # process status and commands...
+
+    def __report(self, status):
+        # an oversized report is not shared - the previous report remains in the slot...
+        try:
+            self._value.write(status)                                       # single writer - no lock required
+        except ValueError as ex:
+            self.__logger.error("status not shared: %s" % ex)
+
+        try:
+            self.__history.append(status)
+        except ValueError as ex:
+            self.__logger.error("status not recorded: %s" % ex)
+
+
+    def __due_commands(self):
+        commands = []
+
+        if self.__touch_watchdog:
+            commands.append("w-touch")
+
+        return commands
+
+
+    def __status(self, commands):
+        if commands and isinstance(self.__psu, SerialPSU):
+            status, _ = self.__psu.status_with(commands)                    # a single pipelined exchange
+            return status
+
+        status = self.__psu.status()
+
+        for command in commands:
+            self.__psu.communicate(command)
+
+        return status
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # server requests - answered from cached state, without hardware access...
+
+    def __handle_request(self, command, args):
+        if command == 'status':
+            _, jdict = self._value.read()
+            return jdict
+
+        if command == 'version':
+            return self.__version
+
+        if command == 'history':
+            since = int(args[0]) if len(args) > 0 else None
+            limit = int(args[1]) if len(args) > 1 else None
+
+            return [OrderedDict((('seq', seq), ('rec', LocalizedDatetime.construct_from_timestamp(timestamp)),
+                                 ('status', jdict)))
+                    for seq, timestamp, jdict in self.__history.history(since=since, limit=limit)]
+
+        if command == 'batt':
+            batt_pack = self.__psu.batt_pack
+            return None if batt_pack is None else batt_pack.last_sample
+
+        raise ValueError("unknown command: %s" % command)
+
 
     # ----------------------------------------------------------------------------------------------------------------
     # process special operations...
 
-    def __save_fuel_gauge_params(self, batt_pack):
+    @staticmethod
+    def __gauge_update_period(batt_pack):
         if batt_pack is None:
+            return None
+
+        try:
+            return batt_pack.update_period(batt_pack.last_sample)        # hibernate policy is cached by the gauge
+
+        except OSError:
+            return None
+
+
+    def __publish_transitions(self, status):
+        prev = self.__prev_status
+        self.__prev_status = status
+
+        if prev is None:
+            return
+
+        if status.standby != prev.standby:
+            self.__publish(PSUEvent(PSUEvent.STANDBY, status.standby))
+
+        if status.input_power_present != prev.input_power_present:
+            self.__publish(PSUEvent(PSUEvent.INPUT, status.input_power_present))
+
+        band = self.__charge_band(status.batt_percent)
+
+        if band is not None and band != self.__charge_band(prev.batt_percent):
+            self.__publish(PSUEvent(PSUEvent.CHARGE_BAND, band))
+
+
+    def __publish(self, event):
+        try:
+            self.__publisher.publish(event)
+
+        except OSError as ex:
+            self.__logger.error("publish: %s" % repr(ex))
+
+
+    @classmethod
+    def __charge_band(cls, charge):
+        return None if charge is None else int(charge // cls.__CHARGE_BAND) * cls.__CHARGE_BAND
+
+
+    def __save_fuel_gauge_params(self, batt_pack, charge):
+        if batt_pack is None:
+            return
+
+        cycles = batt_pack.cycles                       # cached by the gauge - usually costs no I2C traffic
+
+        if not self.__params_trigger.is_due(cycles, charge):
             return
 
         params = batt_pack.read_learned_params()
@@ -141,6 +333,8 @@ class PSUMonitor(SynchronisedProcess):
         if params is None:
             return
 
+        self.__params_trigger.saved(params.cycles, charge)
+
         if self.__prev_params is not None and params == self.__prev_params:
             return
 
@@ -160,6 +354,8 @@ class PSUMonitor(SynchronisedProcess):
         self.__logger.info("shutdown: %s" % reason)
         PSUEventLog.save_event(self.__host, "shutdown: %s" % reason, trim=True)
 
+        self.__publish(PSUEvent(PSUEvent.SHUTDOWN, reason))
+
         # self.__psu.power_peripherals(False)           # see Tim email on 2021-03-24
 
         time.sleep(2.0)                                 # allow reporting to be completed
@@ -171,14 +367,41 @@ class PSUMonitor(SynchronisedProcess):
     # data retrieval for client process...
 
     def firmware(self):
+        if self.__stream and isinstance(self.__psu, SerialPSU):
+            return self.__version                                           # the UART is held by the monitor process
+
         return self.__psu.version()
 
 
     def sample(self):
-        with self._lock:
-            status = self.__psu.report_class().construct_from_jdict(OrderedDict(self._value))
+        generation, report = self.__decoded_sample                          # a single tuple is swapped atomically
 
-        return status
+        if generation == self._value.generation:
+            return report
+
+        generation, jdict = self._value.read()
+        report = self.__psu.report_class().construct_from_jdict(jdict)
+
+        self.__decoded_sample = (generation, report)
+
+        return report
+
+
+    def history(self, since=None, limit=None):
+        # returns list of (seq, LocalizedDatetime, PSUReport), oldest first - pass the last seq as since...
+        report_class = self.__psu.report_class()
+
+        return [(seq, LocalizedDatetime.construct_from_timestamp(timestamp), report_class.construct_from_jdict(jdict))
+                for seq, timestamp, jdict in self.__history.history(since=since, limit=limit)]
+
+
+    def subscribe(self):
+        return self.__events.subscribe()                                    # the caller must close the subscriber
+
+
+    @property
+    def interval(self):
+        return self.__schedule.interval                                     # the monitor's current period
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -186,7 +409,9 @@ class PSUMonitor(SynchronisedProcess):
     def __str__(self, *args, **kwargs):
         host_name = None if self.__host is None else self.__host.name()
 
-        return "PSUMonitor:{value:%s, host:%s, psu:%s, ignore_standby:%s, ignore_threshold:%s, prev_charge:%s, " \
-               "shutdown_initiated:%s}" % \
-               (self._value, host_name, self.__psu, self.__ignore_standby, self.__ignore_threshold, self.__prev_charge,
-                self.__shutdown_initiated)
+        return "PSUMonitor:{value:%s, history:%s, schedule:%s, events:%s, host:%s, psu:%s, ignore_standby:%s, " \
+               "ignore_threshold:%s, touch_watchdog:%s, stream:%s, alert_mode:%s, serve:%s, " \
+               "server:%s, params_trigger:%s, shutdown_initiated:%s}" % \
+               (self._value, self.__history, self.__schedule, self.__events, host_name, self.__psu,
+                self.__ignore_standby, self.__ignore_threshold, self.__touch_watchdog, self.__stream, self.__alert_mode,
+                self.__serve, self.__server, self.__params_trigger, self.__shutdown_initiated)
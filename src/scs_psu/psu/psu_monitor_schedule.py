@@ -0,0 +1,197 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+An adaptive monitoring interval for PSUMonitor, driven by the latest PSU report:
+
+* input power present: the mains interval
+* on battery, with a time to empty: the estimated time until charge_min is reached, divided by SAMPLES_TO_THRESHOLD
+* on battery, without a time to empty: scaled between floor and ceiling by the charge remaining above charge_min
+* no report, or no charge reported: the default interval
+
+The interval is always held between floor and ceiling. On battery, the floor is raised to the fuel gauge update
+period, where this is given - sampling faster than the gauge updates returns the same values.
+
+When a transition is seen - standby requested, or input power gained or lost - the floor interval is used for the
+following TRANSITION_SAMPLES samples, so that the consequences of the transition are seen promptly.
+
+The mains interval is longer than the ceiling: on input power, no shutdown threshold is approached. Where the PSU
+watchdog is touched by the monitor, both the ceiling and the mains interval must be shorter than the watchdog interval.
+
+The current interval is held in shared memory, so that client processes can report it.
+"""
+
+import ctypes
+import time
+
+from multiprocessing.sharedctypes import RawValue
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PSUMonitorSchedule(object):
+    """
+    classdocs
+    """
+
+    SAMPLES_TO_THRESHOLD =      20              # samples before the shutdown threshold is reached
+    TRANSITION_SAMPLES =        5               # samples at the floor interval following a transition
+
+    __DEFAULT_FLOOR =           1.0             # seconds
+    __DEFAULT_INTERVAL =        3.0             # seconds
+    __DEFAULT_CEILING =         3.0             # seconds
+    __DEFAULT_MAINS_INTERVAL =  10.0            # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, floor=None, ceiling=None, mains_interval=None, watchdog_interval=None):
+        """
+        Constructor
+        """
+        self.__floor = self.__DEFAULT_FLOOR if floor is None else float(floor)
+        self.__ceiling = self.__DEFAULT_CEILING if ceiling is None else float(ceiling)
+        self.__watchdog_interval = watchdog_interval                        # seconds, or None if not touched
+
+        if mains_interval is not None:
+            self.__mains_interval = float(mains_interval)
+
+        elif watchdog_interval is not None:
+            self.__mains_interval = max(min(self.__DEFAULT_MAINS_INTERVAL, watchdog_interval / 2), self.__floor)
+
+        else:
+            self.__mains_interval = self.__DEFAULT_MAINS_INTERVAL
+
+        if self.__floor <= 0 or self.__ceiling < self.__floor or self.__mains_interval < self.__floor:
+            raise ValueError("floor: %s ceiling: %s mains_interval: %s" % (floor, ceiling, mains_interval))
+
+        if watchdog_interval is not None and max(self.__ceiling, self.__mains_interval) >= watchdog_interval:
+            raise ValueError("ceiling: %s mains_interval: %s watchdog_interval: %s" %
+                             (self.__ceiling, self.__mains_interval, watchdog_interval))
+
+        self.__interval = RawValue(ctypes.c_double, self.__clamp(self.__DEFAULT_INTERVAL))
+
+        self.__next_due = None                                              # monotonic, monitor process only
+        self.__prev_status = None                                           # monitor process only
+        self.__transition_samples = 0                                       # monitor process only
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def wait(self):
+        now = time.monotonic()
+
+        if self.__next_due is None:
+            self.__next_due = now
+
+        try:
+            if self.__next_due > now:
+                time.sleep(self.__next_due - now)
+
+        except KeyboardInterrupt:
+            return False
+
+        return True
+
+
+    def update(self, status, charge_min, update_period=None):
+        if self.__is_transition(status):
+            self.__transition_samples = self.TRANSITION_SAMPLES
+
+        interval = self.interval_for(status, charge_min, update_period=update_period)
+
+        if self.__transition_samples > 0:
+            self.__transition_samples -= 1
+            interval = self.__floor
+
+        self.__interval.value = interval
+
+        if self.__next_due is not None:
+            self.__next_due = max(self.__next_due + interval, time.monotonic())     # no catching up after an overrun
+
+        return interval
+
+
+    def interval_for(self, status, charge_min, update_period=None):
+        if status is None or status.is_null_datum():
+            return self.__clamp(self.__DEFAULT_INTERVAL)
+
+        if status.input_power_present:
+            return self.__mains_interval
+
+        charge = status.batt_percent
+
+        if charge is None:
+            return self.__clamp(self.__DEFAULT_INTERVAL)
+
+        floor = self.__floor if update_period is None else max(self.__floor, update_period)
+
+        threshold = 0 if charge_min is None else charge_min
+        margin = charge - threshold
+
+        if margin <= 0:
+            return self.__clamp(floor, floor=floor)
+
+        charge_status = status.charge_status
+        tte = None if charge_status is None else getattr(charge_status, 'tte', None)
+
+        if tte is not None and charge > 0:
+            time_to_threshold = tte.total_seconds() * margin / charge
+            return self.__clamp(time_to_threshold / self.SAMPLES_TO_THRESHOLD, floor=floor)
+
+        return self.__clamp(floor + (self.__ceiling - floor) * margin / (100 - threshold), floor=floor)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __is_transition(self, status):
+        if status is None or status.is_null_datum():
+            return False
+
+        prev = self.__prev_status
+        self.__prev_status = status
+
+        if prev is None:
+            return False
+
+        return status.standby != prev.standby or status.input_power_present != prev.input_power_present
+
+
+    def __clamp(self, interval, floor=None):
+        floor = self.__floor if floor is None else floor
+
+        return min(max(interval, floor), self.__ceiling)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def floor(self):
+        return self.__floor
+
+
+    @property
+    def ceiling(self):
+        return self.__ceiling
+
+
+    @property
+    def mains_interval(self):
+        return self.__mains_interval
+
+
+    @property
+    def watchdog_interval(self):
+        return self.__watchdog_interval
+
+
+    @property
+    def interval(self):
+        return self.__interval.value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "PSUMonitorSchedule:{floor:%s, ceiling:%s, mains_interval:%s, watchdog_interval:%s, interval:%s}" % \
+               (self.floor, self.ceiling, self.mains_interval, self.watchdog_interval, self.interval)
@@ -0,0 +1,137 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+A client for the PSUStatusServer of a running PSUMonitor. Responses are returned as jdicts - reports may be
+constructed with the report_class() of the PSU.
+
+The connection is opened on first use, and is held until close() is called.
+"""
+
+import json
+import socket
+
+from collections import OrderedDict
+
+from scs_psu.psu.psu_status_server import PSUStatusServer
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PSUStatusClient(object):
+    """
+    classdocs
+    """
+
+    __TIMEOUT =                 2.0             # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, path=None, timeout=None):
+        """
+        Constructor
+        """
+        self.__path = PSUStatusServer.default_path() if path is None else path
+        self.__timeout = self.__TIMEOUT if timeout is None else timeout
+
+        self.__socket = None                                    # socket
+        self.__file = None                                      # buffered reader / writer
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def open(self):
+        if self.__socket is not None:
+            return
+
+        self.__socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.__socket.settimeout(self.__timeout)
+
+        try:
+            self.__socket.connect(self.__path)
+
+        except OSError:
+            self.close()
+            raise
+
+        self.__file = self.__socket.makefile('rwb')
+
+
+    def close(self):
+        if self.__socket is None:
+            return
+
+        try:
+            if self.__file is not None:
+                self.__file.close()
+
+            self.__socket.close()
+
+        finally:
+            self.__file = None
+            self.__socket = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def status(self):
+        return self.request('status')
+
+
+    def version(self):
+        return self.request('version')
+
+
+    def history(self, since=None, limit=None):
+        args = [] if since is None else [since]
+
+        if limit is not None:
+            args = [0 if since is None else since, limit]
+
+        return self.request('history', *args)
+
+
+    def batt(self):
+        return self.request('batt')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def request(self, command, *args):
+        self.open()
+
+        try:
+            self.__file.write((' '.join([command] + [str(arg) for arg in args]) + '\n').encode())
+            self.__file.flush()
+
+            line = self.__file.readline()
+
+        except OSError:
+            self.close()
+            raise
+
+        if not line:
+            self.close()
+            raise ConnectionError("the server closed the connection")
+
+        response = json.loads(line.decode(), object_pairs_hook=OrderedDict)
+
+        if isinstance(response, dict) and list(response.keys()) == ['error']:
+            raise ValueError(response['error'])
+
+        return response
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def path(self):
+        return self.__path
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "PSUStatusClient:{path:%s, timeout:%s, open:%s}" % \
+               (self.path, self.__timeout, self.__socket is not None)
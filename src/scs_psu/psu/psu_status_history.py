@@ -0,0 +1,160 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+A fixed-capacity shared memory ring buffer of timestamped PSU reports, written by the PSUMonitor process and read by
+any process that inherits the buffer.
+
+Each report is held as compact UTF-8 JSON. The reports are packed end to end in a ring of bytes, wrapping at its
+end, so that no space is lost to padding. The position, length and POSIX timestamp of each report are held in
+parallel typed arrays, indexed by sequence number. Positions are absolute - the number of bytes written before the
+report - so that a reader can tell whether the bytes of a report have since been overwritten.
+
+Reports are numbered in sequence from 1. The single writer reserves the bytes of a report, fills them, then
+publishes the report by advancing the count. Readers take no lock. A reader discards any report whose index entry or
+bytes may have been written to while it was copying them - the index entry being written holds the oldest report,
+so that at most capacity - 1 reports are available, and fewer where the reports do not fit in the ring.
+
+Clients pass the sequence number of the last report that they received as since, and receive the reports that
+followed, oldest first - a client that stalls for less than the span of the buffer loses no reports.
+"""
+
+import ctypes
+import json
+import time
+
+from collections import OrderedDict
+from multiprocessing.sharedctypes import RawArray, RawValue
+
+from scs_core.data.json import JSONify
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PSUStatusHistory(object):
+    """
+    classdocs
+    """
+
+    __DEFAULT_CAPACITY =        600             # reports - 30 minutes at 3 second intervals
+    __DEFAULT_BUFFER_SIZE =     98304           # bytes - 160 bytes per report, on average
+
+    __SEPARATORS =              (',', ':')      # compact JSON
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, capacity=None, buffer_size=None):
+        """
+        Constructor
+        """
+        self.__capacity = self.__DEFAULT_CAPACITY if capacity is None else int(capacity)
+        self.__buffer_size = self.__DEFAULT_BUFFER_SIZE if buffer_size is None else int(buffer_size)
+
+        self.__count = RawValue(ctypes.c_uint64, 0)                         # reports published
+        self.__reserved = RawValue(ctypes.c_uint64, 0)                      # bytes written, or being written
+
+        self.__positions = RawArray(ctypes.c_uint64, self.__capacity)
+        self.__lengths = RawArray(ctypes.c_uint32, self.__capacity)
+        self.__timestamps = RawArray(ctypes.c_double, self.__capacity)
+
+        self.__buffer = RawArray(ctypes.c_char, self.__buffer_size)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, report, timestamp=None):
+        encoded = JSONify.dumps(report, separators=self.__SEPARATORS).encode()
+
+        if len(encoded) > self.__buffer_size:
+            raise ValueError("report of %d bytes exceeds buffer size of %d bytes" % (len(encoded), self.__buffer_size))
+
+        position = self.__reserved.value
+        self.__reserved.value = position + len(encoded)                     # reserve
+
+        self.__write_bytes(position, encoded)
+
+        index = self.__count.value % self.__capacity
+
+        self.__positions[index] = position
+        self.__lengths[index] = len(encoded)
+        self.__timestamps[index] = time.time() if timestamp is None else timestamp
+
+        self.__count.value += 1                                             # publish
+
+
+    def history(self, since=None, limit=None):
+        count = self.__count.value
+        reserved = self.__reserved.value
+
+        first = max(self.__oldest_valid(count), 1 if since is None else since + 1, 1)
+
+        while first <= count and self.__positions[(first - 1) % self.__capacity] + self.__buffer_size < reserved:
+            first += 1                                                      # bytes already overwritten
+
+        last = count if limit is None else min(count, first + limit - 1)
+
+        copied = []
+
+        for seq in range(first, last + 1):
+            index = (seq - 1) % self.__capacity
+
+            position = self.__positions[index]
+            length = min(self.__lengths[index], self.__buffer_size)
+
+            copied.append((seq, position, self.__timestamps[index], self.__read_bytes(position, length)))
+
+        # discard any report whose index entry or bytes may have been written while they were copied...
+        oldest_valid = self.__oldest_valid(self.__count.value)
+        reserved = self.__reserved.value
+
+        return [(seq, timestamp, json.loads(encoded.decode(), object_pairs_hook=OrderedDict))
+                for seq, position, timestamp, encoded in copied
+                if seq >= oldest_valid and position + self.__buffer_size >= reserved]
+
+
+    def __oldest_valid(self, count):
+        # while seq count + 1 is written, its index entry holds seq count + 1 - capacity...
+        return count - self.__capacity + 2
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __write_bytes(self, position, encoded):
+        offset = position % self.__buffer_size
+        head = min(len(encoded), self.__buffer_size - offset)
+
+        ctypes.memmove(ctypes.addressof(self.__buffer) + offset, encoded, head)
+        ctypes.memmove(ctypes.addressof(self.__buffer), encoded[head:], len(encoded) - head)     # wrapped
+
+
+    def __read_bytes(self, position, length):
+        offset = position % self.__buffer_size
+        head = min(length, self.__buffer_size - offset)
+
+        return ctypes.string_at(ctypes.addressof(self.__buffer) + offset, head) + \
+            ctypes.string_at(ctypes.addressof(self.__buffer), length - head)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def count(self):
+        return self.__count.value
+
+
+    @property
+    def capacity(self):
+        return self.__capacity
+
+
+    @property
+    def buffer_size(self):
+        return self.__buffer_size
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "PSUStatusHistory:{capacity:%s, buffer_size:%s, count:%s, reserved:%s}" % \
+               (self.capacity, self.buffer_size, self.count, self.__reserved.value)
@@ -0,0 +1,255 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+A Unix domain socket server thread, so that many local clients may share the cached state of one PSUMonitor.
+
+The protocol is line-based. Each request is a command, followed by any space-separated arguments. Each response
+is a single line of JSON. An invalid request, or one that the handler fails to answer, receives
+{"error": <message>}.
+
+status                              the latest PSU report
+version                             the PSU firmware version
+history [SINCE [LIMIT]]             a list of {"seq", "rec", "status"}, oldest first
+batt                                the latest battery pack sample, or null
+
+All connections are serviced by a single selector loop - the handler must answer from cached state, and must not
+block. A client whose unsent responses exceed MAX_OUTBOUND bytes is assumed not to be reading, and is disconnected.
+
+https://docs.python.org/3/library/selectors.html
+"""
+
+import os
+import selectors
+import socket
+import tempfile
+
+from collections import OrderedDict
+from threading import Event, Thread
+
+from scs_core.data.json import JSONify
+
+from scs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PSUStatusServer(Thread):
+    """
+    classdocs
+    """
+
+    __FILENAME =                "scs-psu.sock"
+
+    __BACKLOG =                 128             # connections
+    __RECV_SIZE =               4096            # bytes
+    __MAX_REQUEST =             256             # bytes
+    __MAX_OUTBOUND =            1048576         # bytes
+    __SELECT_TIMEOUT =          0.5             # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def default_path(cls):
+        return os.path.join(tempfile.gettempdir(), cls.__FILENAME)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, handler, path=None):
+        """
+        Constructor
+        """
+        super().__init__(name=self.__class__.__name__, daemon=True)
+
+        self.__handler = handler                                # callable      (command, args) -> JSONable
+        self.__path = self.default_path() if path is None else path
+
+        self.__stopped = Event()
+        self.__listening = Event()
+
+        self.__logger = None                                    # set in the server thread
+
+        self.__connections = 0                                  # int           currently open
+        self.__requests = 0                                     # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def run(self):
+        self.__logger = Logging.getLogger()
+
+        selector = selectors.DefaultSelector()
+        listener = self.__listen()
+
+        selector.register(listener, selectors.EVENT_READ)
+        self.__listening.set()
+
+        try:
+            while not self.__stopped.is_set():
+                for key, events in selector.select(timeout=self.__SELECT_TIMEOUT):
+                    if key.fileobj is listener:
+                        self.__accept(selector, listener)
+                        continue
+
+                    try:
+                        self.__service(selector, key, events)
+
+                    except OSError as ex:
+                        self.__logger.error("PSUStatusServer: %s" % repr(ex))
+                        self.__disconnect(selector, key.fileobj)
+
+        finally:
+            for key in list(selector.get_map().values()):
+                if key.fileobj is not listener:
+                    self.__disconnect(selector, key.fileobj)
+
+            selector.close()
+            listener.close()
+
+            self.__unlink()
+
+
+    def stop(self, timeout=None):
+        self.__stopped.set()
+        self.join(timeout)
+
+
+    def wait_until_listening(self, timeout=None):
+        return self.__listening.wait(timeout)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __listen(self):
+        self.__unlink()                                         # a previous server may have left its socket
+
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(self.__path)
+        listener.listen(self.__BACKLOG)
+        listener.setblocking(False)
+
+        return listener
+
+
+    def __accept(self, selector, listener):
+        try:
+            connection, _ = listener.accept()
+        except BlockingIOError:
+            return
+
+        connection.setblocking(False)
+        selector.register(connection, selectors.EVENT_READ, data=_Buffers())
+
+        self.__connections += 1
+
+
+    def __disconnect(self, selector, connection):
+        try:
+            selector.unregister(connection)
+        except (KeyError, ValueError):
+            pass
+
+        connection.close()
+
+        self.__connections -= 1
+
+
+    def __service(self, selector, key, events):
+        connection = key.fileobj
+        buffers = key.data
+
+        if events & selectors.EVENT_READ:
+            received = connection.recv(self.__RECV_SIZE)
+
+            if not received:
+                self.__disconnect(selector, connection)                 # the client has closed the connection
+                return
+
+            buffers.inbound += received
+
+            while b'\n' in buffers.inbound:
+                line, _, buffers.inbound = bytes(buffers.inbound).partition(b'\n')
+                buffers.outbound += self.__respond(line) + b'\n'
+
+            if len(buffers.inbound) > self.__MAX_REQUEST or len(buffers.outbound) > self.__MAX_OUTBOUND:
+                self.__disconnect(selector, connection)
+                return
+
+        if buffers.outbound:
+            try:
+                sent = connection.send(buffers.outbound)
+                del buffers.outbound[:sent]
+
+            except BlockingIOError:
+                pass
+
+        events = selectors.EVENT_READ | (selectors.EVENT_WRITE if buffers.outbound else 0)
+
+        if events != key.events:
+            selector.modify(connection, events, data=buffers)
+
+
+    def __respond(self, line):
+        self.__requests += 1
+
+        try:
+            words = line.decode().split()
+
+            if not words:
+                raise ValueError("empty request")
+
+            return JSONify.dumps(self.__handler(words[0], words[1:])).encode()
+
+        except (UnicodeDecodeError, ValueError, TypeError) as ex:
+            response = OrderedDict((('error', str(ex) or repr(ex)), ))
+
+        except Exception as ex:
+            self.__logger.error("PSUStatusServer: %s: %s" % (line[:self.__MAX_REQUEST], repr(ex)))
+            response = OrderedDict((('error', repr(ex)), ))
+
+        return JSONify.dumps(response).encode()
+
+
+    def __unlink(self):
+        try:
+            os.unlink(self.__path)
+        except FileNotFoundError:
+            pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def path(self):
+        return self.__path
+
+
+    @property
+    def connections(self):
+        return self.__connections
+
+
+    @property
+    def requests(self):
+        return self.__requests
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "PSUStatusServer:{path:%s, connections:%s, requests:%s, alive:%s}" % \
+               (self.path, self.connections, self.requests, self.is_alive())
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class _Buffers(object):
+    """
+    per-connection buffers
+    """
+
+    def __init__(self):
+        self.inbound = bytearray()
+        self.outbound = bytearray()
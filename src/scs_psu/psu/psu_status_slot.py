@@ -0,0 +1,104 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+A fixed-capacity shared memory slot holding the latest PSU report, written by the PSUMonitor process and read by
+any process that inherits the slot.
+
+The report is held as UTF-8 JSON. A generation counter acts as a seqlock: the single writer makes the counter odd
+while the buffer is being updated, and even when the update is complete. Readers take no lock - they retry if the
+generation was odd, or changed while they were copying the buffer.
+
+https://docs.python.org/3/library/multiprocessing.html#module-multiprocessing.sharedctypes
+https://en.wikipedia.org/wiki/Seqlock
+"""
+
+import ctypes
+import json
+import time
+
+from collections import OrderedDict
+from multiprocessing.sharedctypes import RawArray, RawValue
+
+from scs_core.data.json import JSONify
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PSUStatusSlot(object):
+    """
+    classdocs
+    """
+
+    __DEFAULT_CAPACITY =        1024            # bytes
+
+    __READ_RETRIES =            1000
+    __READ_RETRY_WAIT =         0.0001          # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, capacity=None):
+        """
+        Constructor
+        """
+        self.__capacity = self.__DEFAULT_CAPACITY if capacity is None else int(capacity)
+
+        self.__generation = RawValue(ctypes.c_uint64, 0)
+        self.__length = RawValue(ctypes.c_uint32, 0)
+        self.__buffer = RawArray(ctypes.c_char, self.__capacity)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, report):
+        encoded = JSONify.dumps(report).encode()
+
+        if len(encoded) > self.__capacity:
+            raise ValueError("report of %d bytes exceeds slot capacity of %d bytes" % (len(encoded), self.__capacity))
+
+        self.__generation.value += 1                                    # odd: write in progress
+
+        ctypes.memmove(self.__buffer, encoded, len(encoded))
+        self.__length.value = len(encoded)
+
+        self.__generation.value += 1                                    # even: write complete
+
+
+    def read(self):
+        for _ in range(self.__READ_RETRIES):
+            generation = self.__generation.value
+
+            if generation & 1:
+                time.sleep(self.__READ_RETRY_WAIT)
+                continue
+
+            encoded = ctypes.string_at(self.__buffer, self.__length.value)
+
+            if self.__generation.value != generation:
+                continue
+
+            jdict = json.loads(encoded.decode(), object_pairs_hook=OrderedDict) if encoded else None
+
+            return generation, jdict
+
+        raise TimeoutError("PSUStatusSlot: no consistent read after %d retries" % self.__READ_RETRIES)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def generation(self):
+        return self.__generation.value
+
+
+    @property
+    def capacity(self):
+        return self.__capacity
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "PSUStatusSlot:{capacity:%s, generation:%s, length:%s}" % \
+               (self.capacity, self.generation, self.__length.value)
@@ -4,11 +4,30 @@ Created on 13 Jun 2019
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 
 An abstract PSU that communicates over a UART
+
+By default, the UART is opened and closed around every command. A persistent session may be opened instead - the
+UART (and its cross-process lock) is then held by the opening process until close_session() or close() is called.
+Access within the process is serialised, and the session is re-opened if an exchange fails.
+
+Several commands may be pipelined in a single exchange - the commands are written back to back, and the responses
+are read in the same order. Responses do not identify their commands, so where any response is lost, none of the
+responses of the exchange can be attributed, and all are returned as None. When streaming, commands are written one
+at a time, so that a lost response cannot shift the attribution of later responses.
+
+In streaming mode, a session is held open and a SerialPSUReader thread drains the UART, requesting and decoding
+status reports at a set interval. status() then returns the latest decoded report without blocking.
+
+Status frames are JSON by default. negotiate_codec() selects the most compact status frame that the firmware
+supports, falling back to JSON. A probe that receives no response ends the negotiation, so that a late response
+cannot be taken as the response to a later probe. PSUMonitor records the negotiated codec against the firmware
+version, and selects the recorded codec with select_codec() until the firmware changes.
 """
 
 import json
+import os
 
 from abc import abstractmethod
+from threading import RLock
 
 from scs_core.psu.psu import PSU
 from scs_core.psu.psu_uptime import PSUUptime
@@ -18,6 +37,9 @@ from scs_core.sys.logging import Logging
 
 from scs_host.sys.host_serial import HostSerial
 
+from scs_psu.psu.serial_psu_reader import SerialPSUReader
+from scs_psu.psu.status_codec import JSONStatusCodec
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -31,6 +53,12 @@ class SerialPSU(PSU):
     __SERIAL_LOCK_TIMEOUT =     6.0         # seconds
     __SERIAL_COMMS_TIMEOUT =    2.0         # seconds
 
+    __STREAM_STATUS_INTERVAL =  2.0         # seconds
+
+    __MAX_FRAME_LENGTH =        160         # characters, including EOL
+    __BITS_PER_CHARACTER =      10          # start bit, 8 data bits, stop bit
+    __MIN_READ_TIMEOUT =        0.2         # seconds
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
@@ -44,6 +72,11 @@ class SerialPSU(PSU):
         return False
 
 
+    @classmethod
+    def status_codecs(cls):
+        return (JSONStatusCodec(), )                            # in order of preference
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __init__(self, uart):
@@ -53,6 +86,13 @@ class SerialPSU(PSU):
         self._serial = HostSerial(uart, self.baud_rate())
         self._logger = Logging.getLogger()
 
+        self.__session_lock = RLock()
+        self.__session_pid = None                               # pid of the process holding the session, or None
+        self.__connected_pid = None                             # pid of the process that opened the UART, or None
+
+        self.__reader = None                                    # SerialPSUReader
+        self.__codec = JSONStatusCodec()                        # StatusCodec
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
@@ -68,29 +108,221 @@ class SerialPSU(PSU):
 
 
     def close(self):
-        pass
+        self.stop_streaming()
+        self.close_session()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def open_session(self):
+        with self.__session_lock:
+            self.__session_pid = os.getpid()
+            self.__reconnect()
+
+
+    def close_session(self):
+        with self.__session_lock:
+            if not self.has_session:
+                return
+
+            self.__session_pid = None
+            self.__disconnect()
+
+
+    @property
+    def has_session(self):
+        return self.__session_pid == os.getpid()                # a session is not inherited by a child process
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def start_streaming(self, status_interval=None):
+        if self.is_streaming:
+            return
+
+        interval = self.__STREAM_STATUS_INTERVAL if status_interval is None else status_interval
+
+        self.open_session()
+
+        self.__reader = SerialPSUReader(self._serial, self.__EOL, self.__codec.command(), interval,
+                                        self._status_from_response, self.read_timeout(),
+                                        self.__SERIAL_COMMS_TIMEOUT, self.__reopen)
+        self.__reader.start()
+
+
+    def stop_streaming(self):
+        if not self.is_streaming:
+            return
+
+        self.__reader.stop(timeout=self.__SERIAL_COMMS_TIMEOUT)
+        self.__reader = None
+
+
+    def read_timeout(self):
+        # the time for the longest frame to arrive at the baud rate - about 1.3 seconds at 1200 baud...
+        frame_time = self.__MAX_FRAME_LENGTH * self.__BITS_PER_CHARACTER / self.baud_rate()
+
+        return max(frame_time, self.__MIN_READ_TIMEOUT)
+
+
+    @property
+    def is_streaming(self):
+        return self.__reader is not None and self.__reader.is_alive()         # threads do not survive a fork
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def communicate(self, command):
+        return self.communicate_all((command, ))[0]
+
+
+    def communicate_all(self, commands):
+        commands = tuple(commands)
+
+        if self.is_streaming:
+            return self.__reader.communicate_all(commands)
+
+        if self.has_session:
+            return self.__session_communicate_all(commands)
+
         try:
             self._serial.open(self.__SERIAL_LOCK_TIMEOUT, self.__SERIAL_COMMS_TIMEOUT)
 
+            return self.__exchange_all(commands)
+
+        finally:
+            self._serial.close()
+
+
+    def __session_communicate_all(self, commands):
+        with self.__session_lock:
             try:
+                self.__reconnect()
+                responses = self.__exchange_all(commands)
+
+            except OSError as ex:
+                self._logger.error("communicate: %s" % repr(ex))
+                responses = [None] * len(commands)
+
+            if None in responses:
+                self.__disconnect()                             # re-opened on next use, discarding any late response
+
+            return responses
+
+
+    def __reopen(self):
+        with self.__session_lock:
+            self.__disconnect()
+            self.__reconnect()
+
+
+    def __reconnect(self):
+        if self.__connected_pid == os.getpid():
+            return
+
+        self._serial.open(self.__SERIAL_LOCK_TIMEOUT, self.__SERIAL_COMMS_TIMEOUT)
+        self.__connected_pid = os.getpid()
+
+
+    def __disconnect(self):
+        if self.__connected_pid != os.getpid():
+            return
+
+        try:
+            self._serial.close()
+        finally:
+            self.__connected_pid = None
+
+
+    def __exchange_all(self, commands):
+        responses = [None] * len(commands)
+
+        try:
+            for command in commands:
                 self._serial.write_line(command.strip(), self.__EOL)
-            except AttributeError as ex:
-                self._logger.error("write_line: %s" % repr(ex))
-                return None
 
+        except AttributeError as ex:
+            self._logger.error("write_line: %s" % repr(ex))
+            return responses
+
+        for i in range(len(commands)):
             try:
-                return self._serial.read_line(eol=self.__EOL, timeout=self.__SERIAL_COMMS_TIMEOUT)
+                responses[i] = self._serial.read_line(eol=self.__EOL, timeout=self.__SERIAL_COMMS_TIMEOUT)
+
             except TimeoutError as ex:
                 self._logger.error("read_line: %s" % repr(ex))
-                return None
+                return [None] * len(commands)                   # the lost response may be any of them
 
-        finally:
-            self._serial.close()
+        return responses
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def negotiate_codec(self):
+        if self.is_streaming:
+            raise RuntimeError("the status codec cannot be negotiated while streaming")
+
+        for codec in self.status_codecs():
+            response = self.communicate(codec.command())
+
+            if response is None:
+                break                                           # unanswered: the firmware is not in step
+
+            try:
+                codec.decode(response)
+
+            except (TypeError, ValueError):
+                continue
+
+            self.__codec = codec
+            break
+
+        return self.__codec
+
+
+    def select_codec(self, name):
+        if self.is_streaming:
+            raise RuntimeError("the status codec cannot be selected while streaming")
+
+        for codec in self.status_codecs():
+            if codec.name() == name:
+                self.__codec = codec
+                return codec
+
+        return None
+
+
+    @property
+    def codec(self):
+        return self.__codec
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def status(self):
+        if self.is_streaming:
+            status = self.__reader.latest_status
+            return self._status_from_response(None) if status is None else status     # null report if stale
+
+        return self._status_from_response(self.communicate(self.__codec.command()))
+
+
+    def status_with(self, commands):
+        if self.is_streaming:
+            return self.status(), self.communicate_all(commands)
+
+        responses = self.communicate_all((self.__codec.command(), ) + tuple(commands))
+
+        return self._status_from_response(responses[0]), responses[1:]
+
+
+    def _decode_status_frame(self, response):
+        return self.__codec.decode(response)
+
+
+    @abstractmethod
+    def _status_from_response(self, response):
+        pass
 
 
     # ----------------------------------------------------------------------------------------------------------------
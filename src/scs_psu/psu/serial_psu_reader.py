@@ -0,0 +1,223 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+A reader thread for a streaming SerialPSU. The thread continuously drains the UART, requesting a status report at
+a set interval and decoding each status response as it arrives, so that the latest status is always available
+without blocking.
+
+Other commands are written by the calling thread. Only one command is in flight at a time, so every response is
+attributed to the command that it answers. If the command in flight receives no response within the comms timeout,
+it is abandoned, and lines are discarded until the UART has been idle for the read timeout - no command is written
+until then, so a late response cannot be attributed to a later command.
+
+The read timeout must allow the longest frame to arrive at the baud rate of the UART. The status period is the
+longer of the status interval and the read timeout. A status report that is older than STALE_INTERVALS status
+periods is not returned.
+"""
+
+import time
+
+from queue import Queue, Empty
+from threading import Condition, Event, Thread
+
+from scs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SerialPSUReader(Thread):
+    """
+    classdocs
+    """
+
+    STALE_INTERVALS =           3
+
+    __RECONNECT_WAIT =          1.0             # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, serial, eol, status_command, status_interval, status_decoder, read_timeout, comms_timeout,
+                 reconnect):
+        """
+        Constructor
+        """
+        super().__init__(name=self.__class__.__name__, daemon=True)
+
+        self.__serial = serial                                  # HostSerial
+        self.__eol = eol                                        # string
+        self.__status_command = status_command                  # string
+        self.__status_interval = status_interval                # float         seconds
+        self.__status_decoder = status_decoder                  # callable      response -> PSUReport
+        self.__read_timeout = read_timeout                      # float         seconds
+        self.__comms_timeout = comms_timeout                    # float         seconds
+        self.__reconnect = reconnect                            # callable
+
+        self.__idle = Condition()                               # guards in_flight and resynchronising
+        self.__in_flight = None                                 # (command, deadline, Queue or None)
+        self.__resynchronising = False
+        self.__stopped = Event()
+
+        self.__latest_status = (None, None)                     # (monotonic seconds, PSUReport)
+        self.__next_status_request = time.monotonic()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def run(self):
+        logger = Logging.getLogger()
+
+        while not self.__stopped.is_set():
+            try:
+                self.__request_status()
+
+                try:
+                    line = self.__serial.read_line(eol=self.__eol, timeout=self.__read_timeout)
+                except TimeoutError:
+                    self.__on_idle()
+                    continue
+
+                self.__dispatch(line, logger)
+
+            except (AttributeError, OSError) as ex:
+                logger.error("SerialPSUReader: %s" % repr(ex))
+
+                self.__abandon(resynchronise=True)
+                self.__stopped.wait(self.__RECONNECT_WAIT)
+
+                try:
+                    self.__reconnect()
+                except OSError as ex:
+                    logger.error("SerialPSUReader reconnect: %s" % repr(ex))
+
+
+    def stop(self, timeout=None):
+        self.__stopped.set()
+        self.join(timeout)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def communicate_all(self, commands):
+        responses = [None] * len(commands)
+
+        for i, command in enumerate(commands):
+            queue = Queue(maxsize=1)
+
+            if not self.__write(command, queue, self.__comms_timeout):
+                break                                           # the UART did not become idle
+
+            try:
+                responses[i] = queue.get(timeout=self.__comms_timeout + self.__read_timeout)
+
+            except Empty:
+                self.__abandon(queue=queue, resynchronise=True)
+                break                                           # later commands are not sent
+
+        return responses
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __request_status(self):
+        if time.monotonic() < self.__next_status_request:
+            return
+
+        if self.__write(self.__status_command, None, 0):
+            self.__next_status_request = time.monotonic() + self.__status_interval
+
+
+    def __write(self, command, queue, timeout):
+        with self.__idle:
+            if not self.__idle.wait_for(self.__is_idle, timeout):
+                return False
+
+            deadline = time.monotonic() + self.__comms_timeout + self.__read_timeout
+
+            self.__in_flight = (command, deadline, queue)
+            self.__serial.write_line(command.strip(), self.__eol)
+
+            return True
+
+
+    def __dispatch(self, line, logger):
+        with self.__idle:
+            if self.__resynchronising or self.__in_flight is None:
+                return                                          # a late or unsolicited line
+
+            command, deadline, queue = self.__in_flight
+
+            self.__in_flight = None
+            self.__idle.notify_all()
+
+        if queue is not None:
+            queue.put(line)
+
+        if command != self.__status_command:
+            return
+
+        try:
+            self.__latest_status = (time.monotonic(), self.__status_decoder(line))
+
+        except Exception as ex:
+            logger.error("SerialPSUReader decode: %s" % repr(ex))
+
+
+    def __on_idle(self):
+        with self.__idle:
+            if self.__resynchronising:
+                self.__resynchronising = False                  # the UART has been idle for the read timeout
+                self.__idle.notify_all()
+                return
+
+            if self.__in_flight is not None and self.__in_flight[1] < time.monotonic():
+                self.__in_flight = None                         # its response may yet arrive
+                self.__resynchronising = True
+
+
+    def __abandon(self, queue=None, resynchronise=False):
+        with self.__idle:
+            if self.__in_flight is None:
+                return
+
+            if queue is not None and self.__in_flight[2] is not queue:
+                return                                          # the command has already been answered
+
+            self.__in_flight = None
+            self.__resynchronising = resynchronise
+
+
+    def __is_idle(self):
+        return self.__in_flight is None and not self.__resynchronising
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def latest_status(self):                                    # None if there is no recent status report
+        received, status = self.__latest_status
+
+        if received is None or time.monotonic() - received > self.STALE_INTERVALS * self.status_period:
+            return None
+
+        return status
+
+
+    @property
+    def status_interval(self):
+        return self.__status_interval
+
+
+    @property
+    def status_period(self):
+        return max(self.__status_interval, self.__read_timeout)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SerialPSUReader:{status_command:%s, status_interval:%s, read_timeout:%s, comms_timeout:%s, " \
+               "in_flight:%s, resynchronising:%s, alive:%s}" % \
+               (self.__status_command, self.status_interval, self.__read_timeout, self.__comms_timeout,
+                None if self.__in_flight is None else self.__in_flight[0], self.__resynchronising, self.is_alive())
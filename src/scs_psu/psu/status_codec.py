@@ -0,0 +1,309 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+Codecs for serial PSU status frames. Every codec decodes a response line to the same jdict that the JSON frame
+provides, so that the report class builds identical status objects whichever frame was used.
+
+The compact frames are defined by a layout - a sequence of (key, kind) fields, where kind is one of:
+    'b'     bool
+    'fN'    string of N 'T' / 'F' flags, as used by ResetStatus and ChargerStatus
+    'v'     float, to a resolution of 0.01, in the range -327.67 to 327.67
+
+CSV frame: key-less, comma-separated values in layout order, for example:
+FT,0,TFTF,0,3.3,12.5,8.9
+
+Binary frame: hex-encoded, little-endian. A uint16 bitfield holds the bool and flag fields (LSB first, in layout
+order), followed by one int16 (hundredths) for each 'v' field, for example:
+2a004a01e2047a03
+"""
+
+import json
+import struct
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class StatusCodec(ABC):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    @abstractmethod
+    def name(cls):
+        pass
+
+
+    @classmethod
+    @abstractmethod
+    def command(cls):
+        pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @abstractmethod
+    def decode(self, response):                         # raises TypeError or ValueError on an invalid response
+        pass
+
+
+    @abstractmethod
+    def encode(self, jdict):
+        pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return self.__class__.__name__ + ":{command:%s}" % self.command()
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class JSONStatusCodec(StatusCodec):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def name(cls):
+        return 'json'
+
+
+    @classmethod
+    def command(cls):
+        return 'state'
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def decode(self, response):
+        return json.loads(response, object_pairs_hook=OrderedDict)
+
+
+    def encode(self, jdict):
+        return json.dumps(jdict, separators=(',', ':'))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class LayoutStatusCodec(StatusCodec, ABC):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def frame(response):
+        if not isinstance(response, str):
+            raise TypeError("response: %s" % response)          # for example, the firmware did not respond
+
+        return response.strip()
+
+
+    @staticmethod
+    def flags_width(kind):
+        return int(kind[1:]) if kind.startswith('f') else None
+
+
+    @staticmethod
+    def decode_flags(bits):
+        return ''.join('T' if bit else 'F' for bit in bits)
+
+
+    @staticmethod
+    def encode_flags(flags, width):
+        flags = str(flags)
+
+        if len(flags) != width:
+            raise ValueError("flags: %s" % flags)
+
+        return [flag in ('T', '1') for flag in flags]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, layout):
+        """
+        Constructor
+        """
+        self.__layout = tuple(layout)                   # tuple of (key, kind)
+
+        for key, kind in self.__layout:
+            if kind not in ('b', 'v') and not (self.flags_width(kind) or 0) > 0:
+                raise ValueError("invalid kind for %s: %s" % (key, kind))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def layout(self):
+        return self.__layout
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return self.__class__.__name__ + ":{command:%s, layout:%s}" % (self.command(), self.layout)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVStatusCodec(LayoutStatusCodec):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def name(cls):
+        return 'csv'
+
+
+    @classmethod
+    def command(cls):
+        return 'state-csv'
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def decode(self, response):
+        values = self.frame(response).split(',')
+
+        if len(values) != len(self.layout):
+            raise ValueError("CSV frame: %s" % response)
+
+        jdict = OrderedDict()
+
+        for (key, kind), value in zip(self.layout, values):
+            if kind == 'b':
+                if value not in ('0', '1'):
+                    raise ValueError("%s: %s" % (key, value))
+
+                jdict[key] = value == '1'
+
+            elif kind == 'v':
+                jdict[key] = float(value)
+
+            else:
+                jdict[key] = self.decode_flags(self.encode_flags(value, self.flags_width(kind)))
+
+        return jdict
+
+
+    def encode(self, jdict):
+        values = []
+
+        for key, kind in self.layout:
+            value = jdict[key]
+
+            if kind == 'b':
+                values.append('1' if value else '0')
+
+            elif kind == 'v':
+                values.append(str(round(float(value), 2)))
+
+            else:
+                values.append(self.decode_flags(self.encode_flags(value, self.flags_width(kind))))
+
+        return ','.join(values)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BinaryStatusCodec(LayoutStatusCodec):
+    """
+    classdocs
+    """
+
+    __BITFIELD_WIDTH =      16
+    __V_SCALE =             100.0
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def name(cls):
+        return 'bin'
+
+
+    @classmethod
+    def command(cls):
+        return 'state-bin'
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, layout):
+        """
+        Constructor
+        """
+        super().__init__(layout)
+
+        bit_count = sum(1 if kind == 'b' else self.flags_width(kind) for _, kind in self.layout if kind != 'v')
+
+        if bit_count > self.__BITFIELD_WIDTH:
+            raise ValueError("layout requires %d bits" % bit_count)
+
+        self.__format = '<H' + 'h' * sum(1 for _, kind in self.layout if kind == 'v')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def decode(self, response):
+        frame = bytes.fromhex(self.frame(response))
+
+        if len(frame) != struct.calcsize(self.__format):
+            raise ValueError("binary frame: %s" % response)
+
+        unpacked = struct.unpack(self.__format, frame)
+
+        bitfield = unpacked[0]
+        values = iter(unpacked[1:])
+        bit = 0
+
+        jdict = OrderedDict()
+
+        for key, kind in self.layout:
+            if kind == 'v':
+                jdict[key] = next(values) / self.__V_SCALE
+                continue
+
+            width = 1 if kind == 'b' else self.flags_width(kind)
+            bits = [bool(bitfield & (1 << (bit + i))) for i in range(width)]
+            bit += width
+
+            jdict[key] = bits[0] if kind == 'b' else self.decode_flags(bits)
+
+        return jdict
+
+
+    def encode(self, jdict):
+        bitfield = 0
+        values = []
+        bit = 0
+
+        for key, kind in self.layout:
+            value = jdict[key]
+
+            if kind == 'v':
+                values.append(int(round(float(value) * self.__V_SCALE)))
+                continue
+
+            bits = [bool(value)] if kind == 'b' else self.encode_flags(value, self.flags_width(kind))
+
+            for flag in bits:
+                bitfield |= int(flag) << bit
+                bit += 1
+
+        return struct.pack(self.__format, bitfield, *values).hex()
@@ -0,0 +1,103 @@
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+The status codec negotiated with a serial PSU, recorded against the firmware version, so that the codec need not be
+negotiated again until the firmware changes.
+
+Document example:
+{"id": "South Coast Science PSU Oslo", "tag": "1.2.3", "codec": "state-csv"}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import PersistentJSONable
+
+from scs_core.psu.psu_version import PSUTag
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class StatusCodecRecord(PersistentJSONable):
+    """
+    classdocs
+    """
+
+    __FILENAME = "psu_status_codec.json"
+
+    @classmethod
+    def persistence_location(cls):
+        return cls.conf_dir(), cls.__FILENAME
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict, skeleton=False):
+        if not jdict:
+            return None
+
+        id = jdict.get('id')
+        tag = PSUTag.construct_from_jdict(jdict.get('tag'))
+        codec = jdict.get('codec')
+
+        return cls(id, tag, codec)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, id, tag, codec):
+        """
+        Constructor
+        """
+        super().__init__()
+
+        self.__id = id                                  # string
+        self.__tag = tag                                # PSUTag
+        self.__codec = codec                            # string        StatusCodec name
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_for(self, version):
+        try:
+            return version.tag is not None and self.id == version.id and self.tag == version.tag
+
+        except AttributeError:
+            return False
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['id'] = self.id
+        jdict['tag'] = self.tag
+        jdict['codec'] = self.codec
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def id(self):
+        return self.__id
+
+
+    @property
+    def tag(self):
+        return self.__tag
+
+
+    @property
+    def codec(self):
+        return self.__codec
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "StatusCodecRecord:{id:%s, tag:%s, codec:%s}" % (self.id, self.tag, self.codec)
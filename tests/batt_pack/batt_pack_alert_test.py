@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+in alert mode, the previous sample is reused until an alert fires or input power is gained or lost, using the
+simulated gauge
+"""
+
+import time
+
+from scs_psu.batt_pack.batt_pack_v2 import BattPackV2
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055 import Max17055
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_sim import Max17055Sim
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+BACKGROUND_INTERVAL = 60.0                              # seconds - longer than the test
+
+conf = BattPackV2.gauge_conf()
+
+# input power...
+sim = Max17055Sim(conf, soc=50.0, current=-200)
+batt_pack = BattPackV2(Max17055(conf, bus=sim))
+
+assert batt_pack.program_alerts()
+batt_pack.set_alert_mode(BACKGROUND_INTERVAL)
+
+sample = batt_pack.sample()
+print("on battery: %s" % sample)
+
+assert batt_pack.sample() is sample, "sample not reused"
+
+sim.set_current(500)                                    # input power gained
+sample = batt_pack.sample()
+print("on input power: %s" % sample)
+
+assert sample.input_power_present, "input power not seen"
+assert batt_pack.sample() is sample, "sample not reused"
+
+sim.set_current(-200)                                   # input power lost
+sample = batt_pack.sample()
+print("on battery: %s" % sample)
+
+assert not sample.input_power_present, "loss of input power not seen"
+print("-")
+
+# state of charge alert...
+sim = Max17055Sim(conf, soc=BattPackV2.charge_min() + 1.0, current=-5000, time_scale=100.0)
+batt_pack = BattPackV2(Max17055(conf, bus=sim))
+
+assert batt_pack.program_alerts()
+batt_pack.set_alert_mode(BACKGROUND_INTERVAL)
+
+sample = batt_pack.sample()
+print("above charge_min: %s" % sample.charge)
+
+time.sleep(0.5)                                         # discharges below charge_min
+
+alerts = batt_pack.read_alerts()
+print("alerts: %s" % alerts)
+
+assert alerts.charge_min, "charge_min alert not fired"
+
+latest = batt_pack.sample()
+print("below charge_min: %s" % latest.charge)
+
+assert latest is not sample, "sample reused after alert"
+assert latest.charge.percent < BattPackV2.charge_min(), latest.charge
+
+print("OK")
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+initialise and restore wait only as long as the gauge takes to complete each step, using the simulated gauge
+running ten times faster than real time - fixed sleeps would not shorten with it
+"""
+
+import time
+
+from scs_psu.batt_pack.batt_pack_v2 import BattPackV2
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055 import Max17055
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_sim import Max17055Sim
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+FIXED_SETTLE = 0.350                                    # seconds - each of the two fixed sleeps that were replaced
+
+conf = BattPackV2.gauge_conf()
+
+sim = Max17055Sim(conf, soc=60.0, current=-500, time_scale=10.0)
+gauge = Max17055(conf, bus=sim)
+
+start_time = time.time()
+gauge.initialise(force_config=True)
+initialise_elapsed = time.time() - start_time
+
+print("initialise: %0.3f s" % initialise_elapsed)
+
+start_time = time.time()
+gauge.write_params(BattPackV2.default_params())
+write_params_elapsed = time.time() - start_time
+
+print("write_params: %0.3f s" % write_params_elapsed)
+print("-")
+
+for step, elapsed in gauge.step_timings.items():
+    print("%20s: %0.3f s" % (step, elapsed))
+
+print("-")
+
+assert write_params_elapsed < FIXED_SETTLE, write_params_elapsed
+assert initialise_elapsed < FIXED_SETTLE, initialise_elapsed
+
+assert gauge.read_learned_params() == BattPackV2.default_params()
+
+print("OK")
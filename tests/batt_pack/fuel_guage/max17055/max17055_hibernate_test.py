@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+the hibernate policy sets the gauge update period, is written and read back through HibCfg, and is re-read after a
+power-on reset, using the simulated gauge
+"""
+
+from scs_psu.batt_pack.batt_pack_v2 import BattPackV2
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055 import Max17055
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_hibernate_policy import Max17055HibernatePolicy
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_sim import Max17055Sim
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+conf = BattPackV2.gauge_conf()
+
+sim = Max17055Sim(conf, soc=60.0, current=-5)
+gauge = Max17055(conf, bus=sim)
+batt_pack = BattPackV2(gauge)
+
+default_policy = batt_pack.hibernate_policy()
+print("default: %s" % default_policy)
+
+light = batt_pack.update_period(gauge.sample())
+print("update period at -5 mA: %s" % light)
+
+sim.set_current(-500)
+heavy = batt_pack.update_period(gauge.sample())
+print("update period at -500 mA: %s" % heavy)
+print("-")
+
+assert light == default_policy.hibernate_period, light
+assert heavy == Max17055HibernatePolicy.ACTIVE_PERIOD, heavy
+
+# write and read back...
+policy = Max17055HibernatePolicy(True, 0, 7, 1, 2)
+assert batt_pack.set_hibernate_policy(policy)
+
+print("written: %s" % batt_pack.hibernate_policy())
+assert batt_pack.hibernate_policy() == policy
+
+gauge.invalidate_cache()
+assert batt_pack.hibernate_policy() == policy, "not held by the gauge"
+
+# power-on reset...
+sim.power_on_reset()
+assert gauge.read_power_on_reset()
+
+print("after PoR: %s" % batt_pack.hibernate_policy())
+print("-")
+
+assert batt_pack.hibernate_policy() == default_policy, "cached HibCfg survived PoR"
+
+print("OK")
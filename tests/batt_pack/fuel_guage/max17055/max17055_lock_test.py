@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+shared gauge locks do not block one another, and an exclusive lock excludes both, using two gauges on the simulated
+bus - each gauge opens the lock file separately, as another process would
+"""
+
+import os
+import stat
+
+from scs_psu.batt_pack.batt_pack_v2 import BattPackV2
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055 import Max17055
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_lock import Max17055Lock
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_sim import Max17055Sim
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+TIMEOUT = 0.1                                           # seconds
+
+conf = BattPackV2.gauge_conf()
+sim = Max17055Sim(conf)
+
+reader = Max17055(conf, bus=sim, lock=Max17055Lock(name="Max17055Test"))
+writer = Max17055(conf, bus=sim, lock=Max17055Lock(name="Max17055Test"))
+
+print(reader.lock)
+print("-")
+
+# shared...
+reader.lock.acquire(False, TIMEOUT)
+
+try:
+    snapshot = writer.read_snapshot()                   # takes the lock shared
+    print("snapshot read while shared: %s" % (snapshot is not None))
+
+    try:
+        writer.lock.acquire(True, TIMEOUT)
+        writer.lock.release()
+        assert False, "exclusive acquired while shared"
+
+    except TimeoutError as ex:
+        print("exclusive while shared: %s" % ex)
+
+finally:
+    reader.lock.release()
+
+# exclusive...
+writer.lock.acquire(True, TIMEOUT)
+
+try:
+    try:
+        reader.lock.acquire(False, TIMEOUT)
+        reader.lock.release()
+        assert False, "shared acquired while exclusive"
+
+    except TimeoutError as ex:
+        print("shared while exclusive: %s" % ex)
+
+finally:
+    writer.lock.release()
+
+print("-")
+
+mode = stat.S_IMODE(os.stat(reader.lock.path).st_mode)
+
+print(reader.lock)
+print(writer.lock)
+print("mode: %o" % mode)
+
+assert mode & stat.S_IROTH, "lock file not readable by other users"
+assert writer.lock.contentions > 0 and reader.lock.contentions > 0
+
+print("OK")
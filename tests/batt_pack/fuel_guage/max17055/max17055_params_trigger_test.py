@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+the learned parameters fall due for saving when bit 6 of the Cycles register toggles, using the simulated gauge
+discharging in accelerated time
+"""
+
+import time
+
+from scs_psu.batt_pack.batt_pack_v2 import BattPackV2
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055 import Max17055
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_params_trigger import Max17055ParamsTrigger
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_sim import Max17055Sim
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+conf = BattPackV2.gauge_conf()
+
+sim = Max17055Sim(conf, soc=100.0, current=-5000, time_scale=3600.0)
+batt_pack = BattPackV2(Max17055(conf, cache_ttls={}, bus=sim))         # Cycles is otherwise cached
+
+trigger = Max17055ParamsTrigger(None)                   # no save interval: Cycles only
+print(trigger)
+
+cycles = batt_pack.cycles
+assert trigger.is_due(cycles, None), "not due when first consulted"
+
+trigger.saved(cycles, None)
+print("saved at cycles: 0x%04x" % cycles)
+
+checks = 0
+
+while True:
+    time.sleep(0.005)
+    cycles = batt_pack.cycles
+    checks += 1
+
+    if cycles & 0x0040:
+        break
+
+    assert not trigger.is_due(cycles, None), "due at cycles: 0x%04x" % cycles
+
+print("bit 6 set at cycles: 0x%04x after %d checks" % (cycles, checks))
+print("-")
+
+assert trigger.is_due(cycles, None), "not due at cycles: 0x%04x" % cycles
+
+trigger.saved(cycles, None)
+assert not trigger.is_due(cycles, None), "due again without a change"
+
+print(trigger)
+print("OK")
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+sample() reads the telemetry registers in block transfers, and agrees with the single-register reads, using the
+simulated gauge
+"""
+
+from scs_psu.batt_pack.batt_pack_v2 import BattPackV2
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055 import Max17055
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_sim import Max17055Sim
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+conf = BattPackV2.gauge_conf()
+
+sim = Max17055Sim(conf, soc=60.0, current=-500, time_scale=0.0)          # time stands still
+gauge = Max17055(conf, bus=sim)
+
+start_transactions = sim.transactions
+sample = gauge.sample()
+sample_transactions = sim.transactions - start_transactions
+
+print(sample)
+print("sample transactions: %d" % sample_transactions)
+
+start_transactions = sim.transactions
+
+charge = gauge.read_charge_percent()
+mah = gauge.read_charge_mah()
+voltage = gauge.read_voltage()
+current = gauge.read_current_avg()
+
+single_transactions = sim.transactions - start_transactions
+
+print("single-register transactions: %d" % single_transactions)
+print("-")
+
+assert sample_transactions < single_transactions, (sample_transactions, single_transactions)
+
+assert sample.charge.percent == charge, (sample.charge.percent, charge)
+assert sample.charge.mah == mah, (sample.charge.mah, mah)
+assert sample.v == voltage, (sample.v, voltage)
+assert sample.current == current, (sample.current, current)
+assert sample.input_power_present is False
+
+print("OK")
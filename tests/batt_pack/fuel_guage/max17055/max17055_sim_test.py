@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+hardware-free benchmark of the Max17055 driver, using the simulated gauge
+"""
+
+import time
+
+from scs_psu.batt_pack.batt_pack_v2 import BattPackV2
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055 import Max17055
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_sim import Max17055Sim
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+ITERATIONS = 100
+
+conf = BattPackV2.gauge_conf()
+
+sim = Max17055Sim(conf, soc=60.0, current=-500, tx_latency=0.0002, byte_time=0.00009, time_scale=60.0)
+print(sim)
+print("-")
+
+gauge = Max17055(conf, bus=sim)
+print(gauge)
+print("-")
+
+loaded = gauge.initialise(force_config=True)
+gauge.write_params(BattPackV2.default_params())
+gauge.clear_power_on_reset()
+
+print("conf loaded: %s por: %s" % (loaded, gauge.read_power_on_reset()))
+print("step timings: %s" % dict(gauge.step_timings))
+print("-")
+
+start_time = time.time()
+start_transactions = sim.transactions
+
+for _ in range(ITERATIONS):
+    gauge.sample()
+
+elapsed = time.time() - start_time
+transactions = sim.transactions - start_transactions
+
+print("sample: %0.3f ms, %0.1f transactions" % (elapsed * 1000 / ITERATIONS, transactions / ITERATIONS))
+print(gauge.sample())
+print("-")
+
+start_time = time.time()
+start_transactions = sim.transactions
+
+for _ in range(ITERATIONS):
+    gauge.read_learned_params()
+
+elapsed = time.time() - start_time
+transactions = sim.transactions - start_transactions
+
+print("read_learned_params: %0.3f ms, %0.1f transactions" % (elapsed * 1000 / ITERATIONS, transactions / ITERATIONS))
+print(gauge.read_learned_params())
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+snapshot, JSON and binary round trips, using the simulated gauge
+"""
+
+import json
+
+from scs_core.data.json import JSONify
+
+from scs_psu.batt_pack.batt_pack_v2 import BattPackV2
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055 import Max17055
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_sim import Max17055Sim
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_snapshot import Max17055Snapshot
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+conf = BattPackV2.gauge_conf()
+
+sim = Max17055Sim(conf)
+gauge = Max17055(conf, bus=sim)
+
+snapshot = gauge.read_snapshot()
+print(snapshot)
+print("transactions: %s" % sim.transactions)
+print("-")
+
+jstr = JSONify.dumps(snapshot)
+print(jstr)
+print("json equal: %s" % (Max17055Snapshot.construct_from_jdict(json.loads(jstr)) == snapshot))
+print("-")
+
+encoded = snapshot.as_bytes()
+print("bytes: %d" % len(encoded))
+print("binary equal: %s" % (Max17055Snapshot.construct_from_bytes(encoded) == snapshot))
+print("-")
+
+gauge.write_params(BattPackV2.default_params())
+print("changed: %s" % ["0x%02x" % reg for reg in gauge.read_snapshot().diff(snapshot)])
+
+gauge.write_snapshot(snapshot)
+print("restored: %s" % ["0x%02x" % reg for reg in gauge.read_snapshot().diff(snapshot)])
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+the gauge's telemetry follows changes in load and temperature, and reset_extremes restarts the extremes, using the
+simulated gauge
+"""
+
+from scs_core.data.json import JSONify
+
+from scs_psu.batt_pack.batt_pack_v2 import BattPackV2
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055 import Max17055
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_sim import Max17055Sim
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+conf = BattPackV2.gauge_conf()
+
+sim = Max17055Sim(conf, soc=60.0, current=-100, temperature=20.0)
+gauge = Max17055(conf, cache_ttls={}, bus=sim)
+batt_pack = BattPackV2(gauge)
+
+light = batt_pack.telemetry()
+print("light: %s" % JSONify.dumps(light))
+
+# heavier and warmer...
+sim.set_current(-800)
+sim.set_temperature(35.0)
+
+heavy = batt_pack.telemetry()
+print("heavy: %s" % JSONify.dumps(heavy))
+print("-")
+
+assert light.power < 0 and heavy.power < light.power, (light.power, heavy.power)
+assert heavy.die_temperature > light.die_temperature, (light.die_temperature, heavy.die_temperature)
+
+assert heavy.temperature.minimum <= 20 and heavy.temperature.maximum >= 35, heavy.temperature
+assert heavy.current.minimum < light.current.minimum, (light.current, heavy.current)
+assert heavy.current.maximum >= light.current.minimum, heavy.current
+
+# lighter and cooler, then reset...
+sim.set_current(-100)
+sim.set_temperature(25.0)
+
+batt_pack.telemetry(reset_extremes=True)
+
+reset = batt_pack.telemetry()
+print("after reset: %s" % JSONify.dumps(reset))
+print("-")
+
+assert reset.temperature.minimum == reset.temperature.maximum == 25, reset.temperature
+assert reset.current.minimum == reset.current.maximum == light.current.minimum, reset.current
+
+print("OK")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+all I2C traffic of a PSU and its battery pack passes through the injected bus - here, a recording proxy for the
+simulated fuel gauge
+"""
+
+from collections import Counter
+
+from scs_psu.batt_pack.batt_pack_v2 import BattPackV2
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_sim import Max17055Sim
+from scs_psu.bus.i2c_bus import I2CBus
+from scs_psu.psu.mobile_v2.psu_mobile_v2 import PSUMobileV2
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RecordingI2CBus(I2CBus):
+    """
+    records the operations of the bus that it wraps
+    """
+
+    def __init__(self, bus):
+        self.__bus = bus
+        self.operations = Counter()
+        self.addrs = set()
+
+
+    def open(self):
+        self.operations['open'] += 1
+        self.__bus.open()
+
+
+    def close(self):
+        self.operations['close'] += 1
+        self.__bus.close()
+
+
+    def start_tx(self, addr):
+        self.operations['start_tx'] += 1
+        self.addrs.add(addr)
+        self.__bus.start_tx(addr)
+
+
+    def end_tx(self):
+        self.operations['end_tx'] += 1
+        self.__bus.end_tx()
+
+
+    def read(self, count):
+        self.operations['read'] += 1
+        return self.__bus.read(count)
+
+
+    def read_cmd(self, cmd, count):
+        self.operations['read_cmd'] += 1
+        return self.__bus.read_cmd(cmd, count)
+
+
+    def write_addr(self, addr, *values):
+        self.operations['write_addr'] += 1
+        self.__bus.write_addr(addr, *values)
+
+
+class SimController(object):
+    """
+    the PSU controller, without the MCU
+    """
+
+    @staticmethod
+    def button_enable():
+        pass
+
+
+    @staticmethod
+    def button_pressed():
+        return False
+
+
+    @staticmethod
+    def read_batt_v():
+        return 7.4
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+conf = BattPackV2.gauge_conf()
+
+sim = Max17055Sim(conf, soc=60.0, current=-500)
+bus = RecordingI2CBus(sim)
+
+psu = PSUMobileV2(SimController(), BattPackV2.construct(bus=bus), bus=bus)
+
+psu.open()
+
+try:
+    status = psu.status()
+    print(status)
+
+finally:
+    psu.close()
+
+print("operations: %s" % dict(bus.operations))
+print("addrs: %s" % ["0x%02x" % addr for addr in bus.addrs])
+print("sim transactions: %s" % sim.transactions)
+print("-")
+
+assert not status.is_null_datum()
+assert status.charge_status is not None, "no battery pack sample"
+
+assert bus.operations['open'] == 1 and bus.operations['close'] == 1, bus.operations
+assert bus.operations['start_tx'] == bus.operations['end_tx'] == sim.transactions > 0, bus.operations
+assert bus.addrs == {Max17055Sim.ADDR}, bus.addrs
+
+print("OK")
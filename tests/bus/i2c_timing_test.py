@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+the Max17055 timing policy: back-to-back transactions are spaced by the bus free time only, and each verify read
+waits for the write settle time, using a timestamping proxy for the simulated gauge
+"""
+
+import time
+
+from scs_psu.batt_pack.batt_pack_v2 import BattPackV2
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055 import Max17055
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_sim import Max17055Sim
+from scs_psu.bus.i2c_bus import I2CBus
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TimestampingI2CBus(I2CBus):
+    """
+    records the time of each operation of the bus that it wraps
+    """
+
+    def __init__(self, bus):
+        self.__bus = bus
+        self.events = []                                # list of (monotonic, operation, cmd)
+
+
+    def open(self):
+        self.__bus.open()
+
+
+    def close(self):
+        self.__bus.close()
+
+
+    def start_tx(self, addr):
+        self.__bus.start_tx(addr)
+
+
+    def end_tx(self):
+        self.__bus.end_tx()
+
+
+    def read(self, count):
+        return self.__bus.read(count)
+
+
+    def read_cmd(self, cmd, count):
+        self.events.append((time.monotonic(), 'read', cmd))
+        return self.__bus.read_cmd(cmd, count)
+
+
+    def write_addr(self, addr, *values):
+        self.events.append((time.monotonic(), 'write', addr))
+        self.__bus.write_addr(addr, *values)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+conf = BattPackV2.gauge_conf()
+
+bus = TimestampingI2CBus(Max17055Sim(conf, soc=60.0, current=-500))
+gauge = Max17055(conf, bus=bus)
+print(gauge.timing)
+
+# reads: no fixed sleeps...
+start_time = time.monotonic()
+
+for _ in range(10):
+    gauge.sample()
+
+elapsed = (time.monotonic() - start_time) / 10
+
+print("sample: %0.3f ms" % (elapsed * 1000))
+assert elapsed < 0.005, elapsed
+
+# write and verify: settled...
+bus.events.clear()
+gauge.write_params(BattPackV2.default_params())
+
+settles = [later[0] - earlier[0] for earlier, later in zip(bus.events, bus.events[1:])
+           if earlier[1] == 'write' and later[1] == 'read' and earlier[2] == later[2]]
+
+print("verify reads: %d, shortest settle: %0.3f ms" % (len(settles), min(settles) * 1000))
+print(gauge.timing)
+print("-")
+
+assert len(settles) > 0
+assert min(settles) >= 0.001, min(settles)
+
+print("OK")
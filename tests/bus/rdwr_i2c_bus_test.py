@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+compares the host I2C bus with the I2C_RDWR bus, reading the MAX17055 learned parameters with the cache disabled
+"""
+
+import time
+
+from scs_psu.batt_pack.batt_pack_v2 import BattPackV2
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055 import Max17055
+
+from scs_psu.bus.i2c_bus import HostI2CBus
+from scs_psu.bus.rdwr_i2c_bus import RdwrI2CBus
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+ITERATIONS = 100
+
+conf = BattPackV2.gauge_conf()
+
+for bus in (HostI2CBus(), RdwrI2CBus(1)):
+    print(bus)
+
+    gauge = Max17055(conf, cache_ttls={}, bus=bus)
+
+    try:
+        bus.open()
+
+        start_time = time.time()
+
+        for _ in range(ITERATIONS):
+            gauge.read_learned_params()
+
+        elapsed = time.time() - start_time
+
+        print("read_learned_params: %0.3f ms" % (elapsed * 1000 / ITERATIONS))
+        print(gauge.read_learned_params())
+        print(bus)
+        print("-")
+
+    finally:
+        bus.close()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+runs the AsyncPSUMonitor alongside a concurrent task, printing status reports from the async iterator
+"""
+
+import asyncio
+
+from scs_core.data.json import JSONify
+
+from scs_dfe.interface.interface_conf import InterfaceConf
+
+from scs_host.sys.host import Host
+
+from scs_psu.psu.async_psu_monitor import AsyncPSUMonitor
+from scs_psu.psu.psu_conf import PSUConf
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+REPORTS = 5
+
+
+async def ticker():
+    ticks = 0
+
+    while True:
+        await asyncio.sleep(0.1)                        # the event loop is not blocked by PSU calls
+        ticks += 1
+
+        if ticks % 10 == 0:
+            print("ticks: %d" % ticks)
+
+
+async def main(psu):
+    monitor = AsyncPSUMonitor(psu)
+    print(monitor)
+    print("-")
+
+    await monitor.start()
+    ticker_task = asyncio.create_task(ticker())
+
+    try:
+        version = await monitor.version()
+        print("version: %s" % JSONify.dumps(version))
+        print("-")
+
+        count = 0
+
+        async for status in monitor.statuses():
+            print("status: %s" % JSONify.dumps(status))
+            print("interval: %s" % monitor.schedule.interval)
+
+            count += 1
+
+            if count == REPORTS:
+                break
+
+    finally:
+        ticker_task.cancel()
+        await monitor.stop()
+
+    print("-")
+    print(monitor)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+interface_conf = InterfaceConf.load(Host)
+psu_conf = PSUConf.load(Host)
+
+asyncio.run(main(psu_conf.psu(Host, interface_conf.model)))
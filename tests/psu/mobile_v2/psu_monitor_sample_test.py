@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+PSUMonitor.sample() returns the same decoded report until the monitor publishes a new one, using a PSUMobileV2 with
+a simulated fuel gauge
+"""
+
+import time
+
+from scs_host.sys.host import Host
+
+from scs_psu.batt_pack.batt_pack_v2 import BattPackV2
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055 import Max17055
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_sim import Max17055Sim
+
+from scs_psu.psu.mobile_v2.psu_mobile_v2 import PSUMobileV2
+from scs_psu.psu.psu_monitor import PSUMonitor
+from scs_psu.psu.psu_monitor_schedule import PSUMonitorSchedule
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimController(object):
+    """
+    the PSU controller, without the MCU
+    """
+
+    @staticmethod
+    def button_enable():
+        pass
+
+
+    @staticmethod
+    def button_pressed():
+        return False
+
+
+    @staticmethod
+    def read_batt_v():
+        return 7.4
+
+
+    @staticmethod
+    def version_ident():
+        return "SimController"
+
+
+    @staticmethod
+    def version_tag():
+        return "0.0.0"
+
+
+    @staticmethod
+    def host_shutdown_initiated():
+        return None
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+conf = BattPackV2.gauge_conf()
+
+sim = Max17055Sim(conf, soc=60.0, current=-500)
+psu = PSUMobileV2(SimController(), BattPackV2(Max17055(conf, bus=sim)), bus=sim)
+
+monitor = PSUMonitor(Host, psu, ignore_standby=True, ignore_threshold=True,
+                     schedule=PSUMonitorSchedule(floor=0.2, ceiling=0.5))
+print(monitor)
+print("-")
+
+monitor.start()
+
+try:
+    time.sleep(1.0)
+
+    sample = monitor.sample()
+    print("sample: %s" % sample)
+
+    assert sample is not None, "no report"
+    assert monitor.sample() is sample, "report decoded again without a new report"
+
+    generation = monitor._value.generation
+
+    while monitor._value.generation == generation:
+        time.sleep(0.05)
+
+    print("sample: %s" % monitor.sample())
+
+    assert monitor.sample() is not sample, "new report not decoded"
+
+finally:
+    monitor.stop()
+
+print("OK")
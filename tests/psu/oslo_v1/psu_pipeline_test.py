@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+pipelined commands are answered in order, at the cost of a single turnaround, using a simulated UART
+"""
+
+import json
+import os
+import time
+
+from scs_psu.psu.host_serial_sim import HostSerialSim
+from scs_psu.psu.oslo_v1.psu_oslo_v1 import PSUOsloV1
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+RESPONSE_TIME = 0.1                                     # seconds
+
+filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'psu_status_frames.json')
+
+with open(filename) as f:
+    frames = json.load(f)
+
+responses = {
+    'state': frames[0]['json'],
+    'version': '{"id": "South Coast Science PSU Oslo", "tag": "1.2.3"}',
+    'uptime': '{"uptime": "00-00:01:00.000"}',
+    'w-touch': '{"w-touch": "OK"}'
+}
+
+serial = HostSerialSim(responses, response_time=RESPONSE_TIME)
+
+psu = PSUOsloV1(None)
+psu._serial = serial
+
+commands = ('version', 'uptime', 'w-touch')
+
+# one at a time...
+start_time = time.time()
+sequential = [psu.communicate(command) for command in commands]
+sequential_elapsed = time.time() - start_time
+
+print("sequential: %0.3f s" % sequential_elapsed)
+
+# pipelined...
+start_time = time.time()
+pipelined = psu.communicate_all(commands)
+pipelined_elapsed = time.time() - start_time
+
+print("pipelined: %0.3f s" % pipelined_elapsed)
+print("-")
+
+assert pipelined == sequential == [responses[command] for command in commands], pipelined
+assert pipelined_elapsed < 2 * RESPONSE_TIME <= sequential_elapsed, (pipelined_elapsed, sequential_elapsed)
+
+# status with commands...
+status, others = psu.status_with(('w-touch', ))
+print("status_with: %s %s" % (status, others))
+
+assert not status.is_null_datum()
+assert others == [responses['w-touch']], others
+
+# after an unanswered command, no response can be attributed...
+serial.set_response('uptime', None)
+
+responses = psu.communicate_all(commands)
+print("unanswered: %s" % responses)
+
+assert responses == [None, None, None], responses
+
+print("OK")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+a persistent session holds the UART open across commands, using a simulated UART
+"""
+
+import json
+import os
+
+from scs_psu.psu.host_serial_sim import HostSerialSim
+from scs_psu.psu.oslo_v1.psu_oslo_v1 import PSUOsloV1
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+COMMANDS = 5
+
+filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'psu_status_frames.json')
+
+with open(filename) as f:
+    frames = json.load(f)
+
+serial = HostSerialSim({'state': frames[0]['json']}, response_time=0.01)
+
+psu = PSUOsloV1(None)
+psu._serial = serial
+
+# per-command...
+for _ in range(COMMANDS):
+    assert not psu.status().is_null_datum()
+
+print("per-command: %s" % serial)
+assert serial.opens == COMMANDS, serial.opens
+assert not serial.is_open
+
+# session...
+opens = serial.opens
+psu.open_session()
+
+for _ in range(COMMANDS):
+    assert not psu.status().is_null_datum()
+
+print("session: %s" % serial)
+assert serial.opens == opens + 1, serial.opens
+assert serial.is_open
+
+# a lost response closes the UART, which is re-opened on next use...
+serial.set_response('state', None)
+assert psu.status().is_null_datum()
+assert not serial.is_open
+
+serial.set_response('state', frames[0]['json'])
+assert not psu.status().is_null_datum()
+
+print("after lost response: %s" % serial)
+assert serial.opens == opens + 2, serial.opens
+
+psu.close_session()
+assert not serial.is_open
+
+print("OK")
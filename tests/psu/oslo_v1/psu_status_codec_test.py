@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+golden-file test: the compact frames must decode to the same PSUStatus as the JSON frame
+"""
+
+import json
+import os
+
+from scs_core.data.json import JSONify
+
+from scs_psu.psu.oslo_v1.psu_oslo_v1 import PSUOsloV1
+from scs_psu.psu.oslo_v1.psu_status import PSUStatus
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'psu_status_frames.json')
+
+with open(filename) as f:
+    frames = json.load(f)
+
+codecs = {codec.name(): codec for codec in PSUOsloV1.status_codecs()}
+
+for codec in codecs.values():
+    print(codec)
+print("-")
+
+for frame in frames:
+    expected = PSUStatus.construct_from_jdict(codecs['json'].decode(frame['json']))
+    expected_jstr = JSONify.dumps(expected)
+    print(expected_jstr)
+
+    for name in ('csv', 'bin'):
+        status = PSUStatus.construct_from_jdict(codecs[name].decode(frame[name]))
+        jstr = JSONify.dumps(status)
+        print("%4s: %s" % (name, frame[name]))
+
+        assert jstr == expected_jstr, "%s: %s" % (name, jstr)
+        assert codecs[name].encode(codecs['json'].decode(frame['json'])) == frame[name], name
+
+    print("-")
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# negotiation falls back to JSON on firmware without compact frames...
+
+class JSONOnlyOsloV1(PSUOsloV1):
+    def communicate(self, command):
+        return frames[0]['json'] if command == 'state' else None            # compact frame commands time out
+
+
+for codec in codecs.values():
+    try:
+        codec.decode(None)
+        assert False, "%s: decode(None) did not raise" % codec.name()
+
+    except TypeError:
+        pass
+
+negotiated = JSONOnlyOsloV1(None).negotiate_codec()
+print("negotiated: %s" % negotiated)
+
+assert negotiated.name() == 'json', negotiated.name()
+
+print("OK")
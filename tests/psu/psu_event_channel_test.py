@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+the PSUEventChannel directory and socket permissions, publish and receive, and the INPUT event published by a
+PSUMonitor when input power is gained, using a PSUMobileV2 with a simulated fuel gauge
+"""
+
+import os
+import stat
+import tempfile
+import time
+
+from scs_host.sys.host import Host
+
+from scs_psu.batt_pack.batt_pack_v2 import BattPackV2
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055 import Max17055
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_sim import Max17055Sim
+
+from scs_psu.psu.mobile_v2.psu_mobile_v2 import PSUMobileV2
+from scs_psu.psu.psu_event import PSUEvent
+from scs_psu.psu.psu_event_channel import PSUEventChannel
+from scs_psu.psu.psu_monitor import PSUMonitor
+from scs_psu.psu.psu_monitor_schedule import PSUMonitorSchedule
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimController(object):
+    """
+    the PSU controller, without the MCU
+    """
+
+    @staticmethod
+    def button_enable():
+        pass
+
+
+    @staticmethod
+    def button_pressed():
+        return False
+
+
+    @staticmethod
+    def read_batt_v():
+        return 7.4
+
+
+    @staticmethod
+    def version_ident():
+        return "SimController"
+
+
+    @staticmethod
+    def version_tag():
+        return "0.0.0"
+
+
+    @staticmethod
+    def host_shutdown_initiated():
+        return None
+
+
+class PlugInSim(Max17055Sim):
+    """
+    a simulated fuel gauge, whose input power is connected at a given time - the PSUMonitor samples the gauge in its
+    own process, so that the load cannot be changed from this one
+    """
+
+    def __init__(self, conf, plug_in_time, **kwargs):
+        super().__init__(conf, **kwargs)
+
+        self.__plug_in_time = plug_in_time                  # monotonic
+
+
+    def start_tx(self, addr):
+        if self.__plug_in_time is not None and time.monotonic() >= self.__plug_in_time:
+            self.__plug_in_time = None
+            self.set_current(500)
+
+        super().start_tx(addr)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+with tempfile.TemporaryDirectory() as root:
+    # channel...
+    channel = PSUEventChannel(os.path.join(root, 'events'))
+    print(channel)
+
+    subscriber = channel.subscribe()
+    publisher = channel.publisher()
+
+    directory_mode = stat.S_IMODE(os.stat(channel.directory).st_mode)
+    socket_mode = stat.S_IMODE(os.stat(subscriber.path).st_mode)
+    print("directory: %o socket: %o" % (directory_mode, socket_mode))
+
+    assert directory_mode == 0o2770, "%o" % directory_mode
+    assert socket_mode == PSUEventChannel.socket_mode(), "%o" % socket_mode
+
+    publisher.publish(PSUEvent(PSUEvent.SHUTDOWN, True))
+    event = subscriber.receive(timeout=1.0)
+    print("received: %s" % event)
+
+    assert event == PSUEvent(PSUEvent.SHUTDOWN, True), event
+    assert subscriber.receive(timeout=0.1) is None, "unexpected event"
+
+    subscriber.close()
+    publisher.close()
+
+    # an open directory...
+    exposed = os.path.join(root, 'exposed')
+    os.mkdir(exposed)
+    os.chmod(exposed, 0o1777)
+
+    try:
+        PSUEventChannel(exposed).subscribe()
+        assert False, "world-accessible directory accepted"
+
+    except PermissionError as ex:
+        print("rejected: %s" % ex)
+
+    print("-")
+
+    # monitor...
+    conf = BattPackV2.gauge_conf()
+
+    sim = PlugInSim(conf, time.monotonic() + 2.0, soc=60.0, current=-500)
+    psu = PSUMobileV2(SimController(), BattPackV2(Max17055(conf, bus=sim)), bus=sim)
+
+    monitor = PSUMonitor(Host, psu, ignore_standby=True, ignore_threshold=True,
+                         schedule=PSUMonitorSchedule(floor=0.2, ceiling=0.5), events=channel)
+
+    monitor.start()
+
+    try:
+        subscriber = monitor.subscribe()
+
+        try:
+            event = subscriber.receive(timeout=5.0)
+            print("received: %s" % event)
+
+            assert event == PSUEvent(PSUEvent.INPUT, True), event
+
+        finally:
+            subscriber.close()
+
+    finally:
+        monitor.stop()
+
+print("OK")
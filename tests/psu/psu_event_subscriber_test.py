@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+subscribes to the PSU events published by a running PSUMonitor, printing each event as it arrives
+"""
+
+import sys
+
+from scs_core.data.json import JSONify
+
+from scs_psu.psu.psu_event_channel import PSUEventChannel
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+channel = PSUEventChannel()
+print(channel)
+
+subscriber = channel.subscribe()
+print(subscriber)
+
+try:
+    while True:
+        event = subscriber.receive()
+        print(JSONify.dumps(event))
+        sys.stdout.flush()
+
+except KeyboardInterrupt:
+    print()
+
+finally:
+    subscriber.close()
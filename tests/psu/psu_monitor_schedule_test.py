@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+the PSUMonitorSchedule interval on mains, on battery near and far from the shutdown threshold, and following a
+transition, using a PSUMobileV2 with a simulated fuel gauge
+"""
+
+import time
+
+from scs_psu.batt_pack.batt_pack_v2 import BattPackV2
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055 import Max17055
+from scs_psu.batt_pack.fuel_gauge.max17055.max17055_sim import Max17055Sim
+
+from scs_psu.psu.mobile_v2.psu_mobile_v2 import PSUMobileV2
+from scs_psu.psu.psu_monitor_schedule import PSUMonitorSchedule
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimController(object):
+    """
+    the PSU controller, without the MCU
+    """
+
+    @staticmethod
+    def button_enable():
+        pass
+
+
+    @staticmethod
+    def button_pressed():
+        return False
+
+
+    @staticmethod
+    def read_batt_v():
+        return 7.4
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def update():
+    time.sleep(batt_pack.update_period())                   # the batt pack holds its sample until the gauge updates
+    status = psu.status()
+
+    return schedule.update(status, psu.charge_min(), update_period=batt_pack.update_period())
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+conf = BattPackV2.gauge_conf()
+
+sim = Max17055Sim(conf, soc=60.0, current=-500, time_scale=0)
+batt_pack = BattPackV2(Max17055(conf, bus=sim))
+psu = PSUMobileV2(SimController(), batt_pack, bus=sim)
+
+schedule = PSUMonitorSchedule(floor=0.5, ceiling=30.0, mains_interval=60.0)
+print(schedule)
+print("-")
+
+# on battery, far from and near to the threshold...
+far = update()
+print("60%%: %s" % far)
+
+sim.power_on_reset(2.0)
+near = update()
+print("2%%: %s" % near)
+
+sim.power_on_reset(1.0)
+at = update()
+print("1%%: %s" % at)
+print("-")
+
+assert far == schedule.ceiling, far
+assert schedule.floor < near < far, near
+assert at == max(schedule.floor, batt_pack.update_period()), at
+
+# input power gained...
+sim.set_current(500)
+
+intervals = [update() for _ in range(PSUMonitorSchedule.TRANSITION_SAMPLES + 1)]
+print("on mains: %s" % intervals)
+print("-")
+
+assert intervals[:-1] == [schedule.floor] * PSUMonitorSchedule.TRANSITION_SAMPLES, intervals
+assert intervals[-1] == schedule.mains_interval, intervals
+
+# watchdog...
+schedule = PSUMonitorSchedule(watchdog_interval=8)
+print(schedule)
+
+assert schedule.mains_interval < schedule.watchdog_interval, schedule
+
+try:
+    PSUMonitorSchedule(mains_interval=10, watchdog_interval=8)
+    assert False, "mains interval longer than the watchdog interval accepted"
+
+except ValueError as ex:
+    print("rejected: %s" % ex)
+
+print("OK")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: agent (agent@local)
+
+measures the request throughput of a PSUStatusServer with 50 simultaneous client processes - the server answers
+from a fixed report, as a PSUMonitor answers from its cached state
+"""
+
+import os
+import tempfile
+import time
+
+from collections import OrderedDict
+from multiprocessing import Pool
+
+from scs_psu.psu.psu_status_client import PSUStatusClient
+from scs_psu.psu.psu_status_server import PSUStatusServer
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+CLIENTS = 50
+REQUESTS = 1000
+
+PATH = os.path.join(tempfile.gettempdir(), "scs-psu-benchmark.sock")
+
+STATUS = OrderedDict((('standby', False), ('in', True), ('pwr-in', 12.4),
+                      ('batt', OrderedDict((('chg', 99), ('tte', None), ('ttf', None))))))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def handler(command, _args):
+    if command == 'status':
+        return STATUS
+
+    raise ValueError("unknown command: %s" % command)
+
+
+def client_requests(_index):
+    client = PSUStatusClient(path=PATH)
+    latencies = []
+
+    try:
+        for _ in range(REQUESTS):
+            start_time = time.perf_counter()
+            client.status()
+            latencies.append(time.perf_counter() - start_time)
+
+    finally:
+        client.close()
+
+    return latencies
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+server = PSUStatusServer(handler, path=PATH)
+server.start()
+server.wait_until_listening(5.0)
+
+print(server)
+
+with Pool(CLIENTS) as pool:
+    start = time.perf_counter()
+    results = pool.map(client_requests, range(CLIENTS))
+    elapsed = time.perf_counter() - start
+
+latencies = sorted(latency for result in results for latency in result)
+
+print("clients: %d requests: %d elapsed: %0.3f s" % (CLIENTS, len(latencies), elapsed))
+print("throughput: %0.0f requests / s" % (len(latencies) / elapsed))
+print("latency: median: %0.3f ms p99: %0.3f ms" %
+      (latencies[len(latencies) // 2] * 1000, latencies[int(len(latencies) * 0.99)] * 1000))
+
+print(server)
+
+server.stop(timeout=5.0)